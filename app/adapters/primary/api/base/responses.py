@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class SerializedPageResponse(ORJSONResponse):
+    """
+    Response with the page of json-serializable maps encoded straight to json bytes.
+    The page already encoded to json bytes, such as the cached one, is sent as it is.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+
+        return orjson.dumps(content, option=JSON_OPTIONS)
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    Response that sends json-serializable maps as newline-delimited json
+    while they are produced.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(self, content: AsyncIterable[Any], *args, **kwargs):
+        super().__init__(self.encode(content=content), *args, **kwargs)
+
+    @staticmethod
+    async def encode(content: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+        """
+        Encode each item of the content to a line of json.
+
+        :return: iterator of lines.
+        """
+
+        async for item in content:
+            yield orjson.dumps(item, option=JSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
@@ -18,6 +18,7 @@ from app.core.domain.bookings.exceptions import (
 )
 
 from app.core.services.base.exceptions import BaseServiceError
+from app.core.services.bookings.exceptions import RoomAlreadyBookedError as RoomAlreadyBookedServiceError
 from app.core.services.check.exceptions import BaseCheckServiceError
 from app.core.services.authorization.exceptions import IncorrectPasswordError
 from app.core.services.resource_manager.exceptions import EntityNotExistsError
@@ -171,6 +172,16 @@ def registering_exception_handlers(app: FastAPI):
             },
         )
 
+    @app.exception_handler(RoomAlreadyBookedServiceError)
+    async def _(request: Request, exc: RoomAlreadyBookedServiceError):
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={
+                "detail": exc.message,
+                "extras": exc.extras,
+            },
+        )
+
     @app.exception_handler(BaseServiceError)
     async def _(request: Request, exc: BaseServiceError):
         return JSONResponse(
@@ -4,6 +4,8 @@ from loguru import logger
 
 from app.settings import settings
 
+from app.utils.redis.redis_controller import redis_controller
+
 
 def registering_middlewares(app: FastAPI):
     """
@@ -28,3 +30,21 @@ def registering_middlewares(app: FastAPI):
             )
 
         return response
+
+    if settings.NEED_TO_WARM_UP_CACHE:
+
+        @app.middleware("http")
+        async def record_hot_params(request: Request, call_next) -> Response:
+            """
+            Record query parameters of successful requests to handlers with warm-up.
+            """
+
+            response = await call_next(request)
+
+            if request.method == "GET" and response.status_code == 200:
+                await redis_controller.record_hot_params(
+                    endpoint=request.scope.get("endpoint"),
+                    query_params=request.query_params.multi_items(),
+                )
+
+            return response
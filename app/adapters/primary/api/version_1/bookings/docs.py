@@ -2,6 +2,7 @@ from enum import Enum
 
 from app.settings import settings
 
+from app.core.services.base.schemas import PageResponseSchema
 from app.core.services.bookings.schemas import (
     BookingResponseSchema,
     ServiceVarietyResponseSchema,
@@ -10,6 +11,7 @@ from app.core.services.bookings.schemas import (
     ExtendedRoomResponseSchema,
     HotelSchema,
     ExtendedBookingResponseSchema,
+    RoomAvailabilityResponseSchema,
     RoomSchema,
 )
 
@@ -49,24 +51,27 @@ class GettingHotelsEnum(Enum):
     Scheme of responses to a request for a selection of hotels.
     """
 
-    SUCCESS: list[ExtendedHotelResponseSchema] = [
-        ExtendedHotelResponseSchema(
-            id=1,
-            name="Cosmos Collection Altay Resort",
-            desc="Colorful description for hotel #1",
-            location="Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-            stars=3,
-            rooms_quantity=50,
-            services=[
-                ServiceVarietyResponseSchema(
-                    id=1,
-                    key="wifi",
-                    name="Free Wi-Fi",
-                    desc="Free Wi-Fi.",
-                ),
-            ],
-        ),
-    ]
+    SUCCESS: PageResponseSchema[ExtendedHotelResponseSchema] = PageResponseSchema[ExtendedHotelResponseSchema](
+        items=[
+            ExtendedHotelResponseSchema(
+                id=1,
+                name="Cosmos Collection Altay Resort",
+                desc="Colorful description for hotel #1",
+                location="Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                stars=3,
+                rooms_quantity=50,
+                services=[
+                    ServiceVarietyResponseSchema(
+                        id=1,
+                        key="wifi",
+                        name="Free Wi-Fi",
+                        desc="Free Wi-Fi.",
+                    ),
+                ],
+            ),
+        ],
+        next_cursor="eyJpZCI6IDF9",
+    )
     SERVER_ERR: BaseErrorResponseSchema = BaseErrorResponseSchema(
         detail="Unspecified error.",
         extras={
@@ -101,39 +106,42 @@ class GettingRoomsEnum(Enum):
     Scheme of responses to a request for a selection of rooms.
     """
 
-    SUCCESS: list[ExtendedRoomResponseSchema] = [
-        ExtendedRoomResponseSchema(
-            id=1,
-            name="Room #1 of hotel #1",
-            desc="Colorful description for room #1 of hotel #1.",
-            hotel_id=1,
-            premium_level_id=1,
-            ordinal_number=1,
-            maximum_persons=1,
-            price=24_500,
-            hotel=HotelSchema(
-                id=1,
-                name="Cosmos Collection Altay Resort",
-                desc="Colorful description for hotel #1",
-                location="Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                stars=3,
-            ),
-            premium_level=PremiumLevelVarietyResponseSchema(
+    SUCCESS: PageResponseSchema[ExtendedRoomResponseSchema] = PageResponseSchema[ExtendedRoomResponseSchema](
+        items=[
+            ExtendedRoomResponseSchema(
                 id=1,
-                key="budget",
-                name="Budget service",
-                desc="Minimum service for the level of the hotel to which the room belongs.",
-            ),
-            services=[
-                ServiceVarietyResponseSchema(
+                name="Room #1 of hotel #1",
+                desc="Colorful description for room #1 of hotel #1.",
+                hotel_id=1,
+                premium_level_id=1,
+                ordinal_number=1,
+                maximum_persons=1,
+                price=24_500,
+                hotel=HotelSchema(
                     id=1,
-                    key="wifi",
-                    name="Free Wi-Fi",
-                    desc="Free Wi-Fi.",
+                    name="Cosmos Collection Altay Resort",
+                    desc="Colorful description for hotel #1",
+                    location="Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                    stars=3,
                 ),
-            ],
-        )
-    ]
+                premium_level=PremiumLevelVarietyResponseSchema(
+                    id=1,
+                    key="budget",
+                    name="Budget service",
+                    desc="Minimum service for the level of the hotel to which the room belongs.",
+                ),
+                services=[
+                    ServiceVarietyResponseSchema(
+                        id=1,
+                        key="wifi",
+                        name="Free Wi-Fi",
+                        desc="Free Wi-Fi.",
+                    ),
+                ],
+            )
+        ],
+        next_cursor="eyJpZCI6IDF9",
+    )
     CONSISTENCY_ERR: BaseErrorResponseSchema = BaseErrorResponseSchema(
         detail="The minimum room price filter must be less than the maximum room price filter.",
         extras={
@@ -154,27 +162,30 @@ class GettingBookingsEnum(Enum):
     Scheme of responses to a request for a selection of bookings.
     """
 
-    SUCCESS: list[ExtendedBookingResponseSchema] = [
-        ExtendedBookingResponseSchema(
-            id=1,
-            user_id=1,
-            room_id=1,
-            number_of_persons=1,
-            check_in_dt="2024-07-02T14:00:00Z",
-            check_out_dt="2024-07-03T12:00:00Z",
-            total_cost=24_500,
-            room=RoomSchema(
+    SUCCESS: PageResponseSchema[ExtendedBookingResponseSchema] = PageResponseSchema[ExtendedBookingResponseSchema](
+        items=[
+            ExtendedBookingResponseSchema(
                 id=1,
-                name="Alien",
-                desc="Room in the style of the film of the same name.",
-                hotel_id=1,
-                premium_level_id=3,
-                ordinal_number=1,
-                maximum_persons=2,
-                price=24_500,
+                user_id=1,
+                room_id=1,
+                number_of_persons=1,
+                check_in_dt="2024-07-02T14:00:00Z",
+                check_out_dt="2024-07-03T12:00:00Z",
+                total_cost=24_500,
+                room=RoomSchema(
+                    id=1,
+                    name="Alien",
+                    desc="Room in the style of the film of the same name.",
+                    hotel_id=1,
+                    premium_level_id=3,
+                    ordinal_number=1,
+                    maximum_persons=2,
+                    price=24_500,
+                ),
             ),
-        ),
-    ]
+        ],
+        next_cursor="eyJpZCI6IDF9",
+    )
     CONSISTENCY_ERR: BaseErrorResponseSchema = BaseErrorResponseSchema(
         detail=f"The maximum date must be at least {settings.MIN_RENTAL_INTERVAL_HOURS} hours later "
         "than the minimum.",
@@ -191,6 +202,36 @@ class GettingBookingsEnum(Enum):
     )
 
 
+class GettingAvailabilityEnum(Enum):
+    """
+    Scheme of responses to a request for availability of rooms.
+    """
+
+    SUCCESS: list[RoomAvailabilityResponseSchema] = [
+        RoomAvailabilityResponseSchema(
+            room_id=1,
+            bitmap="101",
+        ),
+        RoomAvailabilityResponseSchema(
+            room_id=2,
+            bitmap="111",
+        ),
+    ]
+    CONSISTENCY_ERR: BaseErrorResponseSchema = BaseErrorResponseSchema(
+        detail="Check-out date must be later than check-in date.",
+        extras={
+            "check_in_date": "2024-07-29",
+            "check_out_date": "2024-07-28",
+        },
+    )
+    SERVER_ERR: BaseErrorResponseSchema = BaseErrorResponseSchema(
+        detail="Unspecified error.",
+        extras={
+            "doc": "Exception documentation.",
+        },
+    )
+
+
 class AddingBookingEnum(Enum):
     """
     Scheme of responses to a request to add booking.
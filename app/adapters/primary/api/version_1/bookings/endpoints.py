@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
 from fastapi import Depends
 from fastapi.routing import APIRouter
 from starlette import status
@@ -6,7 +9,9 @@ from app.settings import settings
 
 from app.ports.primary.bookings import BookingServicePort
 
+from app.core.services.base.schemas import PageResponseSchema
 from app.core.services.bookings.schemas import (
+    AvailabilityRequestSchema,
     BookingRequestSchema,
     BookingResponseSchema,
     ServiceVarietyResponseSchema,
@@ -14,15 +19,25 @@ from app.core.services.bookings.schemas import (
     PremiumLevelVarietyResponseSchema,
     ExtendedBookingResponseSchema,
     ExtendedRoomResponseSchema,
+    RoomAvailabilityResponseSchema,
 )
 from app.dependencies.check import (
     get_min_and_max_dts,
     get_only_for_hotels_and_only_for_rooms,
     get_min_price_and_max_price,
+    get_check_in_and_check_out,
+    get_pagination,
+)
+from app.core.services.check.schemas import (
+    HotelsOrRoomsValidator,
+    MinAndMaxDtsValidator,
+    PaginationValidator,
+    PriceRangeValidator,
+    StayPeriodValidator,
 )
-from app.core.services.check.schemas import HotelsOrRoomsValidator, MinAndMaxDtsValidator, PriceRangeValidator
 
 from app.dependencies.auth import get_user_id
+from app.adapters.primary.api.base.responses import NDJSONStreamingResponse, SerializedPageResponse
 from app.adapters.primary.api.version_1.bookings.types import (
     hotel_stars_annotated,
     service_ids_annotated,
@@ -31,9 +46,13 @@ from app.adapters.primary.api.version_1.bookings.types import (
 from app.adapters.primary.api.version_1.bookings.responses import (
     responses_of_getting_services,
     responses_of_getting_hotels,
+    responses_of_streaming_hotels,
     responses_of_getting_premium_levels,
     responses_of_getting_rooms,
+    responses_of_streaming_rooms,
     responses_of_getting_bookings,
+    responses_of_streaming_bookings,
+    responses_of_getting_availability,
     responses_of_adding_booking,
     responses_of_deleting_booking,
 )
@@ -54,16 +73,41 @@ router = APIRouter(prefix="/bookings")
 async def get_bookings(
     min_and_max_dts: MinAndMaxDtsValidator = Depends(get_min_and_max_dts),
     number_of_guests: int = None,
+    pagination: PaginationValidator = Depends(get_pagination),
     user_id: int = Depends(get_user_id),
     service: BookingServicePort = Depends(get_booking_service),
-) -> list[ExtendedBookingResponseSchema]:
-    bookings: list[ExtendedBookingResponseSchema] = await service.get_bookings(
+) -> PageResponseSchema[ExtendedBookingResponseSchema]:
+    bookings: dict[str, Any] = await service.get_bookings(
         user_id=user_id,
         min_and_max_dts=min_and_max_dts,
         number_of_guests=number_of_guests,
+        pagination=pagination,
+        serializable=True,
     )
 
-    return bookings
+    return SerializedPageResponse(content=bookings)
+
+
+@router.get(
+    path="/stream",
+    status_code=status.HTTP_200_OK,
+    response_class=NDJSONStreamingResponse,
+    responses=responses_of_streaming_bookings,
+    summary="Stream all user's bookings as newline-delimited json.",
+)
+async def stream_bookings(
+    min_and_max_dts: MinAndMaxDtsValidator = Depends(get_min_and_max_dts),
+    number_of_guests: int = None,
+    user_id: int = Depends(get_user_id),
+    service: BookingServicePort = Depends(get_booking_service),
+) -> NDJSONStreamingResponse:
+    bookings: AsyncIterator[dict[str, Any]] = service.stream_bookings(
+        user_id=user_id,
+        min_and_max_dts=min_and_max_dts,
+        number_of_guests=number_of_guests,
+    )
+
+    return NDJSONStreamingResponse(content=bookings)
 
 
 @router.post(
@@ -85,6 +129,23 @@ async def add_booking(
     return booking
 
 
+@router.post(
+    path="/availability",
+    status_code=status.HTTP_200_OK,
+    responses=responses_of_getting_availability,
+    summary="Get availability of rooms in each of stay periods.",
+)
+async def get_availability_of_rooms(
+    availability_data: AvailabilityRequestSchema,
+    service: BookingServicePort = Depends(get_booking_service),
+) -> list[RoomAvailabilityResponseSchema]:
+    availability_of_rooms: list[RoomAvailabilityResponseSchema] = await service.get_availability_of_rooms(
+        availability_data=availability_data,
+    )
+
+    return availability_of_rooms
+
+
 @router.delete(
     path="/{booking_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -110,6 +171,9 @@ async def delete_booking(
 )
 @redis_controller.cache(
     warming_up=True,
+    local_caching=True,
+    tags=("service_varieties", "hotels_services", "rooms_services"),
+    etag_tables=("service_varieties", "hotels_services", "rooms_services"),
     expire=settings.CACHE_RETENTION_TIME_SECONDS,
 )
 async def get_services(
@@ -126,28 +190,58 @@ async def get_services(
 @router.get(
     path="/hotels",
     status_code=status.HTTP_200_OK,
+    response_model=PageResponseSchema[ExtendedHotelResponseSchema],
     responses=responses_of_getting_hotels,
     summary="Get a list of hotels in accordance with filters.",
 )
 @redis_controller.cache(
     warming_up=True,
+    tags=("hotels", "images", "hotels_services", "service_varieties", "rooms"),
+    stale_while_revalidate=settings.CACHE_STALE_WHILE_REVALIDATE_SECONDS,
     expire=settings.CACHE_RETENTION_TIME_SECONDS,
 )
 async def get_hotels(
+    location: str = None,
+    number_of_guests: int = None,
+    stars: hotel_stars_annotated = None,  # type: ignore
+    services: service_ids_annotated = None,  # type: ignore
+    pagination: PaginationValidator = Depends(get_pagination),
+    service: BookingServicePort = Depends(get_booking_service),
+) -> SerializedPageResponse:
+    hotels: dict[str, Any] = await service.get_hotels(
+        location=location,
+        number_of_guests=number_of_guests,
+        stars=stars,
+        services=services,
+        pagination=pagination,
+        serializable=True,
+    )
+
+    return SerializedPageResponse(content=hotels)
+
+
+@router.get(
+    path="/hotels/stream",
+    status_code=status.HTTP_200_OK,
+    response_class=NDJSONStreamingResponse,
+    responses=responses_of_streaming_hotels,
+    summary="Stream all hotels in accordance with filters as newline-delimited json.",
+)
+async def stream_hotels(
     location: str = None,
     number_of_guests: int = None,
     stars: hotel_stars_annotated = None,  # type: ignore
     services: service_ids_annotated = None,  # type: ignore
     service: BookingServicePort = Depends(get_booking_service),
-) -> list[ExtendedHotelResponseSchema]:
-    hotels: list[ExtendedHotelResponseSchema] = await service.get_hotels(
+) -> NDJSONStreamingResponse:
+    hotels: AsyncIterator[dict[str, Any]] = service.stream_hotels(
         location=location,
         number_of_guests=number_of_guests,
         stars=stars,
         services=services,
     )
 
-    return hotels
+    return NDJSONStreamingResponse(content=hotels)
 
 
 @router.get(
@@ -158,6 +252,9 @@ async def get_hotels(
 )
 @redis_controller.cache(
     warming_up=True,
+    local_caching=True,
+    tags=("premium_level_varieties", "rooms"),
+    etag_tables=("premium_level_varieties", "rooms"),
     expire=settings.CACHE_RETENTION_TIME_SECONDS,
 )
 async def get_premium_levels(
@@ -176,11 +273,22 @@ async def get_premium_levels(
 @router.get(
     path="/rooms",
     status_code=status.HTTP_200_OK,
+    response_model=PageResponseSchema[ExtendedRoomResponseSchema],
     responses=responses_of_getting_rooms,
     summary="Get a list of rooms in accordance with filters.",
 )
 @redis_controller.cache(
     warming_up=True,
+    # Only rooms filtered by the stay period depend on bookings
+    tags=lambda check_in_and_check_out=None, **kwargs: (
+        "rooms",
+        "hotels",
+        "premium_level_varieties",
+        "rooms_services",
+        "service_varieties",
+        *(("bookings",) if check_in_and_check_out is not None and check_in_and_check_out.is_set else ()),
+    ),
+    stale_while_revalidate=settings.CACHE_STALE_WHILE_REVALIDATE_SECONDS,
     expire=settings.CACHE_RETENTION_TIME_SECONDS,
 )
 async def get_rooms(
@@ -189,14 +297,47 @@ async def get_rooms(
     number_of_guests: int = None,
     services: service_ids_annotated = None,  # type: ignore
     premium_levels: premium_level_ids_annotated = None,  # type: ignore
+    check_in_and_check_out: StayPeriodValidator = Depends(get_check_in_and_check_out),
+    pagination: PaginationValidator = Depends(get_pagination),
+    service: BookingServicePort = Depends(get_booking_service),
+) -> SerializedPageResponse:
+    rooms: dict[str, Any] = await service.get_rooms(
+        min_price_and_max_price=min_price_and_max_price,
+        hotel_id=hotel_id,
+        number_of_guests=number_of_guests,
+        services=services,
+        premium_levels=premium_levels,
+        check_in_and_check_out=check_in_and_check_out,
+        pagination=pagination,
+        serializable=True,
+    )
+
+    return SerializedPageResponse(content=rooms)
+
+
+@router.get(
+    path="/rooms/stream",
+    status_code=status.HTTP_200_OK,
+    response_class=NDJSONStreamingResponse,
+    responses=responses_of_streaming_rooms,
+    summary="Stream all rooms in accordance with filters as newline-delimited json.",
+)
+async def stream_rooms(
+    min_price_and_max_price: PriceRangeValidator = Depends(get_min_price_and_max_price),
+    hotel_id: int = None,
+    number_of_guests: int = None,
+    services: service_ids_annotated = None,  # type: ignore
+    premium_levels: premium_level_ids_annotated = None,  # type: ignore
+    check_in_and_check_out: StayPeriodValidator = Depends(get_check_in_and_check_out),
     service: BookingServicePort = Depends(get_booking_service),
-) -> list[ExtendedRoomResponseSchema]:
-    rooms: list[ExtendedRoomResponseSchema] = await service.get_rooms(
+) -> NDJSONStreamingResponse:
+    rooms: AsyncIterator[dict[str, Any]] = service.stream_rooms(
         min_price_and_max_price=min_price_and_max_price,
         hotel_id=hotel_id,
         number_of_guests=number_of_guests,
         services=services,
         premium_levels=premium_levels,
+        check_in_and_check_out=check_in_and_check_out,
     )
 
-    return rooms
+    return NDJSONStreamingResponse(content=rooms)
@@ -1,5 +1,6 @@
 from starlette import status
 
+from app.core.services.base.schemas import PageResponseSchema
 from app.core.services.bookings.schemas import (
     BookingResponseSchema,
     ServiceVarietyResponseSchema,
@@ -7,6 +8,7 @@ from app.core.services.bookings.schemas import (
     PremiumLevelVarietyResponseSchema,
     ExtendedRoomResponseSchema,
     ExtendedBookingResponseSchema,
+    RoomAvailabilityResponseSchema,
 )
 
 from app.adapters.primary.api.base.schemas import BaseErrorResponseSchema
@@ -18,6 +20,7 @@ from app.adapters.primary.api.version_1.bookings.docs import (
     GettingPremiumLevelsEnum,
     GettingRoomsEnum,
     GettingBookingsEnum,
+    GettingAvailabilityEnum,
 )
 
 
@@ -65,7 +68,7 @@ responses_of_getting_services = {
 
 responses_of_getting_hotels = {
     status.HTTP_200_OK: {
-        "model": ExtendedHotelResponseSchema,
+        "model": PageResponseSchema[ExtendedHotelResponseSchema],
         "content": {
             "application/json": {
                 "examples": {
@@ -92,6 +95,23 @@ responses_of_getting_hotels = {
     },
 }
 
+responses_of_streaming_hotels = {
+    status.HTTP_200_OK: {
+        "description": "Newline-delimited json with one object per line.",
+        "content": {
+            "application/x-ndjson": {
+                "schema": {"type": "string"},
+                "example": "\n".join(item.model_dump_json() for item in GettingHotelsEnum.SUCCESS.value.items),
+            },
+        },
+    },
+    **{
+        status_code: response
+        for status_code, response in responses_of_getting_hotels.items()
+        if status_code != status.HTTP_200_OK
+    },
+}
+
 responses_of_getting_premium_levels = {
     status.HTTP_200_OK: {
         "model": PremiumLevelVarietyResponseSchema,
@@ -123,7 +143,7 @@ responses_of_getting_premium_levels = {
 
 responses_of_getting_rooms = {
     status.HTTP_200_OK: {
-        "model": ExtendedRoomResponseSchema,
+        "model": PageResponseSchema[ExtendedRoomResponseSchema],
         "content": {
             "application/json": {
                 "examples": {
@@ -163,9 +183,26 @@ responses_of_getting_rooms = {
     },
 }
 
+responses_of_streaming_rooms = {
+    status.HTTP_200_OK: {
+        "description": "Newline-delimited json with one object per line.",
+        "content": {
+            "application/x-ndjson": {
+                "schema": {"type": "string"},
+                "example": "\n".join(item.model_dump_json() for item in GettingRoomsEnum.SUCCESS.value.items),
+            },
+        },
+    },
+    **{
+        status_code: response
+        for status_code, response in responses_of_getting_rooms.items()
+        if status_code != status.HTTP_200_OK
+    },
+}
+
 responses_of_getting_bookings = {
     status.HTTP_200_OK: {
-        "model": ExtendedBookingResponseSchema,
+        "model": PageResponseSchema[ExtendedBookingResponseSchema],
         "content": {
             "application/json": {
                 "examples": {
@@ -205,6 +242,65 @@ responses_of_getting_bookings = {
     },
 }
 
+responses_of_streaming_bookings = {
+    status.HTTP_200_OK: {
+        "description": "Newline-delimited json with one object per line.",
+        "content": {
+            "application/x-ndjson": {
+                "schema": {"type": "string"},
+                "example": "\n".join(item.model_dump_json() for item in GettingBookingsEnum.SUCCESS.value.items),
+            },
+        },
+    },
+    **{
+        status_code: response
+        for status_code, response in responses_of_getting_bookings.items()
+        if status_code != status.HTTP_200_OK
+    },
+}
+
+responses_of_getting_availability = {
+    status.HTTP_200_OK: {
+        "model": list[RoomAvailabilityResponseSchema],
+        "content": {
+            "application/json": {
+                "examples": {
+                    GettingAvailabilityEnum.SUCCESS.name: {
+                        "summary": GettingAvailabilityEnum.SUCCESS.name,
+                        "value": GettingAvailabilityEnum.SUCCESS.value,
+                    },
+                },
+            },
+        },
+    },
+    status.HTTP_422_UNPROCESSABLE_ENTITY: {
+        "model": BaseErrorResponseSchema,
+        "content": {
+            "application/json": {
+                "examples": {
+                    GettingAvailabilityEnum.CONSISTENCY_ERR.name: {
+                        "summary": GettingAvailabilityEnum.CONSISTENCY_ERR.name,
+                        "value": GettingAvailabilityEnum.CONSISTENCY_ERR.value,
+                    },
+                },
+            },
+        },
+    },
+    status.HTTP_500_INTERNAL_SERVER_ERROR: {
+        "model": BaseErrorResponseSchema,
+        "content": {
+            "application/json": {
+                "examples": {
+                    GettingAvailabilityEnum.SERVER_ERR.name: {
+                        "summary": GettingAvailabilityEnum.SERVER_ERR.name,
+                        "value": GettingAvailabilityEnum.SERVER_ERR.value,
+                    },
+                },
+            },
+        },
+    },
+}
+
 responses_of_adding_booking = {
     status.HTTP_201_CREATED: {
         "model": BookingResponseSchema,
@@ -7,6 +7,8 @@ from app.core.services.bookings.schemas import (
     RoomSchema,
 )
 
+from app.core.services.base.schemas import TableVersionResponseSchema
+
 from app.adapters.primary.api.base.schemas import BaseErrorResponseSchema
 
 
@@ -50,3 +52,20 @@ class GettingEntityEnum(Enum):
             "doc": "Exception documentation.",
         },
     )
+
+
+class GettingEntityVersionEnum(Enum):
+    """
+    Scheme of responses to a request for the version of entity.
+    """
+
+    SUCCESS: TableVersionResponseSchema = TableVersionResponseSchema(
+        table_name="rooms",
+        version=1_735_689_600_001,
+    )
+    SERVER_ERR: BaseErrorResponseSchema = BaseErrorResponseSchema(
+        detail="Unspecified error.",
+        extras={
+            "doc": "Exception documentation.",
+        },
+    )
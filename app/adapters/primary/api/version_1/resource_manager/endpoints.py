@@ -8,13 +8,17 @@ from app.settings import settings
 
 from app.ports.primary.resource_manager import ResourceManagerServicePort
 
+from app.core.services.base.schemas import TableVersionResponseSchema
+
 from app.adapters.primary.api.version_1.resource_manager.types import entity_name_annotated
 from app.adapters.primary.api.version_1.resource_manager.responses import (
     responses_of_getting_entity,
     responses_of_getting_entities,
+    responses_of_getting_entity_version,
 )
 
 from app.utils.redis.redis_controller import redis_controller
+from app.utils.redis.tags import get_item_tag, get_tags_of_item
 
 from app.dependencies.resource_manager import get_resource_manager_service
 
@@ -31,7 +35,11 @@ router = APIRouter(prefix="/resource-manager")
     "Query-parameters provide the ability to filter elements based on equality with the filter value.<br>"
     "Other comparison operators are not supported.",
 )
-@redis_controller.cache(expire=settings.CACHE_RETENTION_TIME_SECONDS)
+@redis_controller.cache(
+    tags=lambda entity_name, **kwargs: get_tags_of_item(table_name=entity_name.value),
+    etag_tables=lambda entity_name, **kwargs: (entity_name.value,),
+    expire=settings.CACHE_RETENTION_TIME_SECONDS,
+)
 async def get_entities_by_filters(
     request: Request,
     entity_name: entity_name_annotated,
@@ -47,13 +55,39 @@ async def get_entities_by_filters(
     return entities
 
 
+@router.get(
+    path="/{entity_name}/version",
+    status_code=status.HTTP_200_OK,
+    responses=responses_of_getting_entity_version,
+    summary="Get the version of entity.",
+    description="The version increases after each change of entities "
+    "and allows to check whether entities have changed without selecting them.<br>"
+    "The version is null if versions are unavailable.",
+)
+async def get_entity_version(
+    entity_name: entity_name_annotated,
+) -> TableVersionResponseSchema:
+    versions: dict[str, int] | None = await redis_controller.get_table_versions(table_names=(entity_name.value,))
+
+    entity_version = TableVersionResponseSchema(
+        table_name=entity_name.value,
+        version=versions and versions[entity_name.value],
+    )
+
+    return entity_version
+
+
 @router.get(
     path="/{entity_name}/{iid}",
     status_code=status.HTTP_200_OK,
     responses=responses_of_getting_entity,
     summary="Get entity by iid.",
 )
-@redis_controller.cache(expire=settings.CACHE_RETENTION_TIME_SECONDS)
+@redis_controller.cache(
+    tags=lambda entity_name, iid, **kwargs: (get_item_tag(table_name=entity_name.value, item_id=iid),),
+    etag_tables=lambda entity_name, **kwargs: (entity_name.value,),
+    expire=settings.CACHE_RETENTION_TIME_SECONDS,
+)
 async def get_entity_by_iid(
     entity_name: entity_name_annotated,
     iid: int,
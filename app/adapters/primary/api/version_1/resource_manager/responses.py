@@ -7,8 +7,11 @@ from app.core.services.bookings.schemas import (
     RoomSchema,
 )
 
+from app.core.services.base.schemas import TableVersionResponseSchema
+
 from app.adapters.primary.api.base.schemas import BaseErrorResponseSchema
-from app.adapters.primary.api.version_1.resource_manager.docs import GettingEntityEnum
+
+from app.adapters.primary.api.version_1.resource_manager.docs import GettingEntityEnum, GettingEntityVersionEnum
 
 
 responses_of_getting_entity = {
@@ -97,3 +100,32 @@ responses_of_getting_entities = {
         },
     },
 }
+
+responses_of_getting_entity_version = {
+    status.HTTP_200_OK: {
+        "model": TableVersionResponseSchema,
+        "content": {
+            "application/json": {
+                "examples": {
+                    GettingEntityVersionEnum.SUCCESS.name: {
+                        "summary": GettingEntityVersionEnum.SUCCESS.name,
+                        "value": GettingEntityVersionEnum.SUCCESS.value,
+                    },
+                },
+            },
+        },
+    },
+    status.HTTP_500_INTERNAL_SERVER_ERROR: {
+        "model": BaseErrorResponseSchema,
+        "content": {
+            "application/json": {
+                "examples": {
+                    GettingEntityVersionEnum.SERVER_ERR.name: {
+                        "summary": GettingEntityVersionEnum.SERVER_ERR.name,
+                        "value": GettingEntityVersionEnum.SERVER_ERR.value,
+                    },
+                },
+            },
+        },
+    },
+}
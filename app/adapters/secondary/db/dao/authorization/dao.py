@@ -41,6 +41,12 @@ class AuthorizationDAO(BaseDAO, AuthorizationDAOPort):
 
         user = UserDTO.model_validate(row_with_user)
 
+        self._invalidate_cache_after_commit(
+            transaction_context=transaction_context,
+            table_name="users",
+            item={"id": user.id},
+        )
+
         return user
 
     async def get_user(
@@ -17,6 +17,7 @@ from app.adapters.secondary.db.dao.base.queries import (
 )
 from app.adapters.secondary.db.dao.base.helpers import get_pydantic_schema_by_sqlalchemy_model
 
+from app.core.interfaces.cache_invalidator import ICacheInvalidator
 from app.core.interfaces.transaction_context import IStaticSyncTransactionContext
 from app.core.services.base.dtos import OccurrenceFilterDTO
 
@@ -26,6 +27,9 @@ class BaseDAO(BaseDAOPort):
     DAO layer base class.
     """
 
+    def __init__(self, cache_invalidator: ICacheInvalidator | None = None):
+        self.cache_invalidator = cache_invalidator
+
     def _get_model_by_table_name(self, table_name: str) -> DeclarativeAttributeIntercept:
         """
         Get model by table name.
@@ -44,6 +48,26 @@ class BaseDAO(BaseDAOPort):
 
         return orm_model
 
+    def _invalidate_cache_after_commit(
+        self,
+        transaction_context: IStaticSyncTransactionContext,
+        table_name: str,
+        item: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Invalidate cached responses depending on the table and its item
+        and increase the version of the table after the transaction is committed,
+        if the DAO is given a cache invalidator.
+        """
+
+        if self.cache_invalidator is None:
+            return
+
+        item_id = item and item.get("id")
+        transaction_context.add_after_commit_callback(
+            lambda: self.cache_invalidator.invalidate_cache_of_item(table_name=table_name, item_id=item_id)
+        )
+
     async def get_item_by_id(
         self,
         transaction_context: IStaticSyncTransactionContext,
@@ -139,6 +163,12 @@ class BaseDAO(BaseDAOPort):
 
         item = query_result_of_item.mappings().fetchone()
 
+        self._invalidate_cache_after_commit(
+            transaction_context=transaction_context,
+            table_name=table_name,
+            item=item,
+        )
+
         return item
 
     async def delete_item_by_id(
@@ -165,4 +195,10 @@ class BaseDAO(BaseDAOPort):
 
         item = query_result_of_item.mappings().fetchone()
 
+        self._invalidate_cache_after_commit(
+            transaction_context=transaction_context,
+            table_name=table_name,
+            item=item,
+        )
+
         return item
@@ -5,6 +5,7 @@ from loguru import logger
 
 from app.adapters.secondary.db.dao.base.exceptions import ValidatorGenerationError
 from app.core.services.base.dtos import OccurrenceFilterDTO
+from app.core.services.check.schemas import PaginationValidator
 
 ignore_orm_config = ConfigDict(
     from_attributes=True,
@@ -33,6 +34,26 @@ def get_filter_by_id(
     return query_filters
 
 
+def get_filters_by_cursor(
+    orm_model: DeclarativeAttributeIntercept,
+    pagination: PaginationValidator | None = None,
+    *args,
+    **kwargs,
+) -> list[BinaryExpression]:
+    """
+    Get sqlalchemy filters to select model items
+    following the item from the pagination cursor.
+
+    :return: list of sqlalchemy filters.
+    """
+
+    query_filters = []
+    if pagination is not None and pagination.last_id is not None:
+        query_filters.append(orm_model.id > pagination.last_id)
+
+    return query_filters
+
+
 def get_pydantic_schema_by_sqlalchemy_model(
     orm_model: type[DeclarativeAttributeIntercept],
     config: ConfigDict = ignore_orm_config,
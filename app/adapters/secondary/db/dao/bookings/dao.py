@@ -1,21 +1,34 @@
-from typing import Coroutine
+from collections.abc import AsyncIterator
+from typing import Any, Coroutine
+
+from sqlalchemy import Row
 
 from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncResult
 
 from app.ports.secondary.db.dao.bookings import BookingDAOPort
 
+from app.adapters.secondary.db.models.bookings_model import BookingsModel
+
 from app.adapters.secondary.db.dao.base.dao import BaseDAO
 from app.adapters.secondary.db.dao.bookings.queries import (
+    add_booking,
+    add_room_occupancy,
+    delete_room_occupancy,
+    get_availability_of_rooms,
     get_bookings,
     get_services,
     get_hotels,
     get_premium_levels,
     get_rooms,
+    get_aggregated_rooms,
+    rebuild_room_occupancy,
 )
 from app.adapters.secondary.db.dao.bookings.helpers import get_filters_for_booking_overlaps, get_filters_for_bookings
 
-from app.core.interfaces.transaction_context import IStaticSyncTransactionContext
+from app.core.interfaces.transaction_context import IStaticAsyncTransactionContext, IStaticSyncTransactionContext
 from app.core.services.bookings.dtos import (
+    BookingDTO,
     ExtendedBookingDTO,
     ImageDTO,
     RoomDTO,
@@ -24,8 +37,17 @@ from app.core.services.bookings.dtos import (
     PremiumLevelVarietyDTO,
     ExtendedRoomDTO,
     HotelDTO,
+    RoomAvailabilityDTO,
+)
+from app.core.services.bookings.schemas import BaseBookingSchema
+from app.core.services.check.schemas import (
+    CheckInAndCheckOutValidator,
+    HotelsOrRoomsValidator,
+    MinAndMaxDtsValidator,
+    PaginationValidator,
+    PriceRangeValidator,
+    StayPeriodValidator,
 )
-from app.core.services.check.schemas import HotelsOrRoomsValidator, MinAndMaxDtsValidator, PriceRangeValidator
 
 
 class BookingDAO(BaseDAO, BookingDAOPort):
@@ -64,9 +86,12 @@ class BookingDAO(BaseDAO, BookingDAOPort):
         number_of_guests: int | None = None,
         stars: int | None = None,
         services: list[int] | None = None,
-    ) -> list[ExtendedHotelDTO]:
+        pagination: PaginationValidator | None = None,
+        serializable: bool = False,
+    ) -> list[ExtendedHotelDTO] | list[dict[str, Any]]:
         """
-        Get a list of hotels in accordance with filters.
+        Get a list of hotels in accordance with filters
+        as DTOs or as json-serializable maps.
 
         :return: list of hotels.
         """
@@ -77,29 +102,54 @@ class BookingDAO(BaseDAO, BookingDAOPort):
             number_of_guests=number_of_guests,
             stars=stars,
             services=services,
+            pagination=pagination,
         )
         if isinstance(query_result_of_hotels, Coroutine):
             query_result_of_hotels = await query_result_of_hotels
 
         rows_with_hotels = query_result_of_hotels.fetchall()
 
-        map_of_hotel_ids_and_hotels: dict[int, ExtendedHotelDTO] = {}
+        if serializable:
+            hotels = [self._get_extended_hotel_map_from_row(row=row) for row in rows_with_hotels]
+
+            return hotels
+
+        hotels: list[ExtendedHotelDTO] = []
         for row in rows_with_hotels:
             hotel = ExtendedHotelDTO.model_validate(row.HotelsModel)
             hotel.rooms_quantity = row.rooms_quantity
-            if row.ImagesModel is not None:
-                hotel.main_image = ImageDTO.model_validate(row.ImagesModel)
+            hotel.main_image = row.ImagesModel and ImageDTO.model_validate(row.ImagesModel)
+            hotel.services = [ServiceVarietyDTO.model_validate(service) for service in row.services]
+            hotels.append(hotel)
 
-            hotel.services = []
-            if row.ServiceVarietiesModel is not None:
-                hotel.services.append(ServiceVarietyDTO.model_validate(row.ServiceVarietiesModel))
+        return hotels
 
-            if hotel.id not in map_of_hotel_ids_and_hotels:
-                map_of_hotel_ids_and_hotels[hotel.id] = hotel
-            else:
-                map_of_hotel_ids_and_hotels[hotel.id].services.extend(hotel.services)
+    async def stream_hotels(
+        self,
+        transaction_context: IStaticAsyncTransactionContext,
+        location: str | None = None,
+        number_of_guests: int | None = None,
+        stars: int | None = None,
+        services: list[int] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream hotels in accordance with filters as json-serializable maps
+        while rows are fetched from the server-side cursor.
+
+        :return: iterator of hotels.
+        """
+
+        query_result_of_hotels: AsyncResult = await get_hotels(
+            session=transaction_context.session,
+            location=location,
+            number_of_guests=number_of_guests,
+            stars=stars,
+            services=services,
+            stream=True,
+        )
 
-        return map_of_hotel_ids_and_hotels.values()
+        async for row in query_result_of_hotels:
+            yield self._get_extended_hotel_map_from_row(row=row)
 
     async def get_premium_levels(
         self,
@@ -137,26 +187,43 @@ class BookingDAO(BaseDAO, BookingDAOPort):
         number_of_guests: int = None,
         services: list[int] | None = None,
         premium_levels: list[int] | None = None,
-    ) -> list[ExtendedRoomDTO]:
+        check_in_and_check_out: StayPeriodValidator | None = None,
+        pagination: PaginationValidator | None = None,
+        aggregated_services: bool = True,
+        serializable: bool = False,
+    ) -> list[ExtendedRoomDTO] | list[dict[str, Any]]:
         """
-        Get a list of rooms in accordance with filters.
+        Get a list of rooms in accordance with filters
+        as DTOs or as json-serializable maps.
 
         :return: list of rooms.
         """
 
-        query_result_of_rooms: Result | Coroutine = get_rooms(
+        query_result_of_rooms: Result | Coroutine = (get_aggregated_rooms if aggregated_services else get_rooms)(
             session=transaction_context.session,
             min_price_and_max_price=min_price_and_max_price,
             hotel_id=hotel_id,
             number_of_guests=number_of_guests,
             services=services,
             premium_levels=premium_levels,
+            check_in_and_check_out=check_in_and_check_out,
+            pagination=pagination,
         )
         if isinstance(query_result_of_rooms, Coroutine):
             query_result_of_rooms = await query_result_of_rooms
 
         rows_with_rooms = query_result_of_rooms.fetchall()
 
+        if aggregated_services:
+            get_room = (
+                self._get_extended_room_map_from_aggregated_row
+                if serializable
+                else self._get_extended_room_dto_from_aggregated_row
+            )
+            rooms = [get_room(row=row) for row in rows_with_rooms]
+
+            return rooms
+
         map_of_room_ids_and_rooms: dict[int, ExtendedRoomDTO] = {}
         for row in rows_with_rooms:
             room = ExtendedRoomDTO.model_validate(row.RoomsModel)
@@ -174,7 +241,189 @@ class BookingDAO(BaseDAO, BookingDAOPort):
             else:
                 map_of_room_ids_and_rooms[room.id].services.extend(room.services)
 
-        return map_of_room_ids_and_rooms.values()
+        rooms = list(map_of_room_ids_and_rooms.values())
+        if pagination is not None:
+            # Rows with services can't be limited in the query,
+            #   so the page is cut off after the rows are merged
+            rooms = rooms[: pagination.limit + 1]
+        if serializable:
+            rooms = [room.model_dump(mode="json") for room in rooms]
+
+        return rooms
+
+    async def stream_rooms(
+        self,
+        transaction_context: IStaticAsyncTransactionContext,
+        min_price_and_max_price: PriceRangeValidator,
+        hotel_id: int = None,
+        number_of_guests: int = None,
+        services: list[int] | None = None,
+        premium_levels: list[int] | None = None,
+        check_in_and_check_out: StayPeriodValidator | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream rooms in accordance with filters as json-serializable maps
+        while rows are fetched from the server-side cursor.
+
+        :return: iterator of rooms.
+        """
+
+        query_result_of_rooms: AsyncResult = await get_aggregated_rooms(
+            session=transaction_context.session,
+            min_price_and_max_price=min_price_and_max_price,
+            hotel_id=hotel_id,
+            number_of_guests=number_of_guests,
+            services=services,
+            premium_levels=premium_levels,
+            check_in_and_check_out=check_in_and_check_out,
+            stream=True,
+        )
+
+        async for row in query_result_of_rooms:
+            yield self._get_extended_room_map_from_aggregated_row(row=row)
+
+    def _get_extended_room_dto_from_aggregated_row(self, row: Row) -> ExtendedRoomDTO:
+        """
+        Build a room with its hotel, premium level and services
+        from a row of the aggregated room query.
+
+        :return: room.
+        """
+
+        premium_level = row.premium_level__id and PremiumLevelVarietyDTO(
+            id=row.premium_level__id,
+            key=row.premium_level__key,
+            name=row.premium_level__name,
+            desc=row.premium_level__desc,
+        )
+        hotel = HotelDTO(
+            id=row.hotel__id,
+            name=row.hotel__name,
+            desc=row.hotel__desc,
+            location=row.hotel__location,
+            stars=row.hotel__stars,
+            main_image_id=row.hotel__main_image_id,
+        )
+        services = [ServiceVarietyDTO(**service) for service in row.services]
+
+        room = ExtendedRoomDTO(
+            id=row.id,
+            name=row.name,
+            desc=row.desc,
+            hotel_id=row.hotel_id,
+            premium_level_id=row.premium_level_id,
+            ordinal_number=row.ordinal_number,
+            maximum_persons=row.maximum_persons,
+            price=row.price,
+            hotel=hotel,
+            premium_level=premium_level,
+            services=services,
+        )
+
+        return room
+
+    def _get_extended_room_map_from_aggregated_row(self, row: Row) -> dict[str, Any]:
+        """
+        Build a json-serializable map of a room with its hotel, premium level and services
+        from a row of the aggregated room query.
+
+        :return: map of room.
+        """
+
+        premium_level = row.premium_level__id and {
+            "id": row.premium_level__id,
+            "key": row.premium_level__key,
+            "name": row.premium_level__name,
+            "desc": row.premium_level__desc,
+        }
+        hotel = {
+            "id": row.hotel__id,
+            "name": row.hotel__name,
+            "desc": row.hotel__desc,
+            "location": row.hotel__location,
+            "stars": row.hotel__stars,
+            # The rooms response doesn't expose the main image of the hotel.
+            "main_image_id": None,
+        }
+
+        room = {
+            "id": row.id,
+            "name": row.name,
+            "desc": row.desc,
+            "hotel_id": row.hotel_id,
+            "premium_level_id": row.premium_level_id,
+            "ordinal_number": row.ordinal_number,
+            "maximum_persons": row.maximum_persons,
+            "price": float(row.price),
+            "hotel": hotel,
+            "premium_level": premium_level,
+            "services": row.services,
+        }
+
+        return room
+
+    def _get_extended_hotel_map_from_row(self, row: Row) -> dict[str, Any]:
+        """
+        Build a json-serializable map of a hotel with its main image and services
+        from a row of the hotel query.
+
+        :return: map of hotel.
+        """
+
+        main_image = row.ImagesModel and {
+            "id": row.ImagesModel.id,
+            "key": row.ImagesModel.key,
+            "name": row.ImagesModel.name,
+            "desc": row.ImagesModel.desc,
+            "room_id": row.ImagesModel.room_id,
+            "filepath": row.ImagesModel.filepath,
+        }
+
+        hotel = {
+            "id": row.HotelsModel.id,
+            "name": row.HotelsModel.name,
+            "desc": row.HotelsModel.desc,
+            "location": row.HotelsModel.location,
+            "stars": row.HotelsModel.stars,
+            "main_image_id": row.HotelsModel.main_image_id,
+            "rooms_quantity": row.rooms_quantity,
+            "main_image": main_image,
+            "services": row.services,
+        }
+
+        return hotel
+
+    def _get_extended_booking_map_from_row(self, row: Row) -> dict[str, Any]:
+        """
+        Build a json-serializable map of a booking with its room
+        from a row of the booking query.
+
+        :return: map of booking.
+        """
+
+        room = {
+            "id": row.RoomsModel.id,
+            "name": row.RoomsModel.name,
+            "desc": row.RoomsModel.desc,
+            "hotel_id": row.RoomsModel.hotel_id,
+            "premium_level_id": row.RoomsModel.premium_level_id,
+            "ordinal_number": row.RoomsModel.ordinal_number,
+            "maximum_persons": row.RoomsModel.maximum_persons,
+            "price": float(row.RoomsModel.price),
+        }
+
+        booking = {
+            "id": row.BookingsModel.id,
+            "user_id": row.BookingsModel.user_id,
+            "room_id": row.BookingsModel.room_id,
+            "number_of_persons": row.BookingsModel.number_of_persons,
+            "check_in_dt": row.BookingsModel.check_in_dt,
+            "check_out_dt": row.BookingsModel.check_out_dt,
+            "total_cost": float(row.BookingsModel.total_cost),
+            "room": room,
+        }
+
+        return booking
 
     async def get_bookings(
         self,
@@ -184,9 +433,12 @@ class BookingDAO(BaseDAO, BookingDAOPort):
         user_id: int | None = None,
         room_id: int | None = None,
         booking_overlaps: bool = False,
-    ) -> list[ExtendedBookingDTO]:
+        pagination: PaginationValidator | None = None,
+        serializable: bool = False,
+    ) -> list[ExtendedBookingDTO] | list[dict[str, Any]]:
         """
-        Get a list of user's bookings.
+        Get a list of user's bookings
+        as DTOs or as json-serializable maps.
 
         :return: list of bookings.
         """
@@ -197,6 +449,7 @@ class BookingDAO(BaseDAO, BookingDAOPort):
             min_and_max_dts=min_and_max_dts,
             number_of_guests=number_of_guests,
             room_id=room_id,
+            pagination=pagination,
             get_query_filters=get_filters_for_booking_overlaps if booking_overlaps else get_filters_for_bookings,
         )
         if isinstance(query_result_of_bookings, Coroutine):
@@ -204,6 +457,11 @@ class BookingDAO(BaseDAO, BookingDAOPort):
 
         rows_with_bookings = query_result_of_bookings.fetchall()
 
+        if serializable:
+            bookings = [self._get_extended_booking_map_from_row(row=row) for row in rows_with_bookings]
+
+            return bookings
+
         bookings: list[ExtendedBookingDTO] = []
         for row in rows_with_bookings:
             booking = ExtendedBookingDTO.model_validate(row.BookingsModel)
@@ -211,3 +469,136 @@ class BookingDAO(BaseDAO, BookingDAOPort):
             bookings.append(booking)
 
         return bookings
+
+    async def stream_bookings(
+        self,
+        transaction_context: IStaticAsyncTransactionContext,
+        min_and_max_dts: MinAndMaxDtsValidator,
+        number_of_guests: int = None,
+        user_id: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream user's bookings as json-serializable maps
+        while rows are fetched from the server-side cursor.
+
+        :return: iterator of bookings.
+        """
+
+        query_result_of_bookings: AsyncResult = await get_bookings(
+            session=transaction_context.session,
+            user_id=user_id,
+            min_and_max_dts=min_and_max_dts,
+            number_of_guests=number_of_guests,
+            stream=True,
+        )
+
+        async for row in query_result_of_bookings:
+            yield self._get_extended_booking_map_from_row(row=row)
+
+    async def get_availability_of_rooms(
+        self,
+        transaction_context: IStaticSyncTransactionContext,
+        room_ids: list[int],
+        stay_periods: list[CheckInAndCheckOutValidator],
+    ) -> list[RoomAvailabilityDTO]:
+        """
+        Get availability of the rooms in each stay period.
+
+        :return: list of availabilities of rooms.
+        """
+
+        query_result_of_availability: Result | Coroutine = get_availability_of_rooms(
+            session=transaction_context.session,
+            room_ids=room_ids,
+            stay_periods=stay_periods,
+        )
+        if isinstance(query_result_of_availability, Coroutine):
+            query_result_of_availability = await query_result_of_availability
+
+        availability_of_rooms = [
+            RoomAvailabilityDTO.model_validate(row) for row in query_result_of_availability.fetchall()
+        ]
+
+        return availability_of_rooms
+
+    async def add_booking(
+        self,
+        transaction_context: IStaticSyncTransactionContext,
+        booking: BaseBookingSchema,
+    ) -> BookingDTO:
+        """
+        Add a booking if it does not overlap with other bookings of the room
+        and add its nights to the room occupancy in the same transaction.
+
+        :return: data of new booking.
+        """
+
+        query_result_of_booking: Result | Coroutine = add_booking(
+            session=transaction_context.session,
+            booking=booking,
+        )
+        if isinstance(query_result_of_booking, Coroutine):
+            query_result_of_booking = await query_result_of_booking
+
+        row_with_booking = query_result_of_booking.fetchone()
+
+        booking = BookingDTO.model_validate(row_with_booking)
+
+        # Nights of the booking are removed from the room occupancy
+        #   by the cascade of its deletion
+        query_result_of_occupancy: Result | Coroutine = add_room_occupancy(
+            session=transaction_context.session,
+            booking_ids=[booking.id],
+        )
+        if isinstance(query_result_of_occupancy, Coroutine):
+            await query_result_of_occupancy
+
+        self._invalidate_cache_after_commit(
+            transaction_context=transaction_context,
+            table_name=BookingsModel.__tablename__,
+            item={"id": booking.id},
+        )
+
+        return booking
+
+    async def refresh_room_occupancy_of_booking(
+        self,
+        transaction_context: IStaticAsyncTransactionContext,
+        booking_id: int,
+    ) -> None:
+        """
+        Replace nights of the booking in the room occupancy
+        after the booking is changed bypassing the DAO.
+        """
+
+        query_result_of_deletion: Result | Coroutine = delete_room_occupancy(
+            session=transaction_context.session,
+            booking_ids=[booking_id],
+        )
+        if isinstance(query_result_of_deletion, Coroutine):
+            await query_result_of_deletion
+
+        query_result_of_occupancy: Result | Coroutine = add_room_occupancy(
+            session=transaction_context.session,
+            booking_ids=[booking_id],
+        )
+        if isinstance(query_result_of_occupancy, Coroutine):
+            await query_result_of_occupancy
+
+    async def rebuild_room_occupancy(
+        self,
+        transaction_context: IStaticSyncTransactionContext,
+    ) -> int:
+        """
+        Rebuild the room occupancy for the current rolling horizon.
+
+        :return: number of booked nights.
+        """
+
+        query_result_of_occupancy: Result | Coroutine = rebuild_room_occupancy(
+            session=transaction_context.session,
+        )
+        if isinstance(query_result_of_occupancy, Coroutine):
+            query_result_of_occupancy = await query_result_of_occupancy
+
+        return query_result_of_occupancy.rowcount
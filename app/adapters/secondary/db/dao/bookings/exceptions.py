@@ -0,0 +1,7 @@
+from app.adapters.secondary.db.dao.base.exceptions import BaseDAOError
+
+
+class BaseBookingDAOError(BaseDAOError):
+    """
+    Basic exception for booking DAO.
+    """
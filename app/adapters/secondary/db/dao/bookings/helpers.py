@@ -1,5 +1,11 @@
-from sqlalchemy import or_, select, Select, func, between
-from sqlalchemy.sql.elements import BinaryExpression
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import TIMESTAMP, Date, cast, select, Select, func, literal, literal_column
+from sqlalchemy.dialects.postgresql import JSON, TSTZRANGE, Insert, aggregate_order_by, insert
+from sqlalchemy.sql.elements import BinaryExpression, ColumnElement
+from sqlalchemy.sql.functions import Function
+
+from app.settings import settings
 
 from app.adapters.secondary.db.models.bookings_model import BookingsModel
 from app.adapters.secondary.db.models.hotels_model import HotelsModel
@@ -7,8 +13,9 @@ from app.adapters.secondary.db.models.rooms_model import RoomsModel
 from app.adapters.secondary.db.models.hotels_services_model import HotelsServicesModel
 from app.adapters.secondary.db.models.service_varieties_model import ServiceVarietiesModel
 from app.adapters.secondary.db.models.rooms_services_model import RoomsServicesModel
+from app.adapters.secondary.db.models.room_occupancy_model import RoomOccupancyModel
 
-from app.core.services.check.schemas import MinAndMaxDtsValidator, PriceRangeValidator
+from app.core.services.check.schemas import MinAndMaxDtsValidator, PriceRangeValidator, StayPeriodValidator
 
 
 def get_filters_by_services(
@@ -70,7 +77,6 @@ def get_hotels_with_requested_services_query(
 
 def get_filters_for_hotels(
     location: str | None = None,
-    number_of_guests: int | None = None,
     stars: int | None = None,
     *args,
     **kwargs,
@@ -84,14 +90,112 @@ def get_filters_for_hotels(
     query_filters = []
     if location is not None:
         query_filters.append(HotelsModel.location.ilike(f"%{location}%"))
-    if number_of_guests is not None:
-        query_filters.append(RoomsModel.maximum_persons >= number_of_guests)
     if stars is not None:
         query_filters.append(HotelsModel.stars == stars)
 
     return query_filters
 
 
+def get_rooms_quantity_of_hotel_query(
+    number_of_guests: int | None = None,
+    *args,
+    **kwargs,
+) -> Select:
+    """
+    Get a query to count the rooms of the hotel
+    from the outer query that can accommodate the guests.
+
+    :return: query to count rooms of hotel.
+    """
+
+    query_filters = [RoomsModel.hotel_id == HotelsModel.id]
+    if number_of_guests is not None:
+        query_filters.append(RoomsModel.maximum_persons >= number_of_guests)
+
+    query = (
+        select(
+            func.count(RoomsModel.id).label("rooms_quantity"),
+        )
+        .select_from(RoomsModel)
+        .where(*query_filters)
+    )
+
+    return query
+
+
+def get_aggregated_services_column() -> Function:
+    """
+    Get a column that aggregates the service varieties
+    of the group into a json array ordered by their identifiers.
+
+    :return: column of aggregated services.
+    """
+
+    service_object = func.json_build_object(
+        "id",
+        ServiceVarietiesModel.id,
+        "key",
+        ServiceVarietiesModel.key,
+        "name",
+        ServiceVarietiesModel.name,
+        "desc",
+        ServiceVarietiesModel.desc,
+    )
+    aggregated_services = func.coalesce(
+        func.json_agg(aggregate_order_by(service_object, ServiceVarietiesModel.id)),
+        literal_column("'[]'::json"),
+        type_=JSON,
+    )
+
+    return aggregated_services
+
+
+def get_services_of_hotel_query(*args, **kwargs) -> Select:
+    """
+    Get a query to aggregate the services of the hotel
+    from the outer query into a json array.
+
+    :return: query to aggregate services of hotel.
+    """
+
+    query = (
+        select(
+            get_aggregated_services_column().label("services"),
+        )
+        .select_from(HotelsServicesModel)
+        .join(
+            ServiceVarietiesModel,
+            HotelsServicesModel.service_variety_id == ServiceVarietiesModel.id,
+        )
+        .where(HotelsServicesModel.hotel_id == HotelsModel.id)
+    )
+
+    return query
+
+
+def get_services_of_room_query(*args, **kwargs) -> Select:
+    """
+    Get a query to aggregate the services of the room
+    from the outer query into a json array.
+
+    :return: query to aggregate services of room.
+    """
+
+    query = (
+        select(
+            get_aggregated_services_column().label("services"),
+        )
+        .select_from(RoomsServicesModel)
+        .join(
+            ServiceVarietiesModel,
+            RoomsServicesModel.service_variety_id == ServiceVarietiesModel.id,
+        )
+        .where(RoomsServicesModel.room_id == RoomsModel.id)
+    )
+
+    return query
+
+
 def get_filters_by_premium_levels(
     premium_levels: list[int] | None = None,
     *args,
@@ -153,10 +257,44 @@ def get_rooms_with_requested_services_and_levels_query(
     return query
 
 
+def get_filters_by_stay_period(
+    check_in_and_check_out: StayPeriodValidator | None = None,
+    *args,
+    **kwargs,
+) -> list[BinaryExpression]:
+    """
+    Get sqlalchemy filters that exclude rooms
+    with bookings overlapping the requested stay period.
+
+    :return: list of sqlalchemy filters.
+    """
+
+    query_filters = []
+    if check_in_and_check_out is not None and check_in_and_check_out.is_set:
+        requested_stay_range = func.tstzrange(
+            literal(check_in_and_check_out.check_in_dt, TIMESTAMP(timezone=True)),
+            literal(check_in_and_check_out.check_out_dt, TIMESTAMP(timezone=True)),
+            type_=TSTZRANGE,
+        )
+        booked_stay_range = func.tstzrange(
+            BookingsModel.check_in_dt,
+            BookingsModel.check_out_dt,
+            type_=TSTZRANGE,
+        )
+        overlapping_bookings_query = select(BookingsModel.id).where(
+            BookingsModel.room_id == RoomsModel.id,
+            booked_stay_range.op("&&")(requested_stay_range),
+        )
+        query_filters.append(~overlapping_bookings_query.exists())
+
+    return query_filters
+
+
 def get_filters_for_rooms(
     min_price_and_max_price: PriceRangeValidator,
     hotel_id: int = None,
     number_of_guests: int = None,
+    check_in_and_check_out: StayPeriodValidator | None = None,
     *args,
     **kwargs,
 ) -> list[BinaryExpression]:
@@ -175,6 +313,9 @@ def get_filters_for_rooms(
         query_filters.append(HotelsModel.id == hotel_id)
     if number_of_guests is not None:
         query_filters.append(RoomsModel.maximum_persons >= number_of_guests)
+    query_filters += get_filters_by_stay_period(
+        check_in_and_check_out=check_in_and_check_out,
+    )
 
     return query_filters
 
@@ -216,45 +357,103 @@ def get_filters_for_booking_overlaps(
 ) -> list[BinaryExpression]:
     """
     Get sqlalchemy filters for booking overlap query.
+    Stay periods are half-open as in the exclusion constraint of bookings,
+    so a booking checked out at the minimum date doesn't overlap,
+    and the filters are served by the index on room, check-in and check-out dates.
 
     :return: list of sqlalchemy filters.
     """
 
-    filters_by_or = []
-    if min_and_max_dts.min_dt is not None:
-        filters_by_or.append(
-            between(
-                min_and_max_dts.min_dt,
-                BookingsModel.check_in_dt,
-                BookingsModel.check_out_dt,
-            )
-        )
-    if min_and_max_dts.max_dt is not None:
-        filters_by_or.append(
-            between(
-                min_and_max_dts.max_dt,
-                BookingsModel.check_in_dt,
-                BookingsModel.check_out_dt,
-            )
-        )
-    if min_and_max_dts.min_dt is not None and min_and_max_dts.max_dt is not None:
-        filters_by_or.append(
-            between(
-                BookingsModel.check_in_dt,
-                min_and_max_dts.min_dt,
-                min_and_max_dts.max_dt,
-            )
-        )
-        filters_by_or.append(
-            between(
-                BookingsModel.check_out_dt,
-                min_and_max_dts.min_dt,
-                min_and_max_dts.max_dt,
-            )
-        )
-
-    query_filters = [or_(*filters_by_or)]
+    query_filters = []
     if room_id is not None:
         query_filters.append(BookingsModel.room_id == room_id)
+    if min_and_max_dts.max_dt is not None:
+        query_filters.append(BookingsModel.check_in_dt < min_and_max_dts.max_dt)
+    if min_and_max_dts.min_dt is not None:
+        query_filters.append(BookingsModel.check_out_dt > min_and_max_dts.min_dt)
 
     return query_filters
+
+
+def get_horizon_of_room_occupancy(lookup: bool = False) -> tuple[date, date]:
+    """
+    Get the first night of the rolling horizon of room occupancy
+    and the night following the last one.
+    Stored nights cover the lead time and the maximum rental interval,
+    so that lookups within the lead time stay complete
+    as long as the occupancy is rebuilt at least once per the rental interval.
+
+    :return: first night and night following the last one.
+    """
+
+    first_night = settings.CURRENT_DT.date()
+    number_of_nights = settings.ROOM_OCCUPANCY_LEAD_TIME_DAYS
+    if not lookup:
+        number_of_nights += settings.MAX_RENTAL_INTERVAL_DAYS
+
+    return first_night, first_night + timedelta(days=number_of_nights)
+
+
+def get_local_date_column(column: ColumnElement) -> ColumnElement:
+    """
+    Get the date of the column with time zone in the time zone of the database settings.
+
+    :return: column of local date.
+    """
+
+    local_dt = func.timezone(literal(timedelta(hours=settings.DB_TIME_ZONE_OFFSET_HOURS)), column)
+
+    return cast(local_dt, Date)
+
+
+def get_nights_of_bookings_query(booking_ids: list[int] | None = None) -> Select:
+    """
+    Get a query to select booked nights of rooms within the rolling horizon
+    of the passed bookings or of all bookings.
+    Nights of a booking are dates from check-in date to the day before check-out date.
+
+    :return: query to select rooms, nights and bookings.
+    """
+
+    first_night, last_night = get_horizon_of_room_occupancy()
+    nights = func.generate_series(
+        func.greatest(get_local_date_column(BookingsModel.check_in_dt), first_night),
+        func.least(get_local_date_column(BookingsModel.check_out_dt), last_night) - 1,
+        timedelta(days=1),
+    )
+
+    query_filters = [
+        BookingsModel.room_id.is_not(None),
+        BookingsModel.check_out_dt > datetime.combine(date=first_night, time=time(tzinfo=settings.DB_TIME_ZONE)),
+    ]
+    if booking_ids is not None:
+        query_filters.append(BookingsModel.id.in_(booking_ids))
+
+    query = select(
+        BookingsModel.room_id,
+        cast(nights, Date).label("night"),
+        BookingsModel.id.label("booking_id"),
+    ).where(*query_filters)
+
+    return query
+
+
+def get_insert_of_nights_of_bookings_query(booking_ids: list[int] | None = None) -> Insert:
+    """
+    Get a query to insert booked nights of the passed bookings or of all bookings into the room occupancy.
+    Bookings of a room do not overlap, so a night already in the room occupancy is left by a changed booking
+    and is taken over by the booking being inserted.
+
+    :return: query to insert nights.
+    """
+
+    query = insert(RoomOccupancyModel).from_select(
+        ["room_id", "night", "booking_id"],
+        get_nights_of_bookings_query(booking_ids=booking_ids),
+    )
+    query = query.on_conflict_do_update(
+        index_elements=[RoomOccupancyModel.room_id, RoomOccupancyModel.night],
+        set_={"booking_id": query.excluded.booking_id},
+    )
+
+    return query
@@ -1,9 +1,30 @@
 from typing import Callable, Coroutine
 
-from sqlalchemy import select, func
+from sqlalchemy import (
+    Date,
+    Integer,
+    TIMESTAMP,
+    and_,
+    bindparam,
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 from sqlalchemy.engine import Result
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from loguru import logger
+
+import re
+
+from app.settings import settings
 
 from app.adapters.secondary.db.models.bookings_model import BookingsModel
 from app.adapters.secondary.db.models.hotels_services_model import HotelsServicesModel
@@ -13,16 +34,33 @@ from app.adapters.secondary.db.models.service_varieties_model import ServiceVari
 from app.adapters.secondary.db.models.hotels_model import HotelsModel
 from app.adapters.secondary.db.models.rooms_model import RoomsModel
 from app.adapters.secondary.db.models.premium_level_varieties_model import PremiumLevelVarietiesModel
+from app.adapters.secondary.db.models.room_occupancy_model import RoomOccupancyModel
 
+from app.adapters.secondary.db.dao.base.helpers import get_filters_by_cursor
+from app.adapters.secondary.db.dao.bookings.exceptions import BaseBookingDAOError
 from app.adapters.secondary.db.dao.bookings.helpers import (
     get_filters_for_bookings,
     get_hotels_with_requested_services_query,
     get_filters_for_hotels,
+    get_rooms_quantity_of_hotel_query,
+    get_services_of_hotel_query,
+    get_services_of_room_query,
     get_rooms_with_requested_services_and_levels_query,
     get_filters_for_rooms,
+    get_horizon_of_room_occupancy,
+    get_insert_of_nights_of_bookings_query,
 )
 
-from app.core.services.check.schemas import HotelsOrRoomsValidator, MinAndMaxDtsValidator, PriceRangeValidator
+from app.core.services.bookings.exceptions import RoomAlreadyBookedError
+from app.core.services.bookings.schemas import BaseBookingSchema
+from app.core.services.check.schemas import (
+    CheckInAndCheckOutValidator,
+    HotelsOrRoomsValidator,
+    MinAndMaxDtsValidator,
+    PaginationValidator,
+    PriceRangeValidator,
+    StayPeriodValidator,
+)
 
 
 async def get_services(
@@ -57,60 +95,57 @@ async def get_hotels(
     number_of_guests: int | None = None,
     stars: int | None = None,
     services: list[int] | None = None,
+    pagination: PaginationValidator | None = None,
+    stream: bool = False,
     get_query_filters: Callable = get_filters_for_hotels,
-) -> Result:
+) -> Result | AsyncResult:
     """
-    Get the result of a hotel query from the database.
+    Get the result of a hotel query from the database
+    with one row per hotel.
 
     :return: result of a hotel query.
     """
 
     hotels_with_requested_services_sbq = get_hotels_with_requested_services_query(services=services).subquery()
-
-    window_of_count_rooms = {
-        "partition_by": (HotelsModel.id, ServiceVarietiesModel.id),
-    }
+    rooms_quantity_of_hotel_lateral = get_rooms_quantity_of_hotel_query(number_of_guests=number_of_guests).lateral()
+    services_of_hotel_lateral = get_services_of_hotel_query().lateral()
 
     query_filters = get_query_filters(
         location=location,
-        number_of_guests=number_of_guests,
         stars=stars,
     )
 
     query = (
         select(
             HotelsModel,
-            ServiceVarietiesModel,
-            func.count(RoomsModel.id).over(**window_of_count_rooms).label("rooms_quantity"),
+            rooms_quantity_of_hotel_lateral.c.rooms_quantity,
+            services_of_hotel_lateral.c.services,
             ImagesModel,
         )
         .select_from(HotelsModel)
-        .distinct(HotelsModel.id, ServiceVarietiesModel.id)
-        .join(
-            RoomsModel,
-            RoomsModel.hotel_id == HotelsModel.id,
-        )
         .join(
             hotels_with_requested_services_sbq,
             hotels_with_requested_services_sbq.c.hotel_id == HotelsModel.id,
         )
-        .outerjoin(
-            HotelsServicesModel,
-            HotelsServicesModel.hotel_id == HotelsModel.id,
-        )
-        .outerjoin(
-            ServiceVarietiesModel,
-            HotelsServicesModel.service_variety_id == ServiceVarietiesModel.id,
-        )
+        .join(rooms_quantity_of_hotel_lateral, true())
+        .join(services_of_hotel_lateral, true())
         .outerjoin(
             ImagesModel,
             HotelsModel.main_image_id == ImagesModel.id,
         )
-        .where(*query_filters)
-        .order_by(HotelsModel.id, ServiceVarietiesModel.id)
+        .where(
+            *query_filters,
+            *get_filters_by_cursor(orm_model=HotelsModel, pagination=pagination),
+            rooms_quantity_of_hotel_lateral.c.rooms_quantity > 0,
+        )
+        .order_by(HotelsModel.id)
     )
+    if pagination is not None:
+        query = query.limit(pagination.limit + 1)
+    if stream:
+        query = query.execution_options(yield_per=settings.DB_STREAM_YIELD_PER)
 
-    query_result: Result | Coroutine = session.execute(query)
+    query_result: Result | AsyncResult | Coroutine = (session.stream if stream else session.execute)(query)
     if isinstance(query_result, Coroutine):
         query_result = await query_result
 
@@ -162,6 +197,8 @@ async def get_rooms(
     number_of_guests: int = None,
     services: list[int] | None = None,
     premium_levels: list[int] | None = None,
+    check_in_and_check_out: StayPeriodValidator | None = None,
+    pagination: PaginationValidator | None = None,
     get_query_filters: Callable = get_filters_for_rooms,
 ) -> Result:
     """
@@ -179,6 +216,7 @@ async def get_rooms(
         min_price_and_max_price=min_price_and_max_price,
         hotel_id=hotel_id,
         number_of_guests=number_of_guests,
+        check_in_and_check_out=check_in_and_check_out,
     )
 
     query = (
@@ -206,8 +244,11 @@ async def get_rooms(
             ServiceVarietiesModel,
             RoomsServicesModel.service_variety_id == ServiceVarietiesModel.id,
         )
-        .where(*query_filters)
-        .order_by(RoomsModel.id)
+        .where(
+            *query_filters,
+            *get_filters_by_cursor(orm_model=RoomsModel, pagination=pagination),
+        )
+        .order_by(RoomsModel.id, ServiceVarietiesModel.id)
     )
 
     query_result: Result | Coroutine = session.execute(query)
@@ -217,14 +258,84 @@ async def get_rooms(
     return query_result
 
 
+async def get_aggregated_rooms(
+    session: Session | AsyncSession,
+    min_price_and_max_price: PriceRangeValidator,
+    hotel_id: int = None,
+    number_of_guests: int = None,
+    services: list[int] | None = None,
+    premium_levels: list[int] | None = None,
+    check_in_and_check_out: StayPeriodValidator | None = None,
+    pagination: PaginationValidator | None = None,
+    stream: bool = False,
+    get_query_filters: Callable = get_filters_for_rooms,
+) -> Result | AsyncResult:
+    """
+    Get the result of a room query from the database
+    with one row per room and services aggregated into a json array.
+
+    :return: result of a room query.
+    """
+
+    rooms_with_requested_services_sbq = get_rooms_with_requested_services_and_levels_query(
+        services=services,
+        premium_levels=premium_levels,
+    ).subquery()
+    services_of_room_lateral = get_services_of_room_query().lateral()
+
+    query_filters = get_query_filters(
+        min_price_and_max_price=min_price_and_max_price,
+        hotel_id=hotel_id,
+        number_of_guests=number_of_guests,
+        check_in_and_check_out=check_in_and_check_out,
+    )
+
+    query = (
+        select(
+            *RoomsModel.get_columns(),
+            *(column.label(f"hotel__{column.name}") for column in HotelsModel.get_columns()),
+            *(column.label(f"premium_level__{column.name}") for column in PremiumLevelVarietiesModel.get_columns()),
+            services_of_room_lateral.c.services,
+        )
+        .select_from(RoomsModel)
+        .join(HotelsModel, RoomsModel.hotel_id == HotelsModel.id)
+        .join(
+            rooms_with_requested_services_sbq,
+            rooms_with_requested_services_sbq.c.room_id == RoomsModel.id,
+        )
+        .outerjoin(
+            PremiumLevelVarietiesModel,
+            RoomsModel.premium_level_id == PremiumLevelVarietiesModel.id,
+        )
+        .join(services_of_room_lateral, true())
+        .where(
+            *query_filters,
+            *get_filters_by_cursor(orm_model=RoomsModel, pagination=pagination),
+        )
+        .order_by(RoomsModel.id)
+    )
+    if pagination is not None:
+        query = query.limit(pagination.limit + 1)
+    if stream:
+        query = query.execution_options(yield_per=settings.DB_STREAM_YIELD_PER)
+
+    query_result: Result | AsyncResult | Coroutine = (session.stream if stream else session.execute)(query)
+    if isinstance(query_result, Coroutine):
+        query_result = await query_result
+
+    return query_result
+
+
 async def get_bookings(
     session: Session | AsyncSession,
     min_and_max_dts: MinAndMaxDtsValidator,
     number_of_guests: int = None,
     user_id: int | None = None,
     room_id: int | None = None,
+    pagination: PaginationValidator | None = None,
+    stream: bool = False,
     get_query_filters: Callable = get_filters_for_bookings,
-) -> Result:
+) -> Result | AsyncResult:
     """
     Get the result of query for user's bookings from the database.
 
@@ -248,12 +359,231 @@ async def get_bookings(
             RoomsModel,
             BookingsModel.room_id == RoomsModel.id,
         )
-        .where(*query_filters)
+        .where(
+            *query_filters,
+            *get_filters_by_cursor(orm_model=BookingsModel, pagination=pagination),
+        )
         .order_by(BookingsModel.id)
     )
+    if pagination is not None:
+        query = query.limit(pagination.limit + 1)
+    if stream:
+        query = query.execution_options(yield_per=settings.DB_STREAM_YIELD_PER)
+
+    query_result: Result | AsyncResult | Coroutine = (session.stream if stream else session.execute)(query)
+    if isinstance(query_result, Coroutine):
+        query_result = await query_result
+
+    return query_result
+
+
+async def add_booking(
+    session: Session | AsyncSession,
+    booking: BaseBookingSchema,
+) -> Result:
+    """
+    Add a booking to the database
+    and get the result of querying the new booking's data.
+
+    :return: result of booking query.
+    :raise: RoomAlreadyBookedError, BaseBookingDAOError
+    """
+
+    map_of_booking_data = booking.model_dump()
+    query = insert(BookingsModel).values(map_of_booking_data).returning(*BookingsModel.__table__.columns)
+
+    try:
+        query_result: Result | Coroutine = session.execute(query)
+        if isinstance(query_result, Coroutine):
+            query_result = await query_result
+
+    except IntegrityError as error:
+        logger.error(error._message())
+
+        # If the new booking overlaps with another booking of the same room,
+        #   the exclusion constraint of the "bookings" table is violated
+        #   and an appropriate exception will be raised
+        #   and caught in the service
+        if re.search(
+            pattern=r"violates exclusion constraint.*excl_booking_bookings_room_id_stay_range",
+            string=error._message(),
+        ):
+            raise RoomAlreadyBookedError(
+                message="The room is already booked on these dates.",
+                extras={
+                    "room_id": booking.room_id,
+                    "check_in_date": booking.check_in_dt.strftime("%Y-%m-%d"),
+                    "check_out_date": booking.check_out_dt.strftime("%Y-%m-%d"),
+                },
+            )
+
+        else:
+            raise BaseBookingDAOError(
+                message="Booking error at database query level.",
+            )
+
+    return query_result
+
+
+async def get_availability_of_rooms(
+    session: Session | AsyncSession,
+    room_ids: list[int],
+    stay_periods: list[CheckInAndCheckOutValidator],
+) -> Result:
+    """
+    Get the result of the single query for availability of the rooms in each stay period.
+    Requested rooms and stay periods are unnested from arrays,
+    the bitmap of a room has a character per stay period in the order of periods.
+    Stay periods within the lead time are looked up in the room occupancy,
+    the rest are checked for overlapping bookings.
+    Rooms missing from the database are missing from the result.
+
+    :return: result of availability query.
+    """
+
+    requested_rooms = (
+        func.unnest(bindparam("room_ids", value=room_ids, type_=ARRAY(Integer)))
+        .table_valued("room_id", with_ordinality="room_number")
+        .render_derived(name="requested_rooms")
+    )
+    requested_stay_periods = (
+        func.unnest(
+            bindparam(
+                "check_in_dts",
+                value=[stay_period.check_in_dt for stay_period in stay_periods],
+                type_=ARRAY(TIMESTAMP(timezone=True)),
+            ),
+            bindparam(
+                "check_out_dts",
+                value=[stay_period.check_out_dt for stay_period in stay_periods],
+                type_=ARRAY(TIMESTAMP(timezone=True)),
+            ),
+            bindparam(
+                "check_in_dates",
+                value=[stay_period.check_in_date for stay_period in stay_periods],
+                type_=ARRAY(Date),
+            ),
+            bindparam(
+                "check_out_dates",
+                value=[stay_period.check_out_date for stay_period in stay_periods],
+                type_=ARRAY(Date),
+            ),
+        )
+        .table_valued(
+            "check_in_dt",
+            "check_out_dt",
+            "check_in_date",
+            "check_out_date",
+            with_ordinality="period_number",
+        )
+        .render_derived(name="requested_stay_periods")
+    )
+
+    # The predicate of overlapping bookings is the one of the exclusion constraint of bookings
+    room_has_overlapping_booking = exists().where(
+        BookingsModel.room_id == requested_rooms.c.room_id,
+        func.tstzrange(BookingsModel.check_in_dt, BookingsModel.check_out_dt).op("&&")(
+            func.tstzrange(requested_stay_periods.c.check_in_dt, requested_stay_periods.c.check_out_dt)
+        ),
+    )
+    room_has_occupied_night = exists().where(
+        RoomOccupancyModel.room_id == requested_rooms.c.room_id,
+        RoomOccupancyModel.night >= requested_stay_periods.c.check_in_date,
+        RoomOccupancyModel.night < requested_stay_periods.c.check_out_date,
+    )
+
+    first_night, last_night = get_horizon_of_room_occupancy(lookup=True)
+    room_is_booked = case(
+        (
+            and_(
+                requested_stay_periods.c.check_in_date >= first_night,
+                requested_stay_periods.c.check_out_date <= last_night,
+            ),
+            room_has_occupied_night,
+        ),
+        else_=room_has_overlapping_booking,
+    )
+    bitmap = func.string_agg(
+        case((room_is_booked, "0"), else_="1"),
+        aggregate_order_by(literal(""), requested_stay_periods.c.period_number),
+    )
+
+    query = (
+        select(
+            requested_rooms.c.room_id,
+            bitmap.label("bitmap"),
+        )
+        .select_from(requested_rooms)
+        .join(RoomsModel, RoomsModel.id == requested_rooms.c.room_id)
+        .join(requested_stay_periods, true())
+        .group_by(requested_rooms.c.room_id, requested_rooms.c.room_number)
+        .order_by(requested_rooms.c.room_number)
+    )
+
+    query_result: Result | Coroutine = session.execute(query)
+    if isinstance(query_result, Coroutine):
+        query_result = await query_result
+
+    return query_result
+
+
+async def add_room_occupancy(
+    session: Session | AsyncSession,
+    booking_ids: list[int],
+) -> Result:
+    """
+    Add booked nights of the bookings within the rolling horizon to the room occupancy.
+
+    :return: result of insert of nights.
+    """
+
+    query = get_insert_of_nights_of_bookings_query(booking_ids=booking_ids)
 
     query_result: Result | Coroutine = session.execute(query)
     if isinstance(query_result, Coroutine):
         query_result = await query_result
 
     return query_result
+
+
+async def delete_room_occupancy(
+    session: Session | AsyncSession,
+    booking_ids: list[int],
+) -> Result:
+    """
+    Delete booked nights of the bookings from the room occupancy.
+
+    :return: result of deletion of nights.
+    """
+
+    query = delete(RoomOccupancyModel).where(RoomOccupancyModel.booking_id.in_(booking_ids))
+
+    query_result: Result | Coroutine = session.execute(query)
+    if isinstance(query_result, Coroutine):
+        query_result = await query_result
+
+    return query_result
+
+
+async def rebuild_room_occupancy(session: Session | AsyncSession) -> Result:
+    """
+    Replace the room occupancy with booked nights of all bookings
+    within the current rolling horizon.
+    Rows are deleted rather than truncated,
+    so that availability queries are not blocked during the rebuild.
+    Nights added by bookings committed during the rebuild are overwritten rather than conflicting.
+
+    :return: result of insert of nights.
+    """
+
+    query_result: Result | Coroutine = session.execute(delete(RoomOccupancyModel))
+    if isinstance(query_result, Coroutine):
+        await query_result
+
+    query = get_insert_of_nights_of_bookings_query()
+
+    query_result = session.execute(query)
+    if isinstance(query_result, Coroutine):
+        query_result = await query_result
+
+    return query_result
@@ -1,13 +1,15 @@
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
+from inspect import isawaitable
 from contextlib import asynccontextmanager, contextmanager
 from typing import Any
 
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, AsyncSessionTransaction
 from loguru import logger
 
 import traceback
 
+from app.adapters.secondary.db.replicas import ReplicaSessionMakers
 from app.adapters.secondary.db.dao.base.exceptions import (
     TransactionContextAttrAlreadySetError,
     TransactionContextAttrNotSetError,
@@ -33,6 +35,7 @@ class StaticSyncTransactionContext(IStaticSyncTransactionContext):
     ):
         self._session_maker: sessionmaker = session_maker
         self._session: AsyncSession | None = None
+        self._after_commit_callbacks: list[Callable[[], Any]] = []
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self.session, name)
@@ -87,6 +90,36 @@ class StaticSyncTransactionContext(IStaticSyncTransactionContext):
 
         self.session.commit()
 
+        after_commit_callbacks = self._pop_after_commit_callbacks()
+        for callback in after_commit_callbacks:
+            try:
+                callback()
+
+            except Exception:
+                logger.error(traceback.format_exc())
+
+    def rollback(self) -> None:
+        """
+        Rollback the transaction.
+        """
+
+        self.session.rollback()
+        self._after_commit_callbacks.clear()
+
+    def add_after_commit_callback(self, callback: Callable[[], Any]) -> None:
+        """
+        Add the callback to be called after the transaction is committed.
+        Callbacks are discarded if the transaction is rolled back or closed without commit.
+        """
+
+        self._after_commit_callbacks.append(callback)
+
+    def _pop_after_commit_callbacks(self) -> list[Callable[[], Any]]:
+        after_commit_callbacks = self._after_commit_callbacks
+        self._after_commit_callbacks = []
+
+        return after_commit_callbacks
+
     def close(self) -> None:
         """
         Close the transaction.
@@ -95,6 +128,7 @@ class StaticSyncTransactionContext(IStaticSyncTransactionContext):
         try:
             current_session = self.session
             self._session = None
+            self._after_commit_callbacks.clear()
 
             current_session.close()
 
@@ -131,6 +165,7 @@ class StaticAsyncTransactionContext(IStaticAsyncTransactionContext):
     ):
         self._session_maker: sessionmaker = session_maker
         self._session: AsyncSession | None = None
+        self._after_commit_callbacks: list[Callable[[], Any]] = []
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self.session, name)
@@ -185,6 +220,38 @@ class StaticAsyncTransactionContext(IStaticAsyncTransactionContext):
 
         await self.session.commit()
 
+        after_commit_callbacks = self._pop_after_commit_callbacks()
+        for callback in after_commit_callbacks:
+            try:
+                call_result = callback()
+                if isawaitable(call_result):
+                    await call_result
+
+            except Exception:
+                logger.error(traceback.format_exc())
+
+    async def rollback(self) -> None:
+        """
+        Rollback the transaction.
+        """
+
+        await self.session.rollback()
+        self._after_commit_callbacks.clear()
+
+    def add_after_commit_callback(self, callback: Callable[[], Any]) -> None:
+        """
+        Add the callback to be called after the transaction is committed.
+        Callbacks are discarded if the transaction is rolled back or closed without commit.
+        """
+
+        self._after_commit_callbacks.append(callback)
+
+    def _pop_after_commit_callbacks(self) -> list[Callable[[], Any]]:
+        after_commit_callbacks = self._after_commit_callbacks
+        self._after_commit_callbacks = []
+
+        return after_commit_callbacks
+
     async def close(self) -> None:
         """
         Close the transaction.
@@ -193,6 +260,7 @@ class StaticAsyncTransactionContext(IStaticAsyncTransactionContext):
         try:
             current_session = self.session
             self._session = None
+            self._after_commit_callbacks.clear()
 
             await current_session.close()
 
@@ -203,15 +271,242 @@ class StaticAsyncTransactionContext(IStaticAsyncTransactionContext):
 class StaticAsyncTransactionContextFactory(IStaticAsyncTransactionContextFactory):
     """
     Factory of async transaction contexts.
+    Read-only transaction contexts are bound to read replicas if there are healthy ones.
     """
 
     def __init__(
         self,
         session_maker: sessionmaker,
+        replica_session_makers: ReplicaSessionMakers | None = None,
     ):
         self.session_maker = session_maker
+        self.replica_session_makers = replica_session_makers
+
+    def init_transaction_context(self, read_only: bool = False) -> StaticAsyncTransactionContext:
+        session_maker = self.session_maker
+        if read_only and self.replica_session_makers:
+            session_maker = self.replica_session_makers.get_session_maker() or self.session_maker
+
+        transaction_context = StaticAsyncTransactionContext(session_maker=session_maker)
+
+        return transaction_context
+
+
+class RequestAsyncTransactionContext(StaticAsyncTransactionContext):
+    """
+    The context of the database async connection shared by transaction contexts of the request.
+    The context entered within another context of the request runs in the savepoint,
+    which is released by the commit and is rolled back by the rollback or the exit without commit.
+    Callbacks of the released savepoint are called after the commit of the outermost context.
+    """
+
+    def __init__(
+        self,
+        transaction_context_factory: "RequestAsyncTransactionContextFactory",
+    ):
+        super().__init__(session_maker=transaction_context_factory.session_maker)
+        self._transaction_context_factory = transaction_context_factory
+        self._parent: RequestAsyncTransactionContext | None = None
+        self._savepoint: AsyncSessionTransaction | None = None
+
+    @asynccontextmanager
+    async def __call__(
+        self,
+        reraise: Exception | None = None,
+        skip: tuple[Exception] | Exception | None = None,
+    ) -> AsyncIterator["RequestAsyncTransactionContext"]:
+        """
+        Determine the connect to the database shared by the request.
+
+        :return: transaction context.
+        """
+
+        if self._session is not None:
+            raise TransactionContextAttrAlreadySetError("Session is already initialized.")
+
+        try:
+            self._session = await self._transaction_context_factory.get_session()
+            self._parent = self._transaction_context_factory.enter_transaction_context(transaction_context=self)
+            try:
+                if self.is_nested:
+                    self._savepoint = await self.session.begin_nested()
+
+                yield self
+
+            finally:
+                await self.close()
+
+        except Exception as error:
+            logger.error(traceback.format_exc())
+
+            if reraise and (not skip or (skip and not isinstance(error, skip))):
+                raise reraise
+            raise
+
+    @property
+    def is_nested(self) -> bool:
+        return self._parent is not None
+
+    async def commit(self) -> None:
+        """
+        Commit the transaction or release the savepoint of the nested context.
+        """
+
+        if not self.is_nested:
+            await super().commit()
+
+            return
+
+        if self._savepoint.is_active:
+            await self._savepoint.commit()
 
-    def init_transaction_context(self) -> StaticAsyncTransactionContext:
-        transaction_context = StaticAsyncTransactionContext(session_maker=self.session_maker)
+        self._parent._after_commit_callbacks.extend(self._pop_after_commit_callbacks())
+        self._savepoint = await self.session.begin_nested()
+
+    async def rollback(self) -> None:
+        """
+        Rollback the transaction or the savepoint of the nested context.
+        """
+
+        if not self.is_nested:
+            await super().rollback()
+
+            return
+
+        if self._savepoint.is_active:
+            await self._savepoint.rollback()
+
+        self._after_commit_callbacks.clear()
+        self._savepoint = await self.session.begin_nested()
+
+    async def close(self) -> None:
+        """
+        Close the transaction,
+        the connection of the request is released by the close of the outermost context.
+        """
+
+        try:
+            if self._session is None:
+                raise TransactionContextAttrNotSetError("Session is not initialized.")
+
+            self._session = None
+            self._after_commit_callbacks.clear()
+            self._transaction_context_factory.exit_transaction_context(transaction_context=self)
+
+            # The connection of the request is returned to the pool by the outermost context,
+            #   so that it isn't held while the request does work outside transactions
+            if not self.is_nested:
+                await self._transaction_context_factory.release_session()
+
+            elif self._savepoint is not None and self._savepoint.is_active:
+                await self._savepoint.rollback()
+
+        except Exception:
+            logger.error(traceback.format_exc())
+
+        finally:
+            self._parent = None
+            self._savepoint = None
+
+
+class RequestAsyncTransactionContextFactory(StaticAsyncTransactionContextFactory):
+    """
+    Factory of async transaction contexts of the request,
+    which use a single connection checked out by the outermost of them until it is exited.
+    Read-only transaction contexts outside other contexts are bound to read replicas if there are healthy ones.
+    Transaction contexts of the request are to be used sequentially,
+    since they share the session.
+    Transaction contexts initialized after the factory is closed use their own sessions.
+    """
+
+    def __init__(
+        self,
+        session_maker: sessionmaker,
+        replica_session_makers: ReplicaSessionMakers | None = None,
+    ):
+        super().__init__(session_maker=session_maker, replica_session_makers=replica_session_makers)
+        self._connection: AsyncConnection | None = None
+        self._session: AsyncSession | None = None
+        self._transaction_contexts: list[RequestAsyncTransactionContext] = []
+        self._is_closed = False
+
+    def init_transaction_context(
+        self,
+        read_only: bool = False,
+    ) -> RequestAsyncTransactionContext | StaticAsyncTransactionContext:
+        if self._is_closed:
+            return super().init_transaction_context(read_only=read_only)
+
+        if read_only and self.replica_session_makers and not self._transaction_contexts:
+            replica_session_maker = self.replica_session_makers.get_session_maker()
+            if replica_session_maker is not None:
+                return StaticAsyncTransactionContext(session_maker=replica_session_maker)
+
+        transaction_context = RequestAsyncTransactionContext(transaction_context_factory=self)
 
         return transaction_context
+
+    async def get_session(self) -> AsyncSession:
+        """
+        Get the session of the request bound to its connection,
+        the connection is checked out if it is released.
+        Transaction contexts of the request cannot be entered after the factory is closed.
+
+        :return: session.
+        """
+
+        if self._is_closed:
+            raise TransactionContextAttrNotSetError("Transaction context factory is closed.")
+
+        if self._session is None:
+            self._connection = await self.session_maker.kw["bind"].connect()
+            self._session = self.session_maker(bind=self._connection)
+
+        return self._session
+
+    def enter_transaction_context(
+        self,
+        transaction_context: RequestAsyncTransactionContext,
+    ) -> RequestAsyncTransactionContext | None:
+        """
+        Register the entered transaction context.
+
+        :return: transaction context within which the context is entered.
+        """
+
+        parent = self._transaction_contexts[-1] if self._transaction_contexts else None
+        self._transaction_contexts.append(transaction_context)
+
+        return parent
+
+    def exit_transaction_context(self, transaction_context: RequestAsyncTransactionContext) -> None:
+        self._transaction_contexts.remove(transaction_context)
+
+    async def release_session(self) -> None:
+        """
+        Close the session and return the connection of the request to the pool,
+        the next transaction context of the request checks out the connection again.
+        """
+
+        try:
+            if self._session is not None:
+                await self._session.close()
+
+            if self._connection is not None:
+                await self._connection.close()
+
+        except Exception:
+            logger.error(traceback.format_exc())
+
+        finally:
+            self._session = None
+            self._connection = None
+
+    async def close(self) -> None:
+        """
+        Close the factory releasing the connection of the request.
+        """
+
+        self._is_closed = True
+
+        await self.release_session()
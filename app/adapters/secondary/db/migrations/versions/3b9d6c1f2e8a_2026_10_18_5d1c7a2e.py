@@ -0,0 +1,37 @@
+"""2026_10_18_5d1c7a2e
+
+Revision ID: 3b9d6c1f2e8a
+Revises: e4d75cf3a1a7
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9d6c1f2e8a"
+down_revision: Union[str, None] = "e4d75cf3a1a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_booking_bookings_stay_range",
+        "bookings",
+        [sa.text("tstzrange(check_in_dt, check_out_dt)")],
+        unique=False,
+        schema="booking",
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_booking_bookings_stay_range",
+        table_name="bookings",
+        schema="booking",
+    )
@@ -0,0 +1,74 @@
+"""2026_10_18_c3a8e61f
+
+Revision ID: 5e0b9a4c7d21
+Revises: 8f4e2a7c9d10
+Create Date: 2026-10-18 15:26:53.114870
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.settings import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "5e0b9a4c7d21"
+down_revision: Union[str, None] = "8f4e2a7c9d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "room_occupancy",
+        sa.Column("room_id", sa.Integer(), nullable=False),
+        sa.Column("night", sa.Date(), nullable=False),
+        sa.Column("booking_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["room_id"], ["booking.rooms.id"], onupdate="CASCADE", ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["booking_id"], ["booking.bookings.id"], onupdate="CASCADE", ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("room_id", "night"),
+        schema="booking",
+    )
+    op.create_index(
+        op.f("ix_booking_room_occupancy_booking_id"),
+        "room_occupancy",
+        ["booking_id"],
+        unique=False,
+        schema="booking",
+    )
+
+    # Booked nights of existing bookings are filled in from today,
+    #   the end of the horizon is rolled by the rebuild of room occupancy
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO booking.room_occupancy (room_id, night, booking_id)
+            SELECT
+                room_id,
+                CAST(
+                    generate_series(
+                        GREATEST(
+                            CAST(timezone(CAST(:offset AS INTERVAL), check_in_dt) AS DATE),
+                            CAST(timezone(CAST(:offset AS INTERVAL), now()) AS DATE)
+                        ),
+                        CAST(timezone(CAST(:offset AS INTERVAL), check_out_dt) AS DATE) - 1,
+                        INTERVAL '1 day'
+                    ) AS DATE
+                ),
+                id
+            FROM booking.bookings
+            WHERE room_id IS NOT NULL
+            """
+        ).bindparams(offset=f"{settings.DB_TIME_ZONE_OFFSET_HOURS} hours")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_booking_room_occupancy_booking_id"),
+        table_name="room_occupancy",
+        schema="booking",
+    )
+    op.drop_table("room_occupancy", schema="booking")
@@ -0,0 +1,38 @@
+"""2026_10_18_b7e3f19a
+
+Revision ID: 8f4e2a7c9d10
+Revises: 3b9d6c1f2e8a
+Create Date: 2026-10-18 11:47:05.902716
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f4e2a7c9d10"
+down_revision: Union[str, None] = "3b9d6c1f2e8a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The btree_gist extension provides gist operator classes
+    #   for scalar types such as integer,
+    #   which are needed to combine "room_id WITH ="
+    #   and a range overlap in a single exclusion constraint
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        "ALTER TABLE booking.bookings "
+        "ADD CONSTRAINT excl_booking_bookings_room_id_stay_range "
+        "EXCLUDE USING gist (room_id WITH =, tstzrange(check_in_dt, check_out_dt) WITH &&)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "excl_booking_bookings_room_id_stay_range",
+        "bookings",
+        schema="booking",
+    )
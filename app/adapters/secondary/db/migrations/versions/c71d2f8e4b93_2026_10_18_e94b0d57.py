@@ -0,0 +1,49 @@
+"""2026_10_18_e94b0d57
+
+Revision ID: c71d2f8e4b93
+Revises: 5e0b9a4c7d21
+Create Date: 2026-10-18 17:04:12.587341
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c71d2f8e4b93"
+down_revision: Union[str, None] = "5e0b9a4c7d21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The composite index serves overlap queries of a room
+    #   and replaces the index on its leading column
+    op.create_index(
+        "ix_booking_bookings_room_id_check_in_dt_check_out_dt",
+        "bookings",
+        ["room_id", "check_in_dt", "check_out_dt"],
+        unique=False,
+        schema="booking",
+    )
+    op.drop_index(
+        "ix_booking_bookings_room_id",
+        table_name="bookings",
+        schema="booking",
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_booking_bookings_room_id",
+        "bookings",
+        ["room_id"],
+        unique=False,
+        schema="booking",
+    )
+    op.drop_index(
+        "ix_booking_bookings_room_id_check_in_dt_check_out_dt",
+        table_name="bookings",
+        schema="booking",
+    )
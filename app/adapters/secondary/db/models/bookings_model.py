@@ -1,7 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Integer, ForeignKey, Numeric
+from sqlalchemy import Index, Integer, ForeignKey, Numeric, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.adapters.secondary.db.base import Base
@@ -11,6 +12,25 @@ from app.adapters.secondary.db.models.rooms_model import RoomsModel
 
 class BookingsModel(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        Index(
+            "ix_booking_bookings_room_id_check_in_dt_check_out_dt",
+            "room_id",
+            "check_in_dt",
+            "check_out_dt",
+        ),
+        Index(
+            "ix_booking_bookings_stay_range",
+            text("tstzrange(check_in_dt, check_out_dt)"),
+            postgresql_using="gist",
+        ),
+        ExcludeConstraint(
+            ("room_id", "="),
+            (text("tstzrange(check_in_dt, check_out_dt)"), "&&"),
+            name="excl_booking_bookings_room_id_stay_range",
+            using="gist",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -32,7 +52,6 @@ class BookingsModel(Base):
             onupdate="CASCADE",
             ondelete="SET NULL",
         ),
-        index=True,
     )
     number_of_persons: Mapped[int]
     check_in_dt: Mapped[datetime]
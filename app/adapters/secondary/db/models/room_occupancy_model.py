@@ -0,0 +1,38 @@
+from datetime import date
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.adapters.secondary.db.base import Base
+from app.adapters.secondary.db.models.bookings_model import BookingsModel
+from app.adapters.secondary.db.models.rooms_model import RoomsModel
+
+
+class RoomOccupancyModel(Base):
+    """
+    Booked nights of rooms over the rolling horizon,
+    a night without a row is free.
+    """
+
+    __tablename__ = "room_occupancy"
+
+    room_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            RoomsModel.id,
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        primary_key=True,
+    )
+    night: Mapped[date] = mapped_column(primary_key=True)
+    booking_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            BookingsModel.id,
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        index=True,
+    )
+
+    def __str__(self) -> str:
+        return f"Night {self.night.strftime("%Y-%m-%d")} of room {self.room_id}"
@@ -0,0 +1,67 @@
+from time import perf_counter
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.utils.prometheus.metrics import (
+    db_pool_checked_out_connections,
+    db_pool_overflow_connections,
+    db_pool_wait_seconds,
+)
+
+
+class InstrumentedPoolMixin:
+    """
+    Mixin of queue pools measuring the time checkouts wait for a connection,
+    the label of the engine is set when metrics of its pool are registered.
+    """
+
+    engine_name = "unregistered"
+
+    def _do_get(self):
+        # A checkout waits for a returned connection only when the overflow is exhausted,
+        #   otherwise an idle connection is taken or a new one is opened,
+        #   and the latency of connecting is not a wait for the pool
+        if self._max_overflow == -1 or self._overflow < self._max_overflow:
+            db_pool_wait_seconds.labels(engine=self.engine_name).observe(0)
+
+            return super()._do_get()
+
+        start_time = perf_counter()
+        try:
+            return super()._do_get()
+
+        finally:
+            db_pool_wait_seconds.labels(engine=self.engine_name).observe(perf_counter() - start_time)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.engine_name = self.engine_name
+
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    """
+    Queue pool of sync connections measuring the wait time of checkouts.
+    """
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """
+    Queue pool of async connections measuring the wait time of checkouts.
+    """
+
+
+def registering_pool_metrics(engine_name: str, pool: Pool) -> None:
+    """
+    Registering gauges of checked-out and overflow connections of the pool
+    and labelling its wait time with the name of the engine.
+    Pools not keeping connections have nothing to measure.
+    """
+
+    if not isinstance(pool, QueuePool):
+        return
+
+    pool.engine_name = engine_name
+    db_pool_checked_out_connections.labels(engine=engine_name).set_function(pool.checkedout)
+    db_pool_overflow_connections.labels(engine=engine_name).set_function(lambda: max(pool.overflow(), 0))
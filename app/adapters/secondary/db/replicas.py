@@ -0,0 +1,95 @@
+from itertools import count
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from loguru import logger
+
+import asyncio
+
+from app.settings import settings
+
+
+class ReplicaSessionMakers:
+    """
+    Session-makers of read replicas chosen by round-robin among healthy replicas.
+    """
+
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        health_check_timeout_seconds: float = settings.DB_REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS,
+    ):
+        self.engines = engines
+        self.session_makers = [
+            sessionmaker(
+                bind=engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+            )
+            for engine in engines
+        ]
+        self.health_check_timeout_seconds = health_check_timeout_seconds
+        self._health_statuses = [True] * len(engines)
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    def get_session_maker(self) -> sessionmaker | None:
+        """
+        Get the session-maker of the next healthy replica.
+
+        :return: session-maker or None if there are no healthy replicas.
+        """
+
+        healthy_session_makers = [
+            session_maker for session_maker, is_healthy in zip(self.session_makers, self._health_statuses) if is_healthy
+        ]
+        if not healthy_session_makers:
+            return None
+
+        session_maker = healthy_session_makers[next(self._counter) % len(healthy_session_makers)]
+
+        return session_maker
+
+    async def check_health(self) -> None:
+        """
+        Check the availability of each replica by a trivial query.
+        """
+
+        for replica_number, engine in enumerate(self.engines):
+            try:
+                async with asyncio.timeout(self.health_check_timeout_seconds):
+                    async with engine.connect() as connection:
+                        await connection.execute(text("SELECT 1"))
+
+                is_healthy = True
+
+            except Exception:
+                is_healthy = False
+
+            if is_healthy != self._health_statuses[replica_number]:
+                logger.warning(f"Replica #{replica_number} is {'healthy' if is_healthy else 'unavailable'}.")
+
+            self._health_statuses[replica_number] = is_healthy
+
+    async def keep_checking_health(
+        self,
+        interval_seconds: float = settings.DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS,
+    ) -> None:
+        """
+        Check the availability of replicas periodically.
+        """
+
+        while True:
+            await self.check_health()
+            await asyncio.sleep(interval_seconds)
+
+    async def dispose(self) -> None:
+        """
+        Close connections of all replicas.
+        """
+
+        for engine in self.engines:
+            await engine.dispose()
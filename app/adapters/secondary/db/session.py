@@ -1,19 +1,124 @@
+from typing import Any
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+import uuid
 
 from app.settings import settings
 
-async_engine = create_async_engine(url=settings.DB_SECRET_URL)
+from app.adapters.secondary.db.pools import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    registering_pool_metrics,
+)
+from app.adapters.secondary.db.replicas import ReplicaSessionMakers
+
+pool_params = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
+
+def get_pool_params(pool_class: type, pgbouncer_mode: bool = settings.DB_PGBOUNCER_MODE) -> dict[str, Any]:
+    """
+    Get params of the connection pool.
+    Behind PgBouncer connections are pooled by it,
+    so connections are not kept by the engine unless it is configured otherwise.
+
+    :return: pool params.
+    """
+
+    if pgbouncer_mode and settings.DB_PGBOUNCER_NULL_POOL:
+        return dict(poolclass=NullPool, pool_pre_ping=settings.DB_POOL_PRE_PING)
+
+    return dict(poolclass=pool_class, **pool_params)
+
+
+def get_prepared_statement_name() -> str:
+    """
+    Get the unique name of the prepared statement,
+    so that names of statements of different clients do not collide
+    in server connections shared by PgBouncer.
+
+    :return: name of prepared statement.
+    """
+
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def create_async_engine_of_url(url: str, pgbouncer_mode: bool = settings.DB_PGBOUNCER_MODE) -> AsyncEngine:
+    """
+    Create the async engine with the configured pool and asyncpg settings.
+    In the PgBouncer mode prepared statements are not cached and are uniquely named,
+    since consecutive transactions of a connection can be run on different server connections.
+
+    :return: async engine.
+    """
+
+    if pgbouncer_mode:
+        # PgBouncer rejects unknown startup parameters,
+        #   so the statement timeout has to be set for the role of the database
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": get_prepared_statement_name,
+            "server_settings": {"application_name": settings.DB_APPLICATION_NAME},
+        }
+
+    else:
+        connect_args = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": {
+                "application_name": settings.DB_APPLICATION_NAME,
+                "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS),
+            },
+        }
+
+    engine = create_async_engine(
+        url=url,
+        connect_args=connect_args,
+        **get_pool_params(pool_class=InstrumentedAsyncAdaptedQueuePool, pgbouncer_mode=pgbouncer_mode),
+    )
+
+    return engine
+
+
+async_engine = create_async_engine_of_url(url=settings.DB_SECRET_URL)
 async_session_maker = sessionmaker(
     bind=async_engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
-sync_engine = create_engine(url=settings.SYNC_DB_SECRET_URL)
+# Read replicas for read-only transactions
+async_replica_session_makers = ReplicaSessionMakers(
+    engines=[create_async_engine_of_url(url=replica_url) for replica_url in settings.DB_REPLICA_SECRET_URLS],
+)
+
+sync_connect_args = {"application_name": settings.DB_APPLICATION_NAME}
+if not settings.DB_PGBOUNCER_MODE:
+    sync_connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+
+sync_engine = create_engine(
+    url=settings.SYNC_DB_SECRET_URL,
+    connect_args=sync_connect_args,
+    **get_pool_params(pool_class=InstrumentedQueuePool),
+)
 sync_session_maker = sessionmaker(
     bind=sync_engine,
     class_=Session,
     expire_on_commit=False,
 )
+
+# Registering metrics of connection pools
+registering_pool_metrics(engine_name="async", pool=async_engine.pool)
+registering_pool_metrics(engine_name="sync", pool=sync_engine.pool)
+for replica_number, replica_engine in enumerate(async_replica_session_makers.engines):
+    registering_pool_metrics(engine_name=f"replica_{replica_number}", pool=replica_engine.pool)
@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class ICacheInvalidator(ABC):
+    @abstractmethod
+    async def invalidate_cache_of_item(self, table_name: str, item_id: Any = None) -> None: ...
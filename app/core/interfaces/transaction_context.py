@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any
 
 
 class IStaticSyncTransactionContext(ABC):
@@ -15,9 +16,15 @@ class IStaticSyncTransactionContext(ABC):
     @abstractmethod
     def commit(self) -> None: ...
 
+    @abstractmethod
+    def rollback(self) -> None: ...
+
     @abstractmethod
     def close(self) -> None: ...
 
+    @abstractmethod
+    def add_after_commit_callback(self, callback: Callable[[], Any]) -> None: ...
+
 
 class IStaticSyncTransactionContextFactory(ABC):
     @abstractmethod
@@ -31,10 +38,13 @@ class IStaticAsyncTransactionContext(IStaticSyncTransactionContext, ABC):
     @abstractmethod
     async def commit(self) -> None: ...
 
+    @abstractmethod
+    async def rollback(self) -> None: ...
+
     @abstractmethod
     async def close(self) -> None: ...
 
 
 class IStaticAsyncTransactionContextFactory(ABC):
     @abstractmethod
-    def init_transaction_context(self) -> IStaticAsyncTransactionContext: ...
+    def init_transaction_context(self, read_only: bool = False) -> IStaticAsyncTransactionContext: ...
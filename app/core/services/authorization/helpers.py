@@ -1,11 +1,24 @@
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
+from threading import Event
+from time import perf_counter
+from typing import Any
 
 from jose import jwt
 
+import asyncio
 import bcrypt
 
 from app.settings import settings
 
+from app.utils.prometheus.metrics import (
+    password_hashing_queued_tasks,
+    password_hashing_seconds,
+    password_hashing_wait_seconds,
+)
+
 from app.core.services.authorization.schemas import UserResponseSchema, TokenResponseSchema
 
 
@@ -17,7 +30,7 @@ def get_password_hash(password: str) -> str:
     """
 
     password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed_password = bcrypt.hashpw(
         password=password_bytes,
         salt=salt,
@@ -43,6 +56,99 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return verification_status
 
 
+# Pool of threads for hashing of passwords,
+#   bcrypt releases the GIL, so hashing does not block the event loop
+#   and the number of threads limits the cpu used by hashing
+password_hashing_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASHING_WORKERS,
+    thread_name_prefix="password_hashing",
+)
+
+
+def run_password_hashing_task(
+    function: Callable[..., Any],
+    operation: str,
+    queued_at: float,
+    started: Event,
+    **kwargs,
+) -> Any:
+    """
+    Run the task of the password hashing pool measuring its waiting in the queue and its duration.
+
+    :return: result of task.
+    """
+
+    started_at = perf_counter()
+    started.set()
+    password_hashing_queued_tasks.dec()
+    password_hashing_wait_seconds.observe(started_at - queued_at)
+
+    try:
+        return function(**kwargs)
+
+    finally:
+        password_hashing_seconds.labels(operation=operation).observe(perf_counter() - started_at)
+
+
+async def run_in_password_hashing_pool(function: Callable[..., Any], operation: str, **kwargs) -> Any:
+    """
+    Run the function in the password hashing pool.
+
+    :return: result of function.
+    """
+
+    started = Event()
+    task = partial(
+        run_password_hashing_task,
+        function,
+        operation=operation,
+        queued_at=perf_counter(),
+        started=started,
+        **kwargs,
+    )
+
+    # The queued task is counted down when it is started by a worker,
+    #   or when it is cancelled before that, e.g. after the client has disconnected
+    def count_down_cancelled_task(future: Future) -> None:
+        if not started.is_set():
+            password_hashing_queued_tasks.dec()
+
+    password_hashing_queued_tasks.inc()
+    future = password_hashing_executor.submit(task)
+    future.add_done_callback(count_down_cancelled_task)
+
+    return await asyncio.wrap_future(future)
+
+
+async def get_password_hash_in_pool(password: str) -> str:
+    """
+    Get password hash without blocking the event loop.
+
+    :return: hash of password.
+    """
+
+    hashed_password = await run_in_password_hashing_pool(get_password_hash, operation="hash", password=password)
+
+    return hashed_password
+
+
+async def verify_password_in_pool(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify user's password with password hash without blocking the event loop.
+
+    :return: password verification success status.
+    """
+
+    verification_status = await run_in_password_hashing_pool(
+        verify_password,
+        operation="verify",
+        plain_password=plain_password,
+        hashed_password=hashed_password,
+    )
+
+    return verification_status
+
+
 def get_access_token(
     user: UserResponseSchema,
     expires_delta: timedelta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
@@ -4,7 +4,11 @@ from app.ports.secondary.db.dao.authorization import AuthorizationDAOPort
 from app.core.interfaces.transaction_context import IStaticAsyncTransactionContextFactory
 from app.core.services.authorization.dtos import UserDTO
 from app.core.services.authorization.schemas import UserRequestSchema, UserResponseSchema, TokenResponseSchema
-from app.core.services.authorization.helpers import get_password_hash, verify_password, get_access_token
+from app.core.services.authorization.helpers import (
+    get_password_hash_in_pool,
+    verify_password_in_pool,
+    get_access_token,
+)
 from app.core.services.authorization.exceptions import IncorrectPasswordError
 from app.core.services.check.schemas import UserAuthenticationValidator
 
@@ -32,7 +36,7 @@ class AuthorizationService(AuthorizationServicePort):
         :return: data of new user.
         """
 
-        user.password = get_password_hash(password=user.password)
+        user.password = await get_password_hash_in_pool(password=user.password)
 
         transaction_context = self.transaction_context_factory.init_transaction_context()
         async with transaction_context():
@@ -71,25 +75,27 @@ class AuthorizationService(AuthorizationServicePort):
                 authentication_data=authentication_data,
             )
 
-            if not verify_password(
-                plain_password=authentication_data.password,
-                hashed_password=user_dto.password,
-            ):
-                raise IncorrectPasswordError(
-                    message="Invalid password.",
-                    extras={
-                        "password": authentication_data.password,
-                    },
-                )
-
-            user = UserResponseSchema(
-                id=user_dto.id,
-                email=user_dto.email,
-                phone=user_dto.phone,
-                first_name=user_dto.first_name,
-                last_name=user_dto.last_name,
-                is_admin=user_dto.is_admin,
+        # The password is verified outside the transaction,
+        #   so that the connection is not held while the hash is computed
+        if not await verify_password_in_pool(
+            plain_password=authentication_data.password,
+            hashed_password=user_dto.password,
+        ):
+            raise IncorrectPasswordError(
+                message="Invalid password.",
+                extras={
+                    "password": authentication_data.password,
+                },
             )
-            access_token: TokenResponseSchema = get_access_token(user=user)
+
+        user = UserResponseSchema(
+            id=user_dto.id,
+            email=user_dto.email,
+            phone=user_dto.phone,
+            first_name=user_dto.first_name,
+            last_name=user_dto.last_name,
+            is_admin=user_dto.is_admin,
+        )
+        access_token: TokenResponseSchema = get_access_token(user=user)
 
         return access_token
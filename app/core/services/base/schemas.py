@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class PageResponseSchema[T](BaseModel):
+    items: list[T]
+    next_cursor: str | None = None
+
+
+class TableVersionResponseSchema(BaseModel):
+    table_name: str
+    version: int | None = None
@@ -88,3 +88,11 @@ class BookingDTO(BaseModel):
 
 class ExtendedBookingDTO(BookingDTO):
     room: RoomDTO | None = None
+
+
+class RoomAvailabilityDTO(BaseModel):
+    room_id: int
+    bitmap: str
+
+    class Config:
+        from_attributes = True
@@ -1,6 +1,8 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
+
+from app.settings import settings
 
 from app.core.services.check.schemas import CheckInAndCheckOutValidator
 
@@ -80,3 +82,28 @@ class ExtendedBookingResponseSchema(BookingResponseSchema):
 class BookingRequestSchema(CheckInAndCheckOutValidator):
     room_id: int
     number_of_persons: int
+
+
+class AvailabilityRequestSchema(BaseModel):
+    room_ids: list[int] = Field(min_length=1, max_length=settings.MAX_AVAILABILITY_ROOMS)
+    stay_periods: list[CheckInAndCheckOutValidator] = Field(
+        min_length=1,
+        max_length=settings.MAX_AVAILABILITY_STAY_PERIODS,
+    )
+
+    @field_validator("room_ids")
+    @classmethod
+    def unique_room_ids_validator(cls, room_ids: list[int]) -> list[int]:
+        """
+        Drop repeated room IDs keeping the order of rooms.
+
+        :return: unique room IDs.
+        """
+
+        return list(dict.fromkeys(room_ids))
+
+
+class RoomAvailabilityResponseSchema(BaseModel):
+    room_id: int
+    # Free ("1") or busy ("0") status of the room for each requested stay period
+    bitmap: str
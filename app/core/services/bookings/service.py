@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
 from app.settings import settings
 
 from app.utils.celery.tasks import send_email
@@ -15,9 +18,12 @@ from app.core.services.bookings.dtos import (
     ExtendedHotelDTO,
     PremiumLevelVarietyDTO,
     ExtendedRoomDTO,
+    RoomAvailabilityDTO,
 )
 from app.core.domain.bookings.booking_domain import AddBookingDomainModel, DeleteBookingDomainModel
+from app.core.services.base.schemas import PageResponseSchema
 from app.core.services.bookings.schemas import (
+    AvailabilityRequestSchema,
     BaseBookingSchema,
     BookingRequestSchema,
     BookingResponseSchema,
@@ -29,12 +35,20 @@ from app.core.services.bookings.schemas import (
     PremiumLevelVarietyResponseSchema,
     ExtendedRoomResponseSchema,
     HotelSchema,
+    RoomAvailabilityResponseSchema,
 )
+from app.core.services.bookings.exceptions import RoomAlreadyBookedError
 from app.core.services.bookings.templates import (
     body_template_for_booking_confirmation,
     body_template_for_booking_cancellation,
 )
-from app.core.services.check.schemas import HotelsOrRoomsValidator, MinAndMaxDtsValidator, PriceRangeValidator
+from app.core.services.check.schemas import (
+    HotelsOrRoomsValidator,
+    MinAndMaxDtsValidator,
+    PaginationValidator,
+    PriceRangeValidator,
+    StayPeriodValidator,
+)
 
 
 class BookingService(BookingServicePort):
@@ -60,7 +74,7 @@ class BookingService(BookingServicePort):
         :return: list of services.
         """
 
-        transaction_context = self.transaction_context_factory.init_transaction_context()
+        transaction_context = self.transaction_context_factory.init_transaction_context(read_only=True)
         async with transaction_context():
             services_dto: list[ServiceVarietyDTO] = await self.booking_dao.get_services(
                 transaction_context=transaction_context,
@@ -85,14 +99,18 @@ class BookingService(BookingServicePort):
         number_of_guests: int | None = None,
         stars: int | None = None,
         services: list[int] | None = None,
-    ) -> list[ExtendedHotelResponseSchema]:
+        pagination: PaginationValidator | None = None,
+        serializable: bool = False,
+    ) -> PageResponseSchema[ExtendedHotelResponseSchema] | dict[str, Any]:
         """
         Get a list of hotels in accordance with filters.
+        A serializable page skips the rebuild of response schemas
+        and contains json-serializable maps of hotels.
 
-        :return: list of hotels.
+        :return: page of hotels.
         """
 
-        transaction_context = self.transaction_context_factory.init_transaction_context()
+        transaction_context = self.transaction_context_factory.init_transaction_context(read_only=True)
         async with transaction_context():
             hotels_dto: list[ExtendedHotelDTO] = await self.booking_dao.get_hotels(
                 transaction_context=transaction_context,
@@ -100,7 +118,14 @@ class BookingService(BookingServicePort):
                 number_of_guests=number_of_guests,
                 stars=stars,
                 services=services,
+                pagination=pagination,
+                serializable=serializable,
             )
+            next_cursor = pagination and pagination.get_next_cursor(items=hotels_dto)
+            hotels_dto = hotels_dto[: pagination.limit] if pagination else hotels_dto
+
+            if serializable:
+                return {"items": hotels_dto, "next_cursor": next_cursor}
 
             hotels: list[ExtendedHotelResponseSchema] = []
             for hotel in hotels_dto:
@@ -137,7 +162,35 @@ class BookingService(BookingServicePort):
                     )
                 )
 
-        return hotels
+        return PageResponseSchema[ExtendedHotelResponseSchema](
+            items=hotels,
+            next_cursor=next_cursor,
+        )
+
+    async def stream_hotels(
+        self,
+        location: str | None = None,
+        number_of_guests: int | None = None,
+        stars: int | None = None,
+        services: list[int] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream hotels in accordance with filters as json-serializable maps.
+        The transaction stays open until the stream is exhausted.
+
+        :return: iterator of hotels.
+        """
+
+        transaction_context = self.transaction_context_factory.init_transaction_context(read_only=True)
+        async with transaction_context():
+            async for hotel in self.booking_dao.stream_hotels(
+                transaction_context=transaction_context,
+                location=location,
+                number_of_guests=number_of_guests,
+                stars=stars,
+                services=services,
+            ):
+                yield hotel
 
     async def get_premium_levels(
         self,
@@ -150,7 +203,7 @@ class BookingService(BookingServicePort):
         :return: list of premium levels.
         """
 
-        transaction_context = self.transaction_context_factory.init_transaction_context()
+        transaction_context = self.transaction_context_factory.init_transaction_context(read_only=True)
         async with transaction_context():
             premium_levels_dto: list[PremiumLevelVarietyDTO] = await self.booking_dao.get_premium_levels(
                 transaction_context=transaction_context,
@@ -177,14 +230,23 @@ class BookingService(BookingServicePort):
         number_of_guests: int = None,
         services: list[int] | None = None,
         premium_levels: list[int] | None = None,
-    ) -> list[ExtendedRoomResponseSchema]:
+        check_in_and_check_out: StayPeriodValidator | None = None,
+        pagination: PaginationValidator | None = None,
+        serializable: bool = False,
+    ) -> PageResponseSchema[ExtendedRoomResponseSchema] | dict[str, Any]:
         """
         Get a list of rooms in accordance with filters.
+        A serializable page skips the rebuild of response schemas
+        and contains json-serializable maps of rooms.
 
-        :return: list of rooms.
+        :return: page of rooms.
         """
 
-        transaction_context = self.transaction_context_factory.init_transaction_context()
+        # Rooms free in the stay period depend on bookings,
+        #   so they are read from the primary as bookings are,
+        #   otherwise a lagging replica would put rooms just booked back in the cache
+        read_only = check_in_and_check_out is None or not check_in_and_check_out.is_set
+        transaction_context = self.transaction_context_factory.init_transaction_context(read_only=read_only)
         async with transaction_context():
             rooms_dto: list[ExtendedRoomDTO] = await self.booking_dao.get_rooms(
                 transaction_context=transaction_context,
@@ -193,7 +255,15 @@ class BookingService(BookingServicePort):
                 number_of_guests=number_of_guests,
                 services=services,
                 premium_levels=premium_levels,
+                check_in_and_check_out=check_in_and_check_out,
+                pagination=pagination,
+                serializable=serializable,
             )
+            next_cursor = pagination and pagination.get_next_cursor(items=rooms_dto)
+            rooms_dto = rooms_dto[: pagination.limit] if pagination else rooms_dto
+
+            if serializable:
+                return {"items": rooms_dto, "next_cursor": next_cursor}
 
             rooms: list[ExtendedRoomResponseSchema] = []
             for room in rooms_dto:
@@ -237,18 +307,56 @@ class BookingService(BookingServicePort):
                     )
                 )
 
-        return rooms
+        return PageResponseSchema[ExtendedRoomResponseSchema](
+            items=rooms,
+            next_cursor=next_cursor,
+        )
+
+    async def stream_rooms(
+        self,
+        min_price_and_max_price: PriceRangeValidator,
+        hotel_id: int = None,
+        number_of_guests: int = None,
+        services: list[int] | None = None,
+        premium_levels: list[int] | None = None,
+        check_in_and_check_out: StayPeriodValidator | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream rooms in accordance with filters as json-serializable maps.
+        The transaction stays open until the stream is exhausted.
+
+        :return: iterator of rooms.
+        """
+
+        # Rooms free in the stay period depend on bookings, so they are read from the primary
+        read_only = check_in_and_check_out is None or not check_in_and_check_out.is_set
+        transaction_context = self.transaction_context_factory.init_transaction_context(read_only=read_only)
+        async with transaction_context():
+            async for room in self.booking_dao.stream_rooms(
+                transaction_context=transaction_context,
+                min_price_and_max_price=min_price_and_max_price,
+                hotel_id=hotel_id,
+                number_of_guests=number_of_guests,
+                services=services,
+                premium_levels=premium_levels,
+                check_in_and_check_out=check_in_and_check_out,
+            ):
+                yield room
 
     async def get_bookings(
         self,
         user_id: int,
         min_and_max_dts: MinAndMaxDtsValidator,
         number_of_guests: int = None,
-    ) -> list[ExtendedBookingResponseSchema]:
+        pagination: PaginationValidator | None = None,
+        serializable: bool = False,
+    ) -> PageResponseSchema[ExtendedBookingResponseSchema] | dict[str, Any]:
         """
         Get a list of user's bookings.
+        A serializable page skips the rebuild of response schemas
+        and contains json-serializable maps of bookings.
 
-        :return: list of bookings.
+        :return: page of bookings.
         """
 
         transaction_context = self.transaction_context_factory.init_transaction_context()
@@ -258,7 +366,14 @@ class BookingService(BookingServicePort):
                 user_id=user_id,
                 min_and_max_dts=min_and_max_dts,
                 number_of_guests=number_of_guests,
+                pagination=pagination,
+                serializable=serializable,
             )
+            next_cursor = pagination and pagination.get_next_cursor(items=bookings_dto)
+            bookings_dto = bookings_dto[: pagination.limit] if pagination else bookings_dto
+
+            if serializable:
+                return {"items": bookings_dto, "next_cursor": next_cursor}
 
             bookings: list[ExtendedBookingResponseSchema] = []
             for booking in bookings_dto:
@@ -284,7 +399,62 @@ class BookingService(BookingServicePort):
                     )
                 )
 
-        return bookings
+        return PageResponseSchema[ExtendedBookingResponseSchema](
+            items=bookings,
+            next_cursor=next_cursor,
+        )
+
+    async def stream_bookings(
+        self,
+        user_id: int,
+        min_and_max_dts: MinAndMaxDtsValidator,
+        number_of_guests: int = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream user's bookings as json-serializable maps.
+        The transaction stays open until the stream is exhausted.
+
+        :return: iterator of bookings.
+        """
+
+        transaction_context = self.transaction_context_factory.init_transaction_context()
+        async with transaction_context():
+            async for booking in self.booking_dao.stream_bookings(
+                transaction_context=transaction_context,
+                user_id=user_id,
+                min_and_max_dts=min_and_max_dts,
+                number_of_guests=number_of_guests,
+            ):
+                yield booking
+
+    async def get_availability_of_rooms(
+        self,
+        availability_data: AvailabilityRequestSchema,
+    ) -> list[RoomAvailabilityResponseSchema]:
+        """
+        Get availability of the rooms in each stay period by a single query.
+
+        :return: list of availabilities of rooms.
+        """
+
+        # Availability depends on bookings, so it is read from the primary as bookings are
+        transaction_context = self.transaction_context_factory.init_transaction_context()
+        async with transaction_context():
+            availability_of_rooms_dto: list[RoomAvailabilityDTO] = await self.booking_dao.get_availability_of_rooms(
+                transaction_context=transaction_context,
+                room_ids=availability_data.room_ids,
+                stay_periods=availability_data.stay_periods,
+            )
+
+            availability_of_rooms = [
+                RoomAvailabilityResponseSchema(
+                    room_id=availability_of_room.room_id,
+                    bitmap=availability_of_room.bitmap,
+                )
+                for availability_of_room in availability_of_rooms_dto
+            ]
+
+        return availability_of_rooms
 
     async def add_booking(
         self,
@@ -313,23 +483,32 @@ class BookingService(BookingServicePort):
             )
             new_booking: BaseBookingSchema = add_booking_domain_model.execute()
 
-            min_and_max_dts = MinAndMaxDtsValidator(
-                min_dt=new_booking.check_in_dt,
-                max_dt=new_booking.check_out_dt,
-            )
-            overlapping_bookings_dto: list[BookingDTO] = await self.booking_dao.get_bookings(
-                transaction_context=transaction_context,
-                min_and_max_dts=min_and_max_dts,
-                room_id=new_booking.room_id,
-                booking_overlaps=True,
-            )
-            add_booking_domain_model.check_room_availability(overlapping_bookings=overlapping_bookings_dto)
+            # Overlapping bookings are rejected by the exclusion constraint
+            #   of the "bookings" table, so the availability of the room
+            #   is checked only after the insert has failed
+            try:
+                booking_dto: BookingDTO = await self.booking_dao.add_booking(
+                    transaction_context=transaction_context,
+                    booking=new_booking,
+                )
 
-            booking_dto: BookingDTO = await self.booking_dao.insert_item(
-                transaction_context=transaction_context,
-                table_name="bookings",
-                item_data=new_booking,
-            )
+            except RoomAlreadyBookedError as error:
+                await transaction_context.rollback()
+
+                min_and_max_dts = MinAndMaxDtsValidator(
+                    min_dt=new_booking.check_in_dt,
+                    max_dt=new_booking.check_out_dt,
+                )
+                overlapping_bookings_dto: list[BookingDTO] = await self.booking_dao.get_bookings(
+                    transaction_context=transaction_context,
+                    min_and_max_dts=min_and_max_dts,
+                    room_id=new_booking.room_id,
+                    booking_overlaps=True,
+                )
+                add_booking_domain_model.check_room_availability(overlapping_bookings=overlapping_bookings_dto)
+
+                # The overlapping booking was deleted after the insert failed
+                raise error
 
             await transaction_context.commit()
 
@@ -1,6 +1,11 @@
-from datetime import date, datetime, timedelta
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime, time, timedelta
+from typing import Any
 
-from pydantic import BaseModel, model_validator, EmailStr
+from pydantic import BaseModel, PrivateAttr, model_validator, EmailStr
+
+import binascii
+import json
 
 from app.settings import settings
 
@@ -148,3 +153,112 @@ class CheckInAndCheckOutValidator(BaseModel):
                 )
 
         return self
+
+    @property
+    def check_in_dt(self) -> datetime | None:
+        return self.check_in_date and datetime.combine(
+            date=self.check_in_date,
+            time=time(hour=settings.CHECK_IN_TIME, tzinfo=settings.DB_TIME_ZONE),
+        )
+
+    @property
+    def check_out_dt(self) -> datetime | None:
+        return self.check_out_date and datetime.combine(
+            date=self.check_out_date,
+            time=time(hour=settings.CHECK_OUT_TIME, tzinfo=settings.DB_TIME_ZONE),
+        )
+
+
+class StayPeriodValidator(CheckInAndCheckOutValidator):
+    check_in_date: date | None = None
+    check_out_date: date | None = None
+
+    @model_validator(mode="after")
+    def completeness_of_stay_period_validator(self) -> "StayPeriodValidator":
+        """
+        Check that the check-in and check-out dates
+        are passed together or not passed at all.
+
+        return: Schema of check-in and check-out dates.
+        raise: DataValidationError
+        """
+
+        if (self.check_in_date is None) != (self.check_out_date is None):
+            raise DataValidationError(
+                message="Check-in and check-out dates must be passed together.",
+                extras={
+                    "check_in_date": self.check_in_date and self.check_in_date.strftime("%Y-%m-%d"),
+                    "check_out_date": self.check_out_date and self.check_out_date.strftime("%Y-%m-%d"),
+                },
+            )
+
+        return self
+
+    @property
+    def is_set(self) -> bool:
+        return self.check_in_date is not None and self.check_out_date is not None
+
+
+class PaginationValidator(BaseModel):
+    limit: int = settings.DEFAULT_PAGE_SIZE
+    cursor: str | None = None
+
+    _last_id: int | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def page_size_and_cursor_validator(self) -> "PaginationValidator":
+        """
+        Check the page size limits and decode the pagination cursor.
+
+        return: Schema of pagination.
+        raise: DataValidationError
+        """
+
+        if not 1 <= self.limit <= settings.MAX_PAGE_SIZE:
+            raise DataValidationError(
+                message=f"The page size must be between 1 and {settings.MAX_PAGE_SIZE}.",
+                extras={
+                    "limit": self.limit,
+                },
+            )
+
+        if self.cursor is not None:
+            try:
+                self._last_id = json.loads(urlsafe_b64decode(self.cursor.encode()))["id"]
+
+            except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError):
+                self._last_id = None
+
+            if not isinstance(self._last_id, int):
+                raise DataValidationError(
+                    message="The pagination cursor is invalid.",
+                    extras={
+                        "cursor": self.cursor,
+                    },
+                )
+
+        return self
+
+    @property
+    def last_id(self) -> int | None:
+        return self._last_id
+
+    @staticmethod
+    def encode_cursor(last_id: int) -> str:
+        return urlsafe_b64encode(json.dumps({"id": last_id}).encode()).decode()
+
+    def get_next_cursor(self, items: list[Any]) -> str | None:
+        """
+        Get a cursor to the page following the page of the passed items,
+        which are selected with one extra item beyond the page size.
+
+        return: cursor of next page.
+        """
+
+        next_cursor = None
+        if len(items) > self.limit:
+            last_item = items[self.limit - 1]
+            last_id = last_item["id"] if isinstance(last_item, dict) else last_item.id
+            next_cursor = self.encode_cursor(last_id=last_id)
+
+        return next_cursor
@@ -32,7 +32,7 @@ class ResourceManagerService(ResourceManagerServicePort):
         :return: entity.
         """
 
-        transaction_context = self.transaction_context_factory.init_transaction_context()
+        transaction_context = self.transaction_context_factory.init_transaction_context(read_only=True)
         async with transaction_context():
             entity: dict[str, Any] | None = await self.resource_manager_dao.get_item_by_id(
                 transaction_context=transaction_context,
@@ -62,7 +62,7 @@ class ResourceManagerService(ResourceManagerServicePort):
         :return: entities.
         """
 
-        transaction_context = self.transaction_context_factory.init_transaction_context()
+        transaction_context = self.transaction_context_factory.init_transaction_context(read_only=True)
         async with transaction_context():
             entity: list[dict[str, Any]] = await self.resource_manager_dao.get_items_by_filters(
                 transaction_context=transaction_context,
@@ -1,10 +1,15 @@
 from datetime import datetime
+from hashlib import blake2b
+from math import floor
+from typing import Any
 
 from fastapi import Depends, Request
 from jose import jwt, JWTError
 
 from app.settings import settings
 
+from app.utils.redis.local_cache import LocalCache
+
 from app.adapters.primary.api.version_1.authorization.exceptions import (
     TokenMissingError,
     InvalidTokenError,
@@ -27,20 +32,49 @@ def get_access_token(request: Request) -> str:
     return access_token
 
 
-def get_user_id(access_token: str = Depends(get_access_token)) -> int:
+# Payloads of verified tokens of the worker,
+#   entries are kept no longer than until tokens expire
+verified_token_cache = LocalCache(
+    max_size=settings.VERIFIED_TOKEN_CACHE_MAX_SIZE,
+    retention_time_seconds=settings.VERIFIED_TOKEN_CACHE_RETENTION_TIME_SECONDS,
+)
+
+
+def get_token_payload(access_token: str) -> dict[str, Any]:
     """
-    Get the ID of the user who sent the request.
+    Get the payload of the token with the verified signature.
+    The signature of the token is verified once while its payload is in the cache of verified tokens.
 
-    :return: user ID.
+    :return: token payload.
     """
 
-    try:
+    token_digest = blake2b(access_token.encode("utf-8"), digest_size=16).hexdigest()
+
+    _, token_payload = verified_token_cache.get_with_ttl(token_digest)
+    if token_payload is None:
         token_payload = jwt.decode(
             token=access_token,
             key=settings.SECRET_KEY.get_secret_value(),
             algorithms=settings.ALGORITHM.get_secret_value(),
         )
 
+        retention_time_seconds = floor(float(token_payload.get("exp", 0)) - datetime.now().timestamp())
+        if retention_time_seconds > 0:
+            verified_token_cache.set(token_digest, token_payload, expire=retention_time_seconds)
+
+    return token_payload
+
+
+def get_user_id(access_token: str = Depends(get_access_token)) -> int:
+    """
+    Get the ID of the user who sent the request.
+
+    :return: user ID.
+    """
+
+    try:
+        token_payload = get_token_payload(access_token=access_token)
+
         token_expires = int(token_payload["exp"])
         user_id = int(token_payload["sub"])
 
@@ -65,11 +99,7 @@ def check_is_user_admin(access_token: str = Depends(get_access_token)) -> bool:
     """
 
     try:
-        token_payload = jwt.decode(
-            token=access_token,
-            key=settings.SECRET_KEY.get_secret_value(),
-            algorithms=settings.ALGORITHM.get_secret_value(),
-        )
+        token_payload = get_token_payload(access_token=access_token)
 
         is_admin = bool(int(token_payload["admin"]))
 
@@ -7,6 +7,8 @@ from app.core.services.authorization.service import AuthorizationService
 
 from app.dependencies.base import get_transaction_context_factory
 
+from app.utils.redis.redis_controller import redis_controller
+
 
 def get_authorization_dao() -> AuthorizationDAO:
     """
@@ -15,7 +17,7 @@ def get_authorization_dao() -> AuthorizationDAO:
     :return: authorization DAO.
     """
 
-    dao = AuthorizationDAO()
+    dao = AuthorizationDAO(cache_invalidator=redis_controller)
 
     return dao
 
@@ -1,9 +1,12 @@
+from collections.abc import AsyncIterator
+
 from fastapi import Depends
 
 from sqlalchemy.orm import sessionmaker
 
-from app.adapters.secondary.db.dao.transaction_context import StaticAsyncTransactionContextFactory
-from app.adapters.secondary.db.session import async_session_maker
+from app.adapters.secondary.db.dao.transaction_context import RequestAsyncTransactionContextFactory
+from app.adapters.secondary.db.replicas import ReplicaSessionMakers
+from app.adapters.secondary.db.session import async_replica_session_makers, async_session_maker
 
 
 def get_async_session_maker() -> sessionmaker:
@@ -16,15 +19,34 @@ def get_async_session_maker() -> sessionmaker:
     return async_session_maker
 
 
-def get_transaction_context_factory(
+def get_async_replica_session_makers() -> ReplicaSessionMakers:
+    """
+    Get session-makers of read replicas.
+
+    :return: ReplicaSessionMakers
+    """
+
+    return async_replica_session_makers
+
+
+async def get_transaction_context_factory(
     async_session_maker: sessionmaker = Depends(get_async_session_maker),
-) -> StaticAsyncTransactionContextFactory:
+    async_replica_session_makers: ReplicaSessionMakers = Depends(get_async_replica_session_makers),
+) -> AsyncIterator[RequestAsyncTransactionContextFactory]:
     """
-    Get factory of transaction contexts.
+    Get factory of transaction contexts of the request,
+    the connection of the request is returned to the pool after each outermost transaction context
+    and is released after the request is handled anyway.
 
     :return: transaction context factory.
     """
 
-    transaction_context_factory = StaticAsyncTransactionContextFactory(session_maker=async_session_maker)
+    transaction_context_factory = RequestAsyncTransactionContextFactory(
+        session_maker=async_session_maker,
+        replica_session_makers=async_replica_session_makers,
+    )
+    try:
+        yield transaction_context_factory
 
-    return transaction_context_factory
+    finally:
+        await transaction_context_factory.close()
@@ -7,6 +7,8 @@ from app.core.services.bookings.service import BookingService
 
 from app.dependencies.base import get_transaction_context_factory
 
+from app.utils.redis.redis_controller import redis_controller
+
 
 def get_booking_dao() -> BookingDAO:
     """
@@ -15,7 +17,7 @@ def get_booking_dao() -> BookingDAO:
     :return: booking DAO.
     """
 
-    dao = BookingDAO()
+    dao = BookingDAO(cache_invalidator=redis_controller)
 
     return dao
 
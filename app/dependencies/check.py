@@ -1,6 +1,14 @@
-from datetime import datetime
+from datetime import date, datetime
 
-from app.core.services.check.schemas import HotelsOrRoomsValidator, MinAndMaxDtsValidator, PriceRangeValidator
+from app.settings import settings
+
+from app.core.services.check.schemas import (
+    HotelsOrRoomsValidator,
+    MinAndMaxDtsValidator,
+    PaginationValidator,
+    PriceRangeValidator,
+    StayPeriodValidator,
+)
 
 
 def get_only_for_hotels_and_only_for_rooms(
@@ -49,3 +57,35 @@ def get_min_and_max_dts(
         min_dt=min_dt,
         max_dt=max_dt,
     )
+
+
+def get_check_in_and_check_out(
+    check_in_date: date = None,
+    check_out_date: date = None,
+) -> StayPeriodValidator:
+    """
+    Get validator of stay period to filter room's query by availability.
+
+    :return: StayPeriodValidator
+    """
+
+    return StayPeriodValidator(
+        check_in_date=check_in_date,
+        check_out_date=check_out_date,
+    )
+
+
+def get_pagination(
+    limit: int = settings.DEFAULT_PAGE_SIZE,
+    cursor: str = None,
+) -> PaginationValidator:
+    """
+    Get validator of page size and cursor to paginate list queries.
+
+    :return: PaginationValidator
+    """
+
+    return PaginationValidator(
+        limit=limit,
+        cursor=cursor,
+    )
@@ -7,6 +7,8 @@ from app.core.services.resource_manager.service import ResourceManagerService
 
 from app.dependencies.base import get_transaction_context_factory
 
+from app.utils.redis.redis_controller import redis_controller
+
 
 def get_resource_manager_dao() -> ResourceManagerDAO:
     """
@@ -15,7 +17,7 @@ def get_resource_manager_dao() -> ResourceManagerDAO:
     :return: resource manager DAO.
     """
 
-    dao = ResourceManagerDAO()
+    dao = ResourceManagerDAO(cache_invalidator=redis_controller)
 
     return dao
 
@@ -3,15 +3,26 @@ from typing import AsyncIterator, Coroutine
 
 from fastapi import FastAPI
 from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
 from redis import asyncio as aioredis
 from loguru import logger
 
+import asyncio
 import sentry_sdk
 
 from app.settings import settings
 
-from app.adapters.secondary.db.session import async_engine, async_session_maker, sync_engine, sync_session_maker
+from app.adapters.secondary.db.session import (
+    async_engine,
+    async_replica_session_makers,
+    async_session_maker,
+    sync_engine,
+    sync_session_maker,
+)
+
+from app.utils.redis.backends import LocalAndRedisBackend
+from app.utils.redis.coders import CompressedORJsonCoder
+from app.utils.redis.local_cache import LocalCache
+from app.utils.redis.redis_controller import redis_controller
 
 
 @asynccontextmanager
@@ -23,10 +34,28 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     if settings.CACHING:
         # Initializing a connection to redis
         redis = aioredis.from_url(url=settings.REDIS_URL)
+        cache_backend = LocalAndRedisBackend(
+            redis=redis,
+            local_cache=LocalCache(
+                max_size=settings.LOCAL_CACHE_MAX_SIZE,
+                retention_time_seconds=settings.LOCAL_CACHE_RETENTION_TIME_SECONDS,
+            ),
+            local_namespaces=(f"{settings.CACHE_PREFIX}:{settings.LOCAL_CACHE_NAMESPACE}",),
+        )
         FastAPICache.init(
-            backend=RedisBackend(redis=redis),
-            prefix="cache",
+            backend=cache_backend,
+            prefix=settings.CACHE_PREFIX,
+            coder=CompressedORJsonCoder,
         )
+        redis_controller.registering_backend_to_controller(backend=cache_backend)
+
+        # Dropping stale entries of the in-process cache
+        #   on invalidations from other workers
+        invalidation_listener = asyncio.create_task(cache_backend.listen_to_invalidations())
+
+    if async_replica_session_makers:
+        # Excluding unavailable replicas from routing of read-only transactions
+        replica_health_checker = asyncio.create_task(async_replica_session_makers.keep_checking_health())
 
     if settings.SENTRY_TRACKING:
         # Initializing a connection to sentry
@@ -53,7 +82,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         ]
 
         if settings.CACHING:
-            connection_killers.append(redis.close)
+            connection_killers.extend([invalidation_listener.cancel, redis.close])
+
+        if async_replica_session_makers:
+            connection_killers.extend([replica_health_checker.cancel, async_replica_session_makers.dispose])
 
         for connection_killer in connection_killers:
             try:
@@ -1,15 +1,26 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import Any
 
+from app.core.services.base.schemas import PageResponseSchema
 from app.core.services.bookings.schemas import (
+    AvailabilityRequestSchema,
     BookingRequestSchema,
     BookingResponseSchema,
     ExtendedBookingResponseSchema,
     ExtendedHotelResponseSchema,
     ExtendedRoomResponseSchema,
     PremiumLevelVarietyResponseSchema,
+    RoomAvailabilityResponseSchema,
     ServiceVarietyResponseSchema,
 )
-from app.core.services.check.schemas import HotelsOrRoomsValidator, MinAndMaxDtsValidator, PriceRangeValidator
+from app.core.services.check.schemas import (
+    HotelsOrRoomsValidator,
+    MinAndMaxDtsValidator,
+    PaginationValidator,
+    PriceRangeValidator,
+    StayPeriodValidator,
+)
 
 
 class BookingServicePort(ABC):
@@ -30,7 +41,18 @@ class BookingServicePort(ABC):
         number_of_guests: int | None = None,
         stars: int | None = None,
         services: list[int] | None = None,
-    ) -> list[ExtendedHotelResponseSchema]: ...
+        pagination: PaginationValidator | None = None,
+        serializable: bool = False,
+    ) -> PageResponseSchema[ExtendedHotelResponseSchema] | dict[str, Any]: ...
+
+    @abstractmethod
+    def stream_hotels(
+        self,
+        location: str | None = None,
+        number_of_guests: int | None = None,
+        stars: int | None = None,
+        services: list[int] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]: ...
 
     @abstractmethod
     async def get_premium_levels(
@@ -47,7 +69,21 @@ class BookingServicePort(ABC):
         number_of_guests: int = None,
         services: list[int] | None = None,
         premium_levels: list[int] | None = None,
-    ) -> list[ExtendedRoomResponseSchema]: ...
+        check_in_and_check_out: StayPeriodValidator | None = None,
+        pagination: PaginationValidator | None = None,
+        serializable: bool = False,
+    ) -> PageResponseSchema[ExtendedRoomResponseSchema] | dict[str, Any]: ...
+
+    @abstractmethod
+    def stream_rooms(
+        self,
+        min_price_and_max_price: PriceRangeValidator,
+        hotel_id: int = None,
+        number_of_guests: int = None,
+        services: list[int] | None = None,
+        premium_levels: list[int] | None = None,
+        check_in_and_check_out: StayPeriodValidator | None = None,
+    ) -> AsyncIterator[dict[str, Any]]: ...
 
     @abstractmethod
     async def get_bookings(
@@ -55,7 +91,23 @@ class BookingServicePort(ABC):
         user_id: int,
         min_and_max_dts: MinAndMaxDtsValidator,
         number_of_guests: int = None,
-    ) -> list[ExtendedBookingResponseSchema]: ...
+        pagination: PaginationValidator | None = None,
+        serializable: bool = False,
+    ) -> PageResponseSchema[ExtendedBookingResponseSchema] | dict[str, Any]: ...
+
+    @abstractmethod
+    def stream_bookings(
+        self,
+        user_id: int,
+        min_and_max_dts: MinAndMaxDtsValidator,
+        number_of_guests: int = None,
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+    @abstractmethod
+    async def get_availability_of_rooms(
+        self,
+        availability_data: AvailabilityRequestSchema,
+    ) -> list[RoomAvailabilityResponseSchema]: ...
 
     @abstractmethod
     async def add_booking(
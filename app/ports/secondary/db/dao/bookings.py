@@ -1,16 +1,28 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import Any
 
 from app.ports.secondary.db.dao.base import BaseDAOPort
 
-from app.core.interfaces.transaction_context import IStaticSyncTransactionContext
+from app.core.interfaces.transaction_context import IStaticAsyncTransactionContext, IStaticSyncTransactionContext
 from app.core.services.bookings.dtos import (
+    BookingDTO,
     ExtendedBookingDTO,
     ExtendedHotelDTO,
     ExtendedRoomDTO,
     PremiumLevelVarietyDTO,
+    RoomAvailabilityDTO,
     ServiceVarietyDTO,
 )
-from app.core.services.check.schemas import HotelsOrRoomsValidator, MinAndMaxDtsValidator, PriceRangeValidator
+from app.core.services.bookings.schemas import BaseBookingSchema
+from app.core.services.check.schemas import (
+    CheckInAndCheckOutValidator,
+    HotelsOrRoomsValidator,
+    MinAndMaxDtsValidator,
+    PaginationValidator,
+    PriceRangeValidator,
+    StayPeriodValidator,
+)
 
 
 class BookingDAOPort(BaseDAOPort, ABC):
@@ -33,7 +45,19 @@ class BookingDAOPort(BaseDAOPort, ABC):
         number_of_guests: int | None = None,
         stars: int | None = None,
         services: list[int] | None = None,
-    ) -> list[ExtendedHotelDTO]: ...
+        pagination: PaginationValidator | None = None,
+        serializable: bool = False,
+    ) -> list[ExtendedHotelDTO] | list[dict[str, Any]]: ...
+
+    @abstractmethod
+    def stream_hotels(
+        self,
+        transaction_context: IStaticAsyncTransactionContext,
+        location: str | None = None,
+        number_of_guests: int | None = None,
+        stars: int | None = None,
+        services: list[int] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]: ...
 
     @abstractmethod
     async def get_premium_levels(
@@ -52,7 +76,23 @@ class BookingDAOPort(BaseDAOPort, ABC):
         number_of_guests: int = None,
         services: list[int] | None = None,
         premium_levels: list[int] | None = None,
-    ) -> list[ExtendedRoomDTO]: ...
+        check_in_and_check_out: StayPeriodValidator | None = None,
+        pagination: PaginationValidator | None = None,
+        aggregated_services: bool = True,
+        serializable: bool = False,
+    ) -> list[ExtendedRoomDTO] | list[dict[str, Any]]: ...
+
+    @abstractmethod
+    def stream_rooms(
+        self,
+        transaction_context: IStaticAsyncTransactionContext,
+        min_price_and_max_price: PriceRangeValidator,
+        hotel_id: int = None,
+        number_of_guests: int = None,
+        services: list[int] | None = None,
+        premium_levels: list[int] | None = None,
+        check_in_and_check_out: StayPeriodValidator | None = None,
+    ) -> AsyncIterator[dict[str, Any]]: ...
 
     @abstractmethod
     async def get_bookings(
@@ -63,4 +103,43 @@ class BookingDAOPort(BaseDAOPort, ABC):
         user_id: int | None = None,
         room_id: int | None = None,
         booking_overlaps: bool = False,
-    ) -> list[ExtendedBookingDTO]: ...
+        pagination: PaginationValidator | None = None,
+        serializable: bool = False,
+    ) -> list[ExtendedBookingDTO] | list[dict[str, Any]]: ...
+
+    @abstractmethod
+    def stream_bookings(
+        self,
+        transaction_context: IStaticAsyncTransactionContext,
+        min_and_max_dts: MinAndMaxDtsValidator,
+        number_of_guests: int = None,
+        user_id: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+    @abstractmethod
+    async def get_availability_of_rooms(
+        self,
+        transaction_context: IStaticSyncTransactionContext,
+        room_ids: list[int],
+        stay_periods: list[CheckInAndCheckOutValidator],
+    ) -> list[RoomAvailabilityDTO]: ...
+
+    @abstractmethod
+    async def add_booking(
+        self,
+        transaction_context: IStaticSyncTransactionContext,
+        booking: BaseBookingSchema,
+    ) -> BookingDTO: ...
+
+    @abstractmethod
+    async def refresh_room_occupancy_of_booking(
+        self,
+        transaction_context: IStaticAsyncTransactionContext,
+        booking_id: int,
+    ) -> None: ...
+
+    @abstractmethod
+    async def rebuild_room_occupancy(
+        self,
+        transaction_context: IStaticSyncTransactionContext,
+    ) -> int: ...
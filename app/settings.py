@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,6 +20,8 @@ class Settings(BaseSettings):
     PORT: int = 1500
     API_PREFIX: str = "/api"
     PATH_OF_PYPROJECT: str = "pyproject.toml"
+    DEFAULT_PAGE_SIZE: int = Field(default=100, ge=1)
+    MAX_PAGE_SIZE: int = Field(default=1000, ge=1)
 
     # Unicorn
     RELOAD: bool = False
@@ -33,6 +35,20 @@ class Settings(BaseSettings):
     HOST_MACHINE_DB_PORT: int = 5432
     DB_TIME_ZONE_OFFSET_HOURS: int = Field(default=0, ge=-12, le=14)
     DB_TIME_ZONE_NAME: str = "UTC"
+    DB_STREAM_YIELD_PER: int = Field(default=500, ge=1)
+    DB_POOL_SIZE: int = Field(default=5, ge=1)
+    DB_POOL_MAX_OVERFLOW: int = Field(default=10, ge=0)
+    DB_POOL_TIMEOUT_SECONDS: float = Field(default=30, gt=0)
+    DB_POOL_RECYCLE_SECONDS: int = Field(default=1800, ge=-1)
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = Field(default=100, ge=0)
+    DB_STATEMENT_TIMEOUT_MS: int = Field(default=30_000, ge=0)
+    DB_APPLICATION_NAME: str = "hotel_rental"
+    DB_REPLICA_HOSTS: list[str] = []
+    DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS: float = Field(default=5, gt=0)
+    DB_REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS: float = Field(default=2, gt=0)
+    DB_PGBOUNCER_MODE: bool = False
+    DB_PGBOUNCER_NULL_POOL: bool = True
     PATH_OF_ALEMBIC_INI: str = "alembic.ini"
 
     TEST_DB_NAME: str
@@ -50,8 +66,25 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "0.0.0.0"
     REDIS_PORT: int = 6379
     HOST_MACHINE_REDIS_PORT: int = 6379
+    CACHE_PREFIX: str = "cache"
     CACHE_RETENTION_TIME_SECONDS: int = Field(default=60, ge=1)
+    LOCAL_CACHE_NAMESPACE: str = "local"
+    LOCAL_CACHE_MAX_SIZE: int = Field(default=1024, ge=1)
+    LOCAL_CACHE_RETENTION_TIME_SECONDS: int = Field(default=300, ge=1)
+    CACHE_INVALIDATION_CHANNEL: str = "cache_invalidation"
+    CACHE_STALE_WHILE_REVALIDATE_SECONDS: int = Field(default=30, ge=0)
+    CACHE_LOCK_TIMEOUT_SECONDS: float = Field(default=10, gt=0)
+    CACHE_LOCK_POLLING_INTERVAL_SECONDS: float = Field(default=0.05, gt=0)
+    CACHE_COMPRESSION_THRESHOLD_BYTES: int = Field(default=1024, ge=0)
+    CACHE_COMPRESSION_LEVEL: int = Field(default=1, ge=0, le=9)
+    HTTP_CACHE_MAX_AGE_SECONDS: int = Field(default=0, ge=0)
     WARM_UP_CACHE: bool = False
+    WARM_UP_CACHE_CONCURRENCY: int = Field(default=8, ge=1)
+    WARM_UP_CACHE_HOT_PARAMS: dict[str, list[dict[str, Any]]] = {}
+    HOT_KEYS_SAMPLE_RATE: float = Field(default=0.1, gt=0, le=1)
+    HOT_KEYS_TOP_K: int = Field(default=10, ge=1)
+    HOT_KEYS_DECAY_FACTOR: float = Field(default=0.5, gt=0, le=1)
+    HOT_KEYS_MAX_SIZE: int = Field(default=1000, ge=1)
 
     # Celery
     FLOWER_PORT: int = 5555
@@ -68,6 +101,10 @@ class Settings(BaseSettings):
     ALGORITHM: SecretStr
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, ge=1)
     ACCESS_TOKEN_COOKIE: str = "hotel_rental_access_token"
+    VERIFIED_TOKEN_CACHE_MAX_SIZE: int = Field(default=10_000, ge=1)
+    VERIFIED_TOKEN_CACHE_RETENTION_TIME_SECONDS: int = Field(default=300, ge=1)
+    BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
+    PASSWORD_HASHING_WORKERS: int = Field(default=2, ge=1)
 
     # Business logic
     CHECK_IN_TIME: int = Field(default=14, ge=0, le=21)
@@ -76,6 +113,9 @@ class Settings(BaseSettings):
     MAX_RENTAL_INTERVAL_DAYS: int = Field(default=180, ge=1)
     BOOKING_CANCELLATION_AVAILABILITY_HOURS: int = Field(default=72, ge=0)
     NOTIFICATION_ABOUT_SOON_BOOKING_HOURS: int = Field(default=24, ge=24)
+    MAX_AVAILABILITY_ROOMS: int = Field(default=500, ge=1)
+    MAX_AVAILABILITY_STAY_PERIODS: int = Field(default=366, ge=1)
+    ROOM_OCCUPANCY_LEAD_TIME_DAYS: int = Field(default=365, ge=1)
 
     # Media
     PATH_OF_MEDIA: str = "media"
@@ -156,6 +196,23 @@ class Settings(BaseSettings):
 
         return url
 
+    @property
+    def DB_REPLICA_SECRET_URLS(self):
+        if self.MODE == "test":
+            urls = []
+
+        else:
+            urls = [
+                (
+                    f"postgresql+asyncpg://"
+                    f"{self.POSTGRES_USER.get_secret_value()}:{self.POSTGRES_PASSWORD.get_secret_value()}"
+                    f"@{replica_host}/{self.POSTGRES_DB}"
+                )
+                for replica_host in self.DB_REPLICA_HOSTS
+            ]
+
+        return urls
+
     @property
     def SYNC_DB_URL(self):
         if self.MODE == "test":
@@ -1,8 +1,10 @@
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from sqlalchemy import ColumnCollection
+from starlette.requests import Request
 
 from app.utils.admin_panel.tools import get_model_view_name
+from app.utils.redis.redis_controller import redis_controller
 
 
 class BaseCustomView:
@@ -10,6 +12,11 @@ class BaseCustomView:
 
 
 class BaseCustomModelView(BaseCustomView):
+    """
+    Base of model views, it precedes ModelView in the bases of a view
+    so that its hooks override the ones of ModelView.
+    """
+
     model: ClassVar[type]
 
     @property
@@ -19,3 +26,23 @@ class BaseCustomModelView(BaseCustomView):
     @property
     def model_columns(self) -> ColumnCollection:
         return self.model.get_columns()
+
+    async def after_model_change(self, data: dict, model: Any, is_created: bool, request: Request) -> None:
+        """
+        Invalidate cached responses depending on the changed item.
+        """
+
+        await redis_controller.invalidate_cache_of_item(
+            table_name=self.model.__tablename__,
+            item_id=getattr(model, "id", None),
+        )
+
+    async def after_model_delete(self, model: Any, request: Request) -> None:
+        """
+        Invalidate cached responses depending on the deleted item.
+        """
+
+        await redis_controller.invalidate_cache_of_item(
+            table_name=self.model.__tablename__,
+            item_id=getattr(model, "id", None),
+        )
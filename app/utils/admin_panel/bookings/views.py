@@ -1,4 +1,7 @@
+from typing import Any
+
 from sqladmin import ModelView
+from starlette.requests import Request
 
 from app.adapters.secondary.db.models.bookings_model import BookingsModel
 from app.adapters.secondary.db.models.hotels_model import HotelsModel
@@ -10,12 +13,16 @@ from app.adapters.secondary.db.models.rooms_services_model import RoomsServicesM
 from app.adapters.secondary.db.models.service_varieties_model import ServiceVarietiesModel
 from app.adapters.secondary.db.models.users_model import UsersModel
 
+from app.adapters.secondary.db.dao.bookings.dao import BookingDAO
+from app.adapters.secondary.db.dao.transaction_context import StaticAsyncTransactionContextFactory
+from app.adapters.secondary.db.session import async_session_maker
+
 from app.utils.admin_panel.base import BaseCustomModelView
 
 
 class BookingsModelView(
-    ModelView,
     BaseCustomModelView,
+    ModelView,
     model=BookingsModel,
 ):
     name_plural = BaseCustomModelView.name_plural
@@ -25,10 +32,30 @@ class BookingsModelView(
     column_export_list = BaseCustomModelView.model_columns
     form_columns = BaseCustomModelView.model_columns
 
+    transaction_context_factory = StaticAsyncTransactionContextFactory(session_maker=async_session_maker)
+    booking_dao = BookingDAO()
+
+    async def after_model_change(self, data: dict, model: Any, is_created: bool, request: Request) -> None:
+        """
+        Replace nights of the changed booking in the room occupancy
+        and invalidate cached responses depending on the booking.
+        """
+
+        transaction_context = self.transaction_context_factory.init_transaction_context()
+        async with transaction_context():
+            await self.booking_dao.refresh_room_occupancy_of_booking(
+                transaction_context=transaction_context,
+                booking_id=model.id,
+            )
+
+            await transaction_context.commit()
+
+        await super().after_model_change(data=data, model=model, is_created=is_created, request=request)
+
 
 class HotelsModelView(
-    ModelView,
     BaseCustomModelView,
+    ModelView,
     model=HotelsModel,
 ):
     name_plural = BaseCustomModelView.name_plural
@@ -40,8 +67,8 @@ class HotelsModelView(
 
 
 class HotelsServicesModelView(
-    ModelView,
     BaseCustomModelView,
+    ModelView,
     model=HotelsServicesModel,
 ):
     name_plural = BaseCustomModelView.name_plural
@@ -53,8 +80,8 @@ class HotelsServicesModelView(
 
 
 class ImagesModelView(
-    ModelView,
     BaseCustomModelView,
+    ModelView,
     model=ImagesModel,
 ):
     name_plural = BaseCustomModelView.name_plural
@@ -66,8 +93,8 @@ class ImagesModelView(
 
 
 class PremiumLevelVarietiesModelView(
-    ModelView,
     BaseCustomModelView,
+    ModelView,
     model=PremiumLevelVarietiesModel,
 ):
     name_plural = BaseCustomModelView.name_plural
@@ -79,8 +106,8 @@ class PremiumLevelVarietiesModelView(
 
 
 class RoomsModelView(
-    ModelView,
     BaseCustomModelView,
+    ModelView,
     model=RoomsModel,
 ):
     name_plural = BaseCustomModelView.name_plural
@@ -92,8 +119,8 @@ class RoomsModelView(
 
 
 class RoomsServicesModelView(
-    ModelView,
     BaseCustomModelView,
+    ModelView,
     model=RoomsServicesModel,
 ):
     name_plural = BaseCustomModelView.name_plural
@@ -105,8 +132,8 @@ class RoomsServicesModelView(
 
 
 class ServiceVarietiesModelView(
-    ModelView,
     BaseCustomModelView,
+    ModelView,
     model=ServiceVarietiesModel,
 ):
     name_plural = BaseCustomModelView.name_plural
@@ -118,8 +145,8 @@ class ServiceVarietiesModelView(
 
 
 class UsersModelView(
-    ModelView,
     BaseCustomModelView,
+    ModelView,
     model=UsersModel,
 ):
     name_plural = BaseCustomModelView.name_plural
@@ -11,9 +11,16 @@ celery_app = Celery(
     ],
 )
 
-beat_schedule = {}
+NUMBER_OF_SECONDS_PER_DAY = 86400
+
+# The rolling horizon of room occupancy is moved daily
+beat_schedule = {
+    "rebuild_room_occupancy": {
+        "task": "rebuild_room_occupancy",
+        "schedule": NUMBER_OF_SECONDS_PER_DAY,
+    },
+}
 if settings.NEED_TO_SENDING_EMAIL:
-    NUMBER_OF_SECONDS_PER_DAY = 86400
     beat_schedule["booking_reminders"] = {
         "task": "booking_reminders",
         "schedule": NUMBER_OF_SECONDS_PER_DAY,
@@ -1,12 +1,13 @@
 from array import array
 from collections import defaultdict
 from datetime import timedelta
+from typing import Any
 
 import asyncio
 
 from loguru import logger
 
-from app.main import app  # noqa: F401
+from app.main import app
 from app.settings import settings
 
 from app.utils.redis.redis_controller import redis_controller
@@ -87,6 +88,29 @@ def booking_reminders(
     return True
 
 
+@celery_controller.task(name="rebuild_room_occupancy")
+def rebuild_room_occupancy() -> int:
+    """
+    Rebuild the room occupancy, rolling its horizon to the current date.
+
+    :return: number of booked nights.
+    """
+
+    transaction_context = celery_controller.transaction_context_factory.init_transaction_context()
+    with transaction_context():
+        booking_dao = BookingDAO()
+
+        number_of_nights: int = asyncio.run(
+            booking_dao.rebuild_room_occupancy(transaction_context=transaction_context),
+        )
+
+        transaction_context.commit()
+
+    logger.info(f"Room occupancy is rebuilt with {number_of_nights} booked nights.")
+
+    return number_of_nights
+
+
 @celery_controller.task(name="warm_up_cache")
 def warm_up_cache():
     """
@@ -95,6 +119,27 @@ def warm_up_cache():
     :return: cache warm-up status.
     """
 
-    warm_up_status: bool = redis_controller.warm_up_cache()
+    warm_up_status: bool = asyncio.run(warm_up_cache_in_lifespan())
+
+    return warm_up_status
+
+
+async def warm_up_cache_in_lifespan() -> bool:
+    """
+    Warm up redis cache with the configured and the most frequent parameters of handlers
+    with connections to external resources opened by the application lifespan.
+
+    :return: cache warm-up status.
+    """
+
+    async with app.router.lifespan_context(app):
+        hot_params: dict[str, list[dict[str, Any]]] = await redis_controller.get_hot_params()
+        for handler_name, params in settings.WARM_UP_CACHE_HOT_PARAMS.items():
+            hot_params.setdefault(handler_name, [])
+            hot_params[handler_name].extend(
+                params_of_handler for params_of_handler in params if params_of_handler not in hot_params[handler_name]
+            )
+
+        warm_up_status: bool = await redis_controller.warm_up_cache(hot_params=hot_params)
 
     return warm_up_status
@@ -0,0 +1,56 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# Sizes of cache payloads before and after compression
+#   to estimate the memory used by cache entries
+cache_payload_raw_bytes = Counter(
+    name="cache_payload_raw_bytes",
+    documentation="Size of encoded cache payloads before compression.",
+    labelnames=("compressed",),
+)
+cache_payload_stored_bytes = Counter(
+    name="cache_payload_stored_bytes",
+    documentation="Size of cache payloads stored to the cache backend.",
+    labelnames=("compressed",),
+)
+cache_compression_ratio = Histogram(
+    name="cache_compression_ratio",
+    documentation="Ratio of the raw size to the stored size of compressed cache payloads.",
+    buckets=(1, 1.5, 2, 3, 4, 6, 8, 12, 16, 32),
+)
+
+# State of database connection pools
+#   to size pools against the number of workers and postgres backends
+db_pool_checked_out_connections = Gauge(
+    name="db_pool_checked_out_connections",
+    documentation="Number of connections checked out from the database pool.",
+    labelnames=("engine",),
+)
+db_pool_overflow_connections = Gauge(
+    name="db_pool_overflow_connections",
+    documentation="Number of connections opened beyond the size of the database pool.",
+    labelnames=("engine",),
+)
+db_pool_wait_seconds = Histogram(
+    name="db_pool_wait_seconds",
+    documentation="Time of waiting for a connection from the database pool.",
+    labelnames=("engine",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+# Load of the pool of password hashing
+#   to size the pool against the rate of logins and registrations
+password_hashing_queued_tasks = Gauge(
+    name="password_hashing_queued_tasks",
+    documentation="Number of password hashing tasks waiting for a thread of the pool.",
+)
+password_hashing_wait_seconds = Histogram(
+    name="password_hashing_wait_seconds",
+    documentation="Time of waiting of password hashing tasks for a thread of the pool.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+password_hashing_seconds = Histogram(
+    name="password_hashing_seconds",
+    documentation="Time of hashing and verification of passwords.",
+    labelnames=("operation",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
@@ -0,0 +1,342 @@
+from collections.abc import Iterable
+
+from fastapi_cache.backends.redis import RedisBackend
+from redis.asyncio.client import Redis
+from redis.exceptions import RedisError
+from loguru import logger
+
+import asyncio
+import orjson
+import uuid
+
+from app.settings import settings
+
+from app.utils.redis.local_cache import LocalCache
+from app.utils.redis.entry_context import CacheEntryContext, current_cache_entry
+
+# Setting the value of a key and adding the key to the sets of its tags,
+#   the retention time of a tag set is extended to the retention time of the key
+SET_WITH_TAGS_SCRIPT = """
+if tonumber(ARGV[2]) > 0 then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+for i = 2, #KEYS do
+    local ttl = redis.call('TTL', KEYS[i])
+    redis.call('SADD', KEYS[i], KEYS[1])
+    if tonumber(ARGV[2]) == 0 then
+        redis.call('PERSIST', KEYS[i])
+    elseif ttl == -2 or (ttl >= 0 and ttl < tonumber(ARGV[2])) then
+        redis.call('EXPIRE', KEYS[i], ARGV[2])
+    end
+end
+"""
+
+# Deleting tag sets with the keys they contain
+#   and returning the deleted keys
+INVALIDATE_TAGS_SCRIPT = """
+local keys = {}
+for _, tag_key in ipairs(KEYS) do
+    for _, key in ipairs(redis.call('SMEMBERS', tag_key)) do
+        table.insert(keys, key)
+    end
+    redis.call('DEL', tag_key)
+end
+for i = 1, #keys, 1000 do
+    redis.call('DEL', unpack(keys, i, math.min(i + 999, #keys)))
+end
+return keys
+"""
+
+# Deleting the lock only if it is still held by the token
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class LocalAndRedisBackend(RedisBackend):
+    """
+    Redis backend with the in-process cache in front of it for keys of local namespaces.
+    Keys are tagged with the tags of the current request to be invalidated by them.
+    Cleared entries are dropped from the in-process caches of all workers
+    through the redis channel of invalidations.
+
+    A missing or stale entry is computed by a single request across workers,
+    an in-process future coalesces requests of the worker
+    and a short redis lock coalesces workers.
+    Entries are kept for the stale-while-revalidate window after their expiration,
+    during which they are served while the computing request refreshes them.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        local_cache: LocalCache,
+        local_namespaces: tuple[str, ...] = (),
+        invalidation_channel: str = settings.CACHE_INVALIDATION_CHANNEL,
+        tag_prefix: str = f"{settings.CACHE_PREFIX}:tag",
+        lock_prefix: str = f"{settings.CACHE_PREFIX}:lock",
+        lock_timeout_seconds: float = settings.CACHE_LOCK_TIMEOUT_SECONDS,
+        lock_polling_interval_seconds: float = settings.CACHE_LOCK_POLLING_INTERVAL_SECONDS,
+    ):
+        super().__init__(redis=redis)
+        self.local_cache = local_cache
+        self.local_prefixes = tuple(f"{namespace}:" for namespace in local_namespaces)
+        self.invalidation_channel = invalidation_channel
+        self.tag_prefix = tag_prefix
+        self.lock_prefix = lock_prefix
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.lock_polling_interval_seconds = lock_polling_interval_seconds
+        self._computations: dict[str, asyncio.Future] = {}
+
+    def is_local(self, key: str) -> bool:
+        return bool(self.local_prefixes) and key.startswith(self.local_prefixes)
+
+    def get_tag_key(self, tag: str) -> str:
+        return f"{self.tag_prefix}:{tag}"
+
+    def get_lock_key(self, key: str) -> str:
+        return f"{self.lock_prefix}:{key}"
+
+    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        """
+        Get the fresh entry, the stale entry while another request refreshes it
+        or the entry computed by another request.
+        Nothing is returned if the current request has to compute the entry.
+
+        :return: remaining time until expiration and value of entry.
+        """
+
+        entry_context = current_cache_entry.get() or CacheEntryContext()
+        stale_seconds = entry_context.stale_while_revalidate_seconds
+
+        ttl, value = await self._get_stored_with_ttl(key=key, stale_seconds=stale_seconds)
+        if value is not None:
+            if ttl < 0 or ttl > stale_seconds:
+                return (ttl - stale_seconds if ttl > 0 else ttl), value
+
+            # Serving the stale entry unless the current request
+            #   becomes the only one refreshing it
+            if key not in self._computations and await self._start_computation(key=key, entry_context=entry_context):
+                return 0, None
+
+            # The entry is refreshed by another worker
+            if entry_context.computed_key == key:
+                self._finish_computation(entry_context=entry_context, value=value)
+
+            return 0, value
+
+        computation = self._computations.get(key)
+        if computation is not None:
+            return await self._wait_for_computation(computation=computation)
+
+        if await self._start_computation(key=key, entry_context=entry_context):
+            return 0, None
+
+        # The entry is computed by another worker
+        ttl, value = await self._wait_for_entry(key=key, stale_seconds=stale_seconds)
+        if value is not None:
+            self._finish_computation(entry_context=entry_context, ttl=ttl, value=value)
+
+        return ttl, value
+
+    async def _get_stored_with_ttl(self, key: str, stale_seconds: int) -> tuple[int, bytes | None]:
+        if self.is_local(key):
+            ttl, value = self.local_cache.get_with_ttl(key)
+            if value is not None and ttl > stale_seconds:
+                return ttl, value
+
+        ttl, value = await super().get_with_ttl(key)
+        if value is not None and self.is_local(key):
+            self.local_cache.set(key, value, expire=ttl if ttl > 0 else None)
+
+        return ttl, value
+
+    async def _start_computation(self, key: str, entry_context: CacheEntryContext) -> bool:
+        """
+        Make the current request responsible for computing the entry in the worker
+        and try to make it responsible across workers.
+
+        :return: whether the lock across workers is acquired.
+        """
+
+        self._computations[key] = asyncio.get_running_loop().create_future()
+        entry_context.computed_key = key
+
+        lock_token = uuid.uuid4().hex
+        is_locked = await self.redis.set(
+            self.get_lock_key(key=key),
+            lock_token,
+            nx=True,
+            px=int(self.lock_timeout_seconds * 1000),
+        )
+        if is_locked:
+            entry_context.lock_token = lock_token
+
+            return True
+
+        return False
+
+    async def _wait_for_computation(self, computation: asyncio.Future) -> tuple[int, bytes | None]:
+        try:
+            return await asyncio.wait_for(asyncio.shield(computation), timeout=self.lock_timeout_seconds)
+
+        except asyncio.TimeoutError:
+            return 0, None
+
+    async def _wait_for_entry(self, key: str, stale_seconds: int) -> tuple[int, bytes | None]:
+        """
+        Poll redis for the entry until the lock of another worker is released or expires.
+
+        :return: remaining time until expiration and value of entry.
+        """
+
+        lock_key = self.get_lock_key(key=key)
+        deadline = asyncio.get_running_loop().time() + self.lock_timeout_seconds
+        while asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(self.lock_polling_interval_seconds)
+
+            ttl, value = await super().get_with_ttl(key)
+            if value is not None and (ttl < 0 or ttl > stale_seconds):
+                return (ttl - stale_seconds if ttl > 0 else ttl), value
+
+            if not await self.redis.exists(lock_key):
+                break
+
+        return 0, None
+
+    def _finish_computation(self, entry_context: CacheEntryContext, ttl: int = 0, value: bytes | None = None) -> None:
+        computation = self._computations.pop(entry_context.computed_key, None)
+        if computation is not None and not computation.done():
+            computation.set_result((ttl, value))
+
+        entry_context.computed_key = None
+
+    async def finish_computation(self, entry_context: CacheEntryContext) -> None:
+        """
+        Release waiting requests and the lock
+        if the current request failed to compute the entry.
+        """
+
+        if entry_context.computed_key is not None:
+            lock_key = self.get_lock_key(key=entry_context.computed_key)
+            self._finish_computation(entry_context=entry_context)
+
+            if entry_context.lock_token is not None:
+                await self._release_lock(lock_key=lock_key, entry_context=entry_context)
+
+    async def _release_lock(self, lock_key: str, entry_context: CacheEntryContext) -> None:
+        await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, entry_context.lock_token)
+        entry_context.lock_token = None
+
+    async def get(self, key: str) -> bytes | None:
+        _, value = await self.get_with_ttl(key)
+
+        return value
+
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        """
+        Set the entry kept for the stale-while-revalidate window after its expiration
+        and release requests waiting for it.
+        """
+
+        entry_context = current_cache_entry.get() or CacheEntryContext()
+        retention_time_seconds = expire and expire + entry_context.stale_while_revalidate_seconds
+
+        if entry_context.tags:
+            await self.redis.eval(
+                SET_WITH_TAGS_SCRIPT,
+                1 + len(entry_context.tags),
+                key,
+                *(self.get_tag_key(tag=tag) for tag in entry_context.tags),
+                value,
+                retention_time_seconds or 0,
+            )
+
+        else:
+            await super().set(key, value, expire=retention_time_seconds)
+
+        if self.is_local(key):
+            self.local_cache.set(key, value, expire=retention_time_seconds)
+
+        if entry_context.computed_key == key:
+            lock_key = self.get_lock_key(key=key)
+            self._finish_computation(entry_context=entry_context, ttl=expire or -1, value=value)
+
+            if entry_context.lock_token is not None:
+                await self._release_lock(lock_key=lock_key, entry_context=entry_context)
+
+    async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        number_of_keys = await super().clear(namespace=namespace, key=key)
+
+        keys = [key] if key else []
+        await self.drop_local_entries(namespace=namespace, keys=keys)
+
+        return number_of_keys
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Delete keys tagged with any of the tags.
+
+        :return: number of deleted keys.
+        """
+
+        tag_keys = [self.get_tag_key(tag=tag) for tag in tags]
+        if not tag_keys:
+            return 0
+
+        keys: list[bytes] = await self.redis.eval(INVALIDATE_TAGS_SCRIPT, len(tag_keys), *tag_keys)
+        keys = [key.decode() for key in keys]
+
+        await self.drop_local_entries(keys=keys)
+
+        return len(keys)
+
+    async def drop_local_entries(self, namespace: str | None = None, keys: list[str] | None = None) -> None:
+        """
+        Drop entries of the namespace and the keys
+        from the in-process caches of this and other workers.
+        """
+
+        keys = keys or []
+        if namespace is None and not keys:
+            return
+
+        self._drop_local_entries(namespace=namespace, keys=keys)
+        await self.redis.publish(self.invalidation_channel, orjson.dumps({"namespace": namespace, "keys": keys}))
+
+    def _drop_local_entries(self, namespace: str | None, keys: list[str]) -> None:
+        if namespace:
+            self.local_cache.clear(namespace=namespace)
+
+        for key in keys:
+            self.local_cache.clear(key=key)
+
+    async def listen_to_invalidations(self, reconnection_delay_seconds: float = 1) -> None:
+        """
+        Drop entries of the in-process cache on messages of the invalidation channel.
+        All entries are dropped after each subscription,
+        since messages could be missed while the worker was not subscribed.
+        """
+
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.invalidation_channel)
+                    self.local_cache.clear()
+
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+
+                        invalidation = orjson.loads(message["data"])
+                        self._drop_local_entries(namespace=invalidation["namespace"], keys=invalidation["keys"])
+
+            except RedisError:
+                logger.warning(f"Subscription to the channel {self.invalidation_channel} is lost.")
+
+                await asyncio.sleep(reconnection_delay_seconds)
@@ -0,0 +1,97 @@
+from inspect import isclass
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache.coder import Coder, JsonCoder
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+import orjson
+import zlib
+
+from app.settings import settings
+
+from app.utils.prometheus.metrics import (
+    cache_compression_ratio,
+    cache_payload_raw_bytes,
+    cache_payload_stored_bytes,
+)
+
+
+def default_of_json(value: Any) -> Any:
+    """
+    Convert the value that is not serializable by orjson.
+
+    :return: json-serializable value.
+    """
+
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+
+    return jsonable_encoder(value)
+
+
+class CompressedORJsonCoder(Coder):
+    """
+    Coder of cache payloads encoded with orjson and compressed with zlib above the size threshold.
+    Payloads start with the magic header of their format,
+    payloads without it are decoded by the json coder so entries of the previous coder remain valid.
+    """
+
+    json_header = b"\x00json:"
+    zlib_header = b"\x00zlib:"
+    compression_threshold_bytes = settings.CACHE_COMPRESSION_THRESHOLD_BYTES
+    compression_level = settings.CACHE_COMPRESSION_LEVEL
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if isinstance(value, JSONResponse):
+            payload = bytes(value.body)
+        else:
+            payload = orjson.dumps(value, default=default_of_json, option=orjson.OPT_NON_STR_KEYS)
+
+        if len(payload) < cls.compression_threshold_bytes:
+            cache_payload_raw_bytes.labels(compressed="false").inc(len(payload))
+            cache_payload_stored_bytes.labels(compressed="false").inc(len(cls.json_header) + len(payload))
+
+            return cls.json_header + payload
+
+        compressed_payload = cls.zlib_header + zlib.compress(payload, level=cls.compression_level)
+
+        cache_payload_raw_bytes.labels(compressed="true").inc(len(payload))
+        cache_payload_stored_bytes.labels(compressed="true").inc(len(compressed_payload))
+        cache_compression_ratio.observe(len(payload) / len(compressed_payload))
+
+        return compressed_payload
+
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        if value.startswith((cls.json_header, cls.zlib_header)):
+            return orjson.loads(cls.get_payload(value))
+
+        return JsonCoder.decode(value)
+
+    @classmethod
+    def decode_as_type(cls, value: bytes, *, type_: Any) -> Any:
+        # Responses of functions returning json responses are built from the stored json bytes,
+        #   so cache hits skip decoding and validation against the response model
+        if isclass(type_) and issubclass(type_, Response):
+            return type_(content=cls.get_payload(value))
+
+        return cls.decode(value)
+
+    @classmethod
+    def get_payload(cls, value: bytes) -> bytes:
+        """
+        Get the json payload of the value without the magic header.
+
+        :return: json bytes.
+        """
+
+        if value.startswith(cls.json_header):
+            return value[len(cls.json_header) :]
+
+        if value.startswith(cls.zlib_header):
+            return zlib.decompress(value[len(cls.zlib_header) :])
+
+        return value
@@ -1,8 +1,14 @@
 from functools import wraps
 from inspect import iscoroutinefunction
-from typing import Callable
+from typing import Awaitable, Callable, Iterable
 
 from fastapi.concurrency import run_in_threadpool
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.utils.redis.entry_context import CacheEntryContext, current_cache_entry
+from app.utils.redis.etags import is_etag_matched
 
 
 class RedisDeroctorManager:
@@ -50,3 +56,87 @@ class RedisDeroctorManager:
             return inner
 
         return substitute_wrapper
+
+    @staticmethod
+    def with_entry_context(
+        tags: Iterable[str] | Callable[..., Iterable[str]],
+        stale_while_revalidate_seconds: int,
+        finish_computation: Callable[[CacheEntryContext], Awaitable[None]],
+        wrapper: Callable,
+    ):
+        """
+        Set the context of cache entries of function with static tags
+        or with tags built from function arguments
+        and finish the computation of the entry after the call.
+        """
+
+        @wraps(wrapper)
+        def substitute_wrapper(func: Callable):
+            inner = wrapper(func)
+
+            @wraps(inner)
+            async def inner_with_entry_context(*args, **kwargs):
+                tags_of_entry = tags(*args, **kwargs) if callable(tags) else tags
+                entry_context = CacheEntryContext(
+                    tags=tuple(tags_of_entry),
+                    stale_while_revalidate_seconds=stale_while_revalidate_seconds,
+                )
+                token = current_cache_entry.set(entry_context)
+                try:
+                    return await inner(*args, **kwargs)
+
+                finally:
+                    current_cache_entry.reset(token)
+                    await finish_computation(entry_context)
+
+            return inner_with_entry_context
+
+        return substitute_wrapper
+
+    @staticmethod
+    def with_conditional_response(
+        table_names: Iterable[str] | Callable[..., Iterable[str]],
+        get_etag: Callable[[Request, tuple[str, ...]], Awaitable[str | None]],
+        cache_control: str,
+        wrapper: Callable,
+    ):
+        """
+        Answer requests with the current entity tag in If-None-Match
+        with the 304 status before calling the function
+        and add the entity tag and cache control headers to other responses.
+        """
+
+        @wraps(wrapper)
+        def substitute_wrapper(func: Callable):
+            inner = wrapper(func)
+
+            @wraps(inner)
+            async def conditional_inner(*args, **kwargs):
+                request = next((value for value in kwargs.values() if isinstance(value, Request)), None)
+                if request is None:
+                    return await inner(*args, **kwargs)
+
+                tables_of_entry = table_names(*args, **kwargs) if callable(table_names) else table_names
+                etag = await get_etag(request, tuple(tables_of_entry))
+                if etag is None:
+                    return await inner(*args, **kwargs)
+
+                headers = {"ETag": etag, "Cache-Control": cache_control}
+                if is_etag_matched(if_none_match=request.headers.get("If-None-Match"), etag=etag):
+                    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+                result = await inner(*args, **kwargs)
+
+                response = (
+                    result
+                    if isinstance(result, Response)
+                    else next((value for value in kwargs.values() if isinstance(value, Response)), None)
+                )
+                if response is not None:
+                    response.headers.update(headers)
+
+                return result
+
+            return conditional_inner
+
+        return substitute_wrapper
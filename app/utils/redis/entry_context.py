@@ -0,0 +1,18 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheEntryContext:
+    """
+    Parameters and state of the cache entry served by the current request.
+    """
+
+    tags: tuple[str, ...] = ()
+    stale_while_revalidate_seconds: int = 0
+    computed_key: str | None = None
+    lock_token: str | None = None
+
+
+# Context of the cache entry served by the current request
+current_cache_entry: ContextVar[CacheEntryContext | None] = ContextVar("current_cache_entry", default=None)
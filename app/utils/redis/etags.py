@@ -0,0 +1,47 @@
+from collections.abc import Iterable
+
+from starlette.requests import Request
+
+import hashlib
+import orjson
+
+from app.utils.redis.hot_keys import get_params_signature
+
+
+def get_etag(request: Request, versions: Iterable[int]) -> str:
+    """
+    Get the weak entity tag of the response to the request
+    that changes with the versions of tables the response depends on.
+
+    :return: entity tag.
+    """
+
+    etag_data = orjson.dumps(
+        [
+            request.url.path,
+            get_params_signature(query_params=request.query_params.multi_items()),
+            list(versions),
+        ]
+    )
+    etag = f'W/"{hashlib.blake2b(etag_data, digest_size=16).hexdigest()}"'
+
+    return etag
+
+
+def is_etag_matched(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check whether the entity tag matches the If-None-Match header by weak comparison.
+
+    :return: whether the client has the current representation.
+    """
+
+    if not if_none_match:
+        return False
+
+    opaque_tag = etag.removeprefix("W/")
+    is_matched = any(
+        client_etag == "*" or client_etag.removeprefix("W/") == opaque_tag
+        for client_etag in (client_etag.strip() for client_etag in if_none_match.split(","))
+    )
+
+    return is_matched
@@ -0,0 +1,93 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from redis.asyncio.client import Redis
+
+import orjson
+
+from app.settings import settings
+
+
+def get_params_signature(query_params: Iterable[tuple[str, str]]) -> str:
+    """
+    Get the signature of query parameters independent of their order.
+
+    :return: json of sorted parameters with sorted values of repeated parameters.
+    """
+
+    map_of_params: dict[str, list[str]] = defaultdict(list)
+    for param_name, param_value in query_params:
+        if param_value != "":
+            map_of_params[param_name].append(param_value)
+
+    params = {
+        param_name: param_values[0] if len(param_values) == 1 else sorted(param_values)
+        for param_name, param_values in sorted(map_of_params.items())
+    }
+    signature = orjson.dumps(params).decode()
+
+    return signature
+
+
+class HotKeyRecorder:
+    """
+    Recorder of query parameter signatures of cached handlers
+    in redis sorted sets with scores decaying over time.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        prefix: str = f"{settings.CACHE_PREFIX}:hot",
+        max_size: int = settings.HOT_KEYS_MAX_SIZE,
+    ):
+        self.redis = redis
+        self.prefix = prefix
+        self.max_size = max_size
+
+    def get_hot_key(self, handler_name: str) -> str:
+        return f"{self.prefix}:{handler_name}"
+
+    async def record(self, handler_name: str, signature: str) -> None:
+        """
+        Increase the score of the signature of the handler.
+        """
+
+        await self.redis.zincrby(self.get_hot_key(handler_name=handler_name), 1, signature)
+
+    async def get_hot_params(self, handler_names: Iterable[str], top_k: int) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get the parameters of signatures with the highest scores of each handler.
+
+        :return: map of handler names and their hot parameters.
+        """
+
+        handler_names = list(handler_names)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for handler_name in handler_names:
+                pipe.zrevrange(self.get_hot_key(handler_name=handler_name), 0, top_k - 1)
+
+            signatures_of_handlers: list[list[bytes]] = await pipe.execute()
+
+        hot_params = {
+            handler_name: [orjson.loads(signature) for signature in signatures]
+            for handler_name, signatures in zip(handler_names, signatures_of_handlers)
+            if signatures
+        }
+
+        return hot_params
+
+    async def decay(self, handler_names: Iterable[str], decay_factor: float) -> None:
+        """
+        Multiply scores of signatures of handlers by the decay factor
+        and drop signatures with the lowest scores beyond the max size.
+        """
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for handler_name in handler_names:
+                hot_key = self.get_hot_key(handler_name=handler_name)
+                pipe.zunionstore(hot_key, {hot_key: decay_factor})
+                pipe.zremrangebyrank(hot_key, 0, -self.max_size - 1)
+
+            await pipe.execute()
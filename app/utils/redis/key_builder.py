@@ -0,0 +1,139 @@
+from collections.abc import Callable
+from functools import lru_cache
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from inspect import Parameter, signature
+from typing import Any
+
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response
+
+import hashlib
+import orjson
+
+# Parameters whose filters are case-insensitive
+CASE_INSENSITIVE_PARAMS = ("location",)
+
+# Types of values that define the response,
+#   values of other types are injected dependencies
+KEY_VALUE_TYPES = (str, int, float, Decimal, date, datetime, time, Enum, BaseModel, dict, list, tuple, set, frozenset)
+
+
+def get_normalized_value(value: Any, param_name: str | None = None) -> Any:
+    """
+    Get the canonical form of the parameter value,
+    lists of values are deduplicated and sorted since their order does not affect responses.
+
+    :return: json-serializable value.
+    """
+
+    if isinstance(value, BaseModel):
+        return get_normalized_params(params=value.model_dump(exclude_defaults=True))
+
+    if isinstance(value, dict):
+        return get_normalized_params(params=value)
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        normalized_values = {orjson.dumps(get_normalized_value(item), default=str): item for item in value}
+
+        return [get_normalized_value(normalized_values[key]) for key in sorted(normalized_values)]
+
+    if isinstance(value, Enum):
+        return get_normalized_value(value.value, param_name=param_name)
+
+    if isinstance(value, Decimal):
+        return str(value)
+
+    if isinstance(value, str) and param_name in CASE_INSENSITIVE_PARAMS:
+        return value.lower()
+
+    return value
+
+
+def get_normalized_params(params: dict[str, Any], defaults: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    Get parameters that define the response in the canonical form
+    without empty values, default values and injected dependencies.
+
+    :return: sorted map of parameter names and normalized values.
+    """
+
+    defaults = defaults or {}
+
+    normalized_params = {}
+    for param_name, value in sorted(params.items()):
+        if value is None or not isinstance(value, KEY_VALUE_TYPES):
+            continue
+
+        if param_name in defaults and value == defaults[param_name]:
+            continue
+
+        normalized_value = get_normalized_value(value, param_name=param_name)
+        if normalized_value not in ({}, []):
+            normalized_params[param_name] = normalized_value
+
+    return normalized_params
+
+
+@lru_cache
+def get_defaults_of_params(func: Callable[..., Any]) -> dict[str, Any]:
+    """
+    Get default values of parameters of the function.
+
+    :return: map of parameter names and default values.
+    """
+
+    defaults = {
+        param_name: param.default
+        for param_name, param in signature(func).parameters.items()
+        if param.default is not Parameter.empty
+    }
+
+    return defaults
+
+
+@lru_cache
+def is_reading_request(func: Callable[..., Any]) -> bool:
+    """
+    Check whether the function takes the request as a parameter.
+
+    :return: whether the request is a parameter of function.
+    """
+
+    is_reading = any(param.annotation is Request for param in signature(func).parameters.values())
+
+    return is_reading
+
+
+def normalized_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Request | None = None,
+    response: Response | None = None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str:
+    """
+    Build the cache key that is the same for equivalent requests to the function.
+
+    :return: namespace and hash of the function and its normalized parameters.
+    """
+
+    defaults = get_defaults_of_params(func)
+    key_parts = [
+        f"{func.__module__}:{func.__qualname__}",
+        [get_normalized_value(arg) for arg in args if isinstance(arg, KEY_VALUE_TYPES)],
+        get_normalized_params(params=kwargs, defaults=defaults),
+    ]
+
+    # Handlers reading the request itself depend on all of its query parameters
+    if request is not None and is_reading_request(func):
+        key_parts.append(sorted(request.query_params.multi_items()))
+
+    key_data = orjson.dumps(key_parts, default=str)
+    cache_key = hashlib.blake2b(key_data, digest_size=16).hexdigest()
+
+    return f"{namespace}:{cache_key}"
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from math import ceil
+from time import monotonic
+from typing import Any, Callable
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with retention time of entries.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        retention_time_seconds: int,
+        timer: Callable[[], float] = monotonic,
+    ):
+        self.max_size = max_size
+        self.retention_time_seconds = retention_time_seconds
+        self.timer = timer
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_with_ttl(self, key: str) -> tuple[int, Any | None]:
+        """
+        Get the value of an entry and its remaining retention time in seconds.
+
+        :return: remaining retention time and value or zero and None if there is no entry.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0, None
+
+        expires_at, value = entry
+        ttl = expires_at - self.timer()
+        if ttl <= 0:
+            del self._entries[key]
+
+            return 0, None
+
+        self._entries.move_to_end(key)
+
+        return ceil(ttl), value
+
+    def set(self, key: str, value: Any, expire: int | None = None) -> None:
+        """
+        Set the value of an entry evicting the least recently used entries beyond the max size.
+        The retention time of an entry never exceeds the retention time of the cache.
+        """
+
+        retention_time_seconds = min(expire, self.retention_time_seconds) if expire else self.retention_time_seconds
+
+        self._entries[key] = (self.timer() + retention_time_seconds, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        """
+        Drop entries of the namespace, the entry of the key or all entries if neither is passed.
+
+        :return: number of dropped entries.
+        """
+
+        if namespace:
+            keys = [entry_key for entry_key in self._entries if entry_key.startswith(f"{namespace}:")]
+        elif key:
+            keys = [key] if key in self._entries else []
+        else:
+            keys = list(self._entries)
+
+        for entry_key in keys:
+            del self._entries[entry_key]
+
+        return len(keys)
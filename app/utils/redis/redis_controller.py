@@ -1,17 +1,30 @@
-from typing import Callable
+from typing import Any, Callable, Iterable
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi_cache.decorator import cache
 from starlette.routing import NoMatchFound
-from httpx import Client
+from httpx import ASGITransport, AsyncClient
 from loguru import logger
 
+import asyncio
+import random
+
 from app.settings import settings
 
+from app.core.interfaces.cache_invalidator import ICacheInvalidator
+
+from app.utils.redis.backends import LocalAndRedisBackend
+from app.utils.redis.coders import CompressedORJsonCoder
 from app.utils.redis.deroctor_manager import RedisDeroctorManager
+from app.utils.redis.entry_context import CacheEntryContext
+from app.utils.redis.etags import get_etag
+from app.utils.redis.hot_keys import HotKeyRecorder, get_params_signature
+from app.utils.redis.key_builder import normalized_key_builder
+from app.utils.redis.tags import get_tags_of_item
+from app.utils.redis.table_versions import TableVersions
 
 
-class RedisController:
+class RedisController(ICacheInvalidator):
     """
     Redis caching controller.
     """
@@ -19,9 +32,12 @@ class RedisController:
     def __init__(
         self,
         redis_decorator_manager: RedisDeroctorManager = RedisDeroctorManager,
-        client_maker: Client = Client,
+        client_maker: AsyncClient = AsyncClient,
     ):
         self.app: FastAPI | None = None
+        self.backend: LocalAndRedisBackend | None = None
+        self.hot_key_recorder: HotKeyRecorder | None = None
+        self.table_versions: TableVersions | None = None
         self.warming_up_funcs: list[Callable] = list()
         self.redis_decorator_manager = redis_decorator_manager
         self.client_maker = client_maker
@@ -33,19 +49,61 @@ class RedisController:
 
         self.app = app
 
+    def registering_backend_to_controller(self, backend: LocalAndRedisBackend) -> None:
+        """
+        Registering cache backend to redis controller.
+        """
+
+        self.backend = backend
+        self.hot_key_recorder = HotKeyRecorder(redis=backend.redis)
+        self.table_versions = TableVersions(redis=backend.redis)
+
     def cache(
         self,
         warming_up=False,
+        local_caching=False,
+        tags: Iterable[str] | Callable[..., Iterable[str]] = (),
+        stale_while_revalidate: int = 0,
+        etag_tables: Iterable[str] | Callable[..., Iterable[str]] = (),
         *args,
         **kwargs,
     ):
         """
         Determine whether function response needs to be cached.
+        Responses with local caching are also kept in the in-process cache of each worker.
+        Responses are invalidated by tags of tables and items they depend on.
+        Equivalent requests share the cache key regardless of the order of list parameters.
+        Large responses are stored compressed.
+        Expired responses are served for the stale-while-revalidate window
+        while a single request refreshes them.
+        Responses depending on the etag tables are answered conditionally
+        by entity tags built from versions of the tables.
         """
 
+        if local_caching:
+            kwargs["namespace"] = settings.LOCAL_CACHE_NAMESPACE
+
+        kwargs.setdefault("key_builder", normalized_key_builder)
+        kwargs.setdefault("coder", CompressedORJsonCoder)
+
         if settings.CACHING and settings.MODE != "test":
             wrapper = cache(*args, **kwargs)
 
+            wrapper = self.redis_decorator_manager.with_entry_context(
+                tags=tags,
+                stale_while_revalidate_seconds=stale_while_revalidate,
+                finish_computation=self.finish_computation,
+                wrapper=wrapper,
+            )
+
+            if etag_tables:
+                wrapper = self.redis_decorator_manager.with_conditional_response(
+                    table_names=etag_tables,
+                    get_etag=self.get_etag,
+                    cache_control=f"public, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}, must-revalidate",
+                    wrapper=wrapper,
+                )
+
             if settings.NEED_TO_WARM_UP_CACHE and warming_up:
                 wrapper = self.redis_decorator_manager.with_warming_up(
                     warming_up_funcs=self.warming_up_funcs,
@@ -57,9 +115,145 @@ class RedisController:
 
         return wrapper
 
-    def warm_up_cache(self):
+    async def finish_computation(self, entry_context: CacheEntryContext) -> None:
+        """
+        Release requests waiting for the cache entry computed by the current request.
+        """
+
+        if self.backend is None:
+            return
+
+        try:
+            await self.backend.finish_computation(entry_context=entry_context)
+
+        except Exception:
+            logger.exception("Computation of the cache entry could not be finished.")
+
+    async def invalidate_cache(self, tags: Iterable[str], table_names: Iterable[str] = ()) -> None:
+        """
+        Invalidate cached responses tagged with any of the tags
+        and increase versions of the changed tables.
+        """
+
+        if self.backend is None:
+            return
+
+        try:
+            await self.backend.invalidate_tags(tags=tags)
+
+        except Exception:
+            logger.exception(f"Cache entries with tags {tuple(tags)} could not be invalidated.")
+
+        try:
+            await self.table_versions.bump(table_names=table_names)
+
+        except Exception:
+            logger.exception(f"Versions of tables {tuple(table_names)} could not be increased.")
+
+    async def invalidate_cache_of_item(self, table_name: str, item_id: Any = None) -> None:
+        """
+        Invalidate cached responses depending on the table and its item
+        and increase the version of the table.
+        """
+
+        await self.invalidate_cache(
+            tags=get_tags_of_item(table_name=table_name, item_id=item_id),
+            table_names=(table_name,),
+        )
+
+    async def get_table_versions(self, table_names: Iterable[str]) -> dict[str, int] | None:
+        """
+        Get versions of the tables that increase after each committed change of a table.
+
+        :return: map of table names and versions or None if versions are unavailable.
+        """
+
+        if self.table_versions is None:
+            return None
+
+        table_names = tuple(table_names)
+        try:
+            versions = await self.table_versions.get_versions(table_names=table_names)
+
+        except Exception:
+            logger.exception(f"Versions of tables {table_names} could not be got.")
+
+            return None
+
+        return dict(zip(table_names, versions))
+
+    async def get_etag(self, request: Request, table_names: tuple[str, ...]) -> str | None:
+        """
+        Get the entity tag of the response to the request from versions of the tables.
+
+        :return: entity tag or None if versions are unavailable.
+        """
+
+        versions = await self.get_table_versions(table_names=table_names)
+        if versions is None:
+            return None
+
+        etag = get_etag(request=request, versions=versions.values())
+
+        return etag
+
+    async def record_hot_params(
+        self,
+        endpoint: Callable | None,
+        query_params: Iterable[tuple[str, str]],
+        sample_rate: float = settings.HOT_KEYS_SAMPLE_RATE,
+    ) -> None:
         """
-        Warm up redis cache.
+        Record the sampled signature of query parameters of the request to the handler with warm-up.
+        """
+
+        if self.hot_key_recorder is None or endpoint not in self.warming_up_funcs or random.random() >= sample_rate:
+            return
+
+        try:
+            await self.hot_key_recorder.record(
+                handler_name=endpoint.__name__,
+                signature=get_params_signature(query_params=query_params),
+            )
+
+        except Exception:
+            logger.exception(f"Hot parameters of {endpoint.__name__} could not be recorded.")
+
+    async def get_hot_params(
+        self,
+        top_k: int = settings.HOT_KEYS_TOP_K,
+        decay_factor: float = settings.HOT_KEYS_DECAY_FACTOR,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get the most frequent parameters of handlers with warm-up
+        and decay their scores so that recent traffic prevails.
+
+        :return: map of handler names and their hot parameters.
+        """
+
+        if self.hot_key_recorder is None:
+            return {}
+
+        handler_names = [func.__name__ for func in self.warming_up_funcs]
+        try:
+            hot_params = await self.hot_key_recorder.get_hot_params(handler_names=handler_names, top_k=top_k)
+            await self.hot_key_recorder.decay(handler_names=handler_names, decay_factor=decay_factor)
+
+        except Exception:
+            logger.exception("Hot parameters of handlers could not be got.")
+
+            return {}
+
+        return hot_params
+
+    async def warm_up_cache(
+        self,
+        hot_params: dict[str, list[dict[str, Any]]] | None = None,
+        concurrency: int = settings.WARM_UP_CACHE_CONCURRENCY,
+    ) -> bool:
+        """
+        Warm up redis cache by requesting handlers in-process
+        without parameters and with hot combinations of their parameters.
 
         :return: cache warm-up status.
         """
@@ -67,16 +261,40 @@ class RedisController:
         if not isinstance(self.app, FastAPI):
             return False
 
-        with self.client_maker() as client:
-            for func in self.warming_up_funcs:
+        if hot_params is None:
+            hot_params = settings.WARM_UP_CACHE_HOT_PARAMS
+
+        urls_and_params: list[tuple[str, dict[str, Any]]] = []
+        for func in self.warming_up_funcs:
+            try:
+                url = self.app.url_path_for(func.__name__)
+
+            except NoMatchFound:
+                logger.debug(f"The function {func.__name__} is not a request handler.")
+                continue
+
+            for params in ({}, *hot_params.get(func.__name__, ())):
+                urls_and_params.append((url, params))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def warm_up_url(client: AsyncClient, url: str, params: dict[str, Any]) -> None:
+            async with semaphore:
                 try:
-                    url = self.app.url_path_for(func.__name__)
-                    client.get(
-                        url=f"http://{settings.HOST}:{settings.PORT}{url}",
-                    )
+                    response = await client.get(url=url, params=params)
+                    if response.is_error:
+                        logger.warning(f"Cache of {url} with {params} is not warmed up: {response.status_code}.")
+
+                except Exception:
+                    logger.exception(f"Cache of {url} with {params} could not be warmed up.")
 
-                except NoMatchFound:
-                    logger.debug(f"The function {func.__name__} is not a request handler.")
+        async with self.client_maker(
+            transport=ASGITransport(app=self.app),
+            base_url=f"http://{settings.HOST}:{settings.PORT}",
+        ) as client:
+            await asyncio.gather(
+                *(warm_up_url(client=client, url=url, params=params) for url, params in urls_and_params)
+            )
 
         return True
 
@@ -0,0 +1,89 @@
+from collections.abc import Iterable
+
+from redis.asyncio.client import Redis
+
+from app.settings import settings
+
+# Getting versions of tables, missing versions are initialized
+#   with the current time in milliseconds so that versions never decrease
+#   even if the keys of versions are lost
+GET_VERSIONS_SCRIPT = """
+local now = redis.call('TIME')
+local initial_version = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local versions = {}
+for i, key in ipairs(KEYS) do
+    local version = redis.call('GET', key)
+    if not version then
+        redis.call('SET', key, initial_version)
+        version = initial_version
+    end
+    versions[i] = tonumber(version)
+end
+return versions
+"""
+
+# Increasing versions of tables to the next version
+#   or to the current time in milliseconds if it is greater
+BUMP_VERSIONS_SCRIPT = """
+local now = redis.call('TIME')
+local initial_version = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local versions = {}
+for i, key in ipairs(KEYS) do
+    local version = tonumber(redis.call('GET', key) or 0)
+    if version >= initial_version then
+        versions[i] = redis.call('INCR', key)
+    else
+        redis.call('SET', key, initial_version)
+        versions[i] = initial_version
+    end
+end
+return versions
+"""
+
+
+class TableVersions:
+    """
+    Monotonically increasing versions of tables in redis
+    increased after each committed change of a table.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        prefix: str = f"{settings.CACHE_PREFIX}:version",
+    ):
+        self.redis = redis
+        self.prefix = prefix
+
+    def get_version_key(self, table_name: str) -> str:
+        return f"{self.prefix}:{table_name}"
+
+    async def bump(self, table_names: Iterable[str]) -> list[int]:
+        """
+        Increase versions of the tables.
+
+        :return: new versions of tables.
+        """
+
+        version_keys = [self.get_version_key(table_name=table_name) for table_name in table_names]
+        if not version_keys:
+            return []
+
+        versions: list[int] = await self.redis.eval(BUMP_VERSIONS_SCRIPT, len(version_keys), *version_keys)
+
+        return versions
+
+    async def get_versions(self, table_names: Iterable[str]) -> list[int]:
+        """
+        Get versions of the tables.
+
+        :return: versions of tables.
+        """
+
+        version_keys = [self.get_version_key(table_name=table_name) for table_name in table_names]
+        if not version_keys:
+            return []
+
+        versions: list[int] = await self.redis.eval(GET_VERSIONS_SCRIPT, len(version_keys), *version_keys)
+
+        return versions
@@ -0,0 +1,25 @@
+from typing import Any
+
+
+def get_item_tag(table_name: str, item_id: Any) -> str:
+    """
+    Get the tag of cache entries depending on the item of the table.
+
+    :return: tag of item.
+    """
+
+    tag = f"{table_name}:{item_id}"
+
+    return tag
+
+
+def get_tags_of_item(table_name: str, item_id: Any = None) -> tuple[str, ...]:
+    """
+    Get the tags of cache entries that become stale when the item of the table is changed.
+
+    :return: tags of table and item.
+    """
+
+    tags = (table_name,) if item_id is None else (table_name, get_item_tag(table_name=table_name, item_id=item_id))
+
+    return tags
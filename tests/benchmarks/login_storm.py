@@ -0,0 +1,140 @@
+"""
+Benchmark of the latency of an unrelated endpoint during a storm of logins.
+
+Logins are sent to the authentication route of the app,
+while the endpoint of the hotel reading the database is requested at a steady rate.
+Passwords are verified either inline on the event loop or in the password hashing pool.
+The pool of the engine is small, so that connections held by logins delay unrelated requests.
+
+Run with `python -m tests.benchmarks.login_storm` against the migrated test database.
+"""
+
+from time import perf_counter
+from unittest.mock import patch
+
+import asyncio
+import bcrypt
+import httpx
+
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.main import app
+from app.settings import settings
+
+from app.adapters.secondary.db.models.hotels_model import HotelsModel
+from app.adapters.secondary.db.models.users_model import UsersModel
+
+from app.core.services.authorization.helpers import verify_password
+
+from app.dependencies.base import get_async_session_maker
+
+from tests.db_preparer import DBPreparer
+
+BCRYPT_ROUNDS = 10
+NUMBER_OF_LOGINS = 16
+PING_INTERVAL_SECONDS = 0.005
+POOL_SIZE = 2
+
+PASSWORD = "Password1"
+HASHED_PASSWORD = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
+
+TEST_ID = 1_000_000
+user_for_benchmark = {
+    "id": TEST_ID,
+    "email": "login.storm@example.com",
+    "phone": "+7-999-999-99-90",
+    "first_name": "Login",
+    "last_name": "Storm",
+    "password": HASHED_PASSWORD,
+}
+hotel_for_benchmark = {
+    "id": TEST_ID,
+    "name": "Benchmark hotel",
+    "location": "Benchmark location",
+    "stars": 3,
+}
+
+
+async def verify_password_inline(plain_password: str, hashed_password: str) -> bool:
+    return verify_password(plain_password=plain_password, hashed_password=hashed_password)
+
+
+def get_percentile(timings: list[float], percentile: float) -> float:
+    timings = sorted(timings)
+
+    return timings[min(int(len(timings) * percentile), len(timings) - 1)]
+
+
+async def measure(client: httpx.AsyncClient) -> tuple[list[float], float]:
+    """
+    Measure latencies of the unrelated endpoint during the storm of logins.
+
+    :return: latencies of unrelated requests in seconds and duration of the storm.
+    """
+
+    start = perf_counter()
+    logins = asyncio.gather(
+        *(
+            client.post(
+                f"{settings.API_PREFIX}/v1/users/authentication",
+                json={"email": user_for_benchmark["email"], "password": PASSWORD},
+            )
+            for _ in range(NUMBER_OF_LOGINS)
+        )
+    )
+
+    # Latencies are measured from the time the request is due,
+    #   so that the time of the stalled event loop is not omitted
+    timings = []
+    while not logins.done():
+        due_at = perf_counter() + PING_INTERVAL_SECONDS
+        await asyncio.sleep(PING_INTERVAL_SECONDS)
+
+        response = await client.get(f"{settings.API_PREFIX}/v1/resource-manager/hotels/{TEST_ID}")
+        response.raise_for_status()
+        timings.append(perf_counter() - due_at)
+
+    for response in await logins:
+        response.raise_for_status()
+
+    duration = perf_counter() - start
+
+    return timings, duration
+
+
+async def main() -> None:
+    engine = create_async_engine(url=settings.DB_SECRET_URL, pool_size=POOL_SIZE, max_overflow=0)
+    session_maker = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    app.dependency_overrides[get_async_session_maker] = lambda: session_maker
+
+    db_preparer = DBPreparer(session_maker=session_maker)
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with (
+            db_preparer.insert_test_data(orm_model=UsersModel, data_for_insert=[user_for_benchmark]),
+            db_preparer.insert_test_data(orm_model=HotelsModel, data_for_insert=[hotel_for_benchmark]),
+            httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client,
+        ):
+            print(f"Logins: {NUMBER_OF_LOGINS}, bcrypt rounds: {BCRYPT_ROUNDS}, connections: {POOL_SIZE}")
+            for name, verify in (("inline", verify_password_inline), ("pool", None)):
+                if verify is None:
+                    timings, duration = await measure(client=client)
+
+                else:
+                    with patch("app.core.services.authorization.service.verify_password_in_pool", new=verify):
+                        timings, duration = await measure(client=client)
+
+                print(
+                    f"{name:<6} storm: {duration:.2f} s, unrelated requests: {len(timings)}, "
+                    f"p50: {get_percentile(timings, 0.5) * 1000:.1f} ms, "
+                    f"p99: {get_percentile(timings, 0.99) * 1000:.1f} ms"
+                )
+
+    finally:
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
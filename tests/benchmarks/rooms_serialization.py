@@ -0,0 +1,225 @@
+"""
+Benchmark of the per-item cost of serializing a 10k-room result.
+
+Rows of the aggregated room query are served by a fake session,
+so only the mapping and serialization after the database are measured.
+Cache hits are measured from the payload of the cached page to the response body.
+
+Run with `python -m tests.benchmarks.rooms_serialization`.
+"""
+
+from collections import namedtuple
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from time import perf_counter
+from typing import Any, Callable, Coroutine
+
+import asyncio
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.adapters.primary.api.base.responses import SerializedPageResponse
+from app.adapters.secondary.db.dao.bookings.dao import BookingDAO
+from app.adapters.secondary.db.models.hotels_model import HotelsModel
+from app.adapters.secondary.db.models.premium_level_varieties_model import PremiumLevelVarietiesModel
+from app.adapters.secondary.db.models.rooms_model import RoomsModel
+
+from app.core.services.base.schemas import PageResponseSchema
+from app.core.services.bookings.schemas import ExtendedRoomResponseSchema
+from app.core.services.bookings.service import BookingService
+from app.core.services.check.schemas import PriceRangeValidator
+
+from app.utils.redis.coders import CompressedORJsonCoder
+
+NUMBER_OF_ROOMS = 10_000
+NUMBER_OF_REPEATS = 5
+
+AggregatedRoomRow = namedtuple(
+    "AggregatedRoomRow",
+    [
+        *(column.name for column in RoomsModel.get_columns()),
+        *(f"hotel__{column.name}" for column in HotelsModel.get_columns()),
+        *(f"premium_level__{column.name}" for column in PremiumLevelVarietiesModel.get_columns()),
+        "services",
+    ],
+)
+
+
+def get_aggregated_room_rows(number_of_rooms: int) -> list[AggregatedRoomRow]:
+    """
+    Get fake rows of the aggregated room query.
+
+    :return: list of rows.
+    """
+
+    services = [
+        {"id": service_id, "key": f"service_{service_id}", "name": f"Service {service_id}", "desc": None}
+        for service_id in range(1, 4)
+    ]
+
+    rows = [
+        AggregatedRoomRow(
+            **{
+                "id": room_id,
+                "name": f"Room {room_id}",
+                "desc": "Room with a view of the sea.",
+                "hotel_id": room_id % 100 + 1,
+                "premium_level_id": 1,
+                "ordinal_number": room_id,
+                "maximum_persons": 2,
+                "price": Decimal("5000.00"),
+                "main_image_id": None,
+                "hotel__id": room_id % 100 + 1,
+                "hotel__name": f"Hotel {room_id % 100 + 1}",
+                "hotel__desc": None,
+                "hotel__location": "Moscow",
+                "hotel__stars": 5,
+                "hotel__main_image_id": None,
+                "premium_level__id": 1,
+                "premium_level__key": "lux",
+                "premium_level__name": "Lux",
+                "premium_level__desc": None,
+                "services": services,
+            }
+        )
+        for room_id in range(1, number_of_rooms + 1)
+    ]
+
+    return rows
+
+
+class FakeResult:
+    def __init__(self, rows: list[AggregatedRoomRow]):
+        self.rows = rows
+
+    def fetchall(self) -> list[AggregatedRoomRow]:
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, rows: list[AggregatedRoomRow]):
+        self.rows = rows
+
+    async def execute(self, *args, **kwargs) -> FakeResult:
+        return FakeResult(rows=self.rows)
+
+
+class FakeTransactionContextFactory:
+    def __init__(self, rows: list[AggregatedRoomRow]):
+        self.session = FakeSession(rows=rows)
+
+    def init_transaction_context(self, read_only: bool = False):
+        @asynccontextmanager
+        async def transaction_context():
+            yield
+
+        transaction_context.session = self.session
+
+        return transaction_context
+
+
+async def get_rooms_body_by_schemas(service: BookingService) -> bytes:
+    """
+    Get the body of rooms response built through DTOs and response schemas.
+
+    :return: body of response.
+    """
+
+    rooms = await service.get_rooms(
+        min_price_and_max_price=PriceRangeValidator(),
+    )
+    content = await serialize_response(
+        field=create_response_field(name="response", type_=PageResponseSchema[ExtendedRoomResponseSchema]),
+        response_content=rooms,
+    )
+
+    return JSONResponse(content=content).body
+
+
+async def get_rooms_body_by_maps(service: BookingService) -> bytes:
+    """
+    Get the body of rooms response encoded straight from json-serializable maps.
+
+    :return: body of response.
+    """
+
+    rooms = await service.get_rooms(
+        min_price_and_max_price=PriceRangeValidator(),
+        serializable=True,
+    )
+
+    return SerializedPageResponse(content=rooms).body
+
+
+async def get_rooms_body_of_cache_hit_by_schemas(payload: bytes) -> bytes:
+    """
+    Get the body of rooms response from the cached page decoded and validated against the response model.
+
+    :return: body of response.
+    """
+
+    content = await serialize_response(
+        field=create_response_field(name="response", type_=PageResponseSchema[ExtendedRoomResponseSchema]),
+        response_content=CompressedORJsonCoder.decode(payload),
+    )
+
+    return JSONResponse(content=content).body
+
+
+async def get_rooms_body_of_cache_hit_by_payload(payload: bytes) -> bytes:
+    """
+    Get the body of rooms response straight from json bytes of the cached page.
+
+    :return: body of response.
+    """
+
+    return CompressedORJsonCoder.decode_as_type(payload, type_=SerializedPageResponse).body
+
+
+async def measure(get_body: Callable[..., Coroutine[Any, Any, bytes]], **kwargs) -> float:
+    """
+    Measure the best time of getting the response body.
+
+    :return: time in seconds.
+    """
+
+    timings = []
+    for _ in range(NUMBER_OF_REPEATS):
+        start = perf_counter()
+        await get_body(**kwargs)
+        timings.append(perf_counter() - start)
+
+    return min(timings)
+
+
+async def main() -> None:
+    service = BookingService(
+        transaction_context_factory=FakeTransactionContextFactory(rows=get_aggregated_room_rows(NUMBER_OF_ROOMS)),
+        booking_dao=BookingDAO(),
+    )
+
+    before = await measure(get_rooms_body_by_schemas, service=service)
+    after = await measure(get_rooms_body_by_maps, service=service)
+
+    print(f"Rooms: {NUMBER_OF_ROOMS}")
+    print(f"DTO -> response schema -> json: {before / NUMBER_OF_ROOMS * 1e6:.2f} us per room")
+    print(f"Row -> map -> orjson:           {after / NUMBER_OF_ROOMS * 1e6:.2f} us per room")
+    print(f"Speedup: {before / after:.1f}x")
+
+    payload = CompressedORJsonCoder.encode(
+        SerializedPageResponse(
+            content=await service.get_rooms(min_price_and_max_price=PriceRangeValidator(), serializable=True)
+        )
+    )
+    hit_before = await measure(get_rooms_body_of_cache_hit_by_schemas, payload=payload)
+    hit_after = await measure(get_rooms_body_of_cache_hit_by_payload, payload=payload)
+
+    print(f"Cache hit, payload -> map -> response schema -> json: {hit_before / NUMBER_OF_ROOMS * 1e6:.2f} us per room")
+    print(f"Cache hit, payload -> json:                          {hit_after / NUMBER_OF_ROOMS * 1e6:.2f} us per room")
+    print(f"Speedup of cache hits: {hit_before / hit_after:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -21,6 +21,22 @@ def pytest_addoption(parser):
         default="1",
         choices=("1", "0"),
     )
+    parser.addoption(
+        "--run-slow-tests",
+        default="0",
+        choices=("1", "0"),
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Slow tests loading large volumes of data are run only on demand
+    if bool(int(config.getoption("--run-slow-tests"))):
+        return
+
+    skip_slow = pytest.mark.skip(reason="Slow tests are run with --run-slow-tests=1")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
 
 
 @pytest.fixture(scope="session")
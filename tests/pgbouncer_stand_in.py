@@ -0,0 +1,213 @@
+from dataclasses import dataclass, field
+
+import asyncio
+import struct
+
+SSL_REQUEST_CODE = 80877103
+GSSENC_REQUEST_CODE = 80877104
+
+
+@dataclass
+class ServerConnection:
+    """
+    Connection of the proxy to the postgres server.
+    """
+
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+
+@dataclass
+class ClientState:
+    """
+    State of the client connection to the proxy.
+    """
+
+    server: ServerConnection | None = None
+    relay: asyncio.Task | None = None
+
+
+@dataclass
+class HandshakeMessages:
+    """
+    Messages sent by the server after authentication, replayed to clients.
+    """
+
+    messages: list[bytes] = field(default_factory=list)
+
+
+async def read_message(reader: asyncio.StreamReader) -> bytes | None:
+    """
+    Read the typed message of the postgres protocol.
+
+    :return: raw message or None if the connection is closed.
+    """
+
+    try:
+        header = await reader.readexactly(5)
+        body = await reader.readexactly(struct.unpack("!I", header[1:])[0] - 4)
+
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+
+    return header + body
+
+
+class TransactionPoolingProxy:
+    """
+    Stand-in of PgBouncer in transaction pooling mode.
+    Server connections are shared by client connections
+    and are assigned to a client only until the end of its transaction.
+    """
+
+    def __init__(self, server_host: str, server_port: int, pool_size: int = 1):
+        self.server_host = server_host
+        self.server_port = server_port
+        self.pool_size = pool_size
+        self.idle_servers: asyncio.Queue[ServerConnection] = asyncio.Queue()
+        self.number_of_servers = 0
+        self.handshake = HandshakeMessages()
+        self._server: asyncio.Server | None = None
+        self._client_writers: set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> int:
+        """
+        Start accepting client connections.
+
+        :return: port of proxy.
+        """
+
+        self._server = await asyncio.start_server(self.handle_client, host="127.0.0.1", port=0)
+
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        for writer in self._client_writers:
+            writer.close()
+
+        await self._server.wait_closed()
+
+        while not self.idle_servers.empty():
+            self.idle_servers.get_nowait().writer.close()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._client_writers.add(writer)
+        try:
+            startup_message = await self.read_startup_message(reader=reader, writer=writer)
+            if startup_message is None:
+                return
+
+            if self.number_of_servers < self.pool_size:
+                await self.open_server(startup_message=startup_message, reader=reader, writer=writer)
+            else:
+                writer.write(b"".join(self.handshake.messages))
+
+            await self.serve_client(reader=reader, writer=writer)
+
+        finally:
+            self._client_writers.discard(writer)
+            writer.close()
+
+    async def read_startup_message(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bytes | None:
+        """
+        Read the startup message declining encryption requests.
+
+        :return: raw startup message or None if the connection is closed.
+        """
+
+        while True:
+            try:
+                length = struct.unpack("!I", await reader.readexactly(4))[0]
+                body = await reader.readexactly(length - 4)
+
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return None
+
+            if struct.unpack("!I", body[:4])[0] in (SSL_REQUEST_CODE, GSSENC_REQUEST_CODE):
+                writer.write(b"N")
+                await writer.drain()
+                continue
+
+            return struct.pack("!I", length) + body
+
+    async def open_server(
+        self,
+        startup_message: bytes,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """
+        Open the server connection relaying the authentication of the client
+        and add it to the idle server connections.
+        """
+
+        self.number_of_servers += 1
+        server_reader, server_writer = await asyncio.open_connection(host=self.server_host, port=self.server_port)
+        server_writer.write(startup_message)
+
+        handshake_messages = []
+        while True:
+            message = await read_message(server_reader)
+            writer.write(message)
+
+            message_type = message[:1]
+            if message_type == b"R" and struct.unpack("!I", message[5:9])[0] not in (0, 12):
+                await writer.drain()
+                server_writer.write(await read_message(reader))
+
+            elif message_type in (b"S", b"K"):
+                handshake_messages.append(message)
+
+            elif message_type == b"Z":
+                break
+
+        if not self.handshake.messages:
+            authentication_ok = b"R" + struct.pack("!II", 8, 0)
+            self.handshake.messages = [authentication_ok, *handshake_messages, message]
+
+        await self.idle_servers.put(ServerConnection(reader=server_reader, writer=server_writer))
+
+    async def serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Forward messages of the client to the server connection assigned for the transaction.
+        """
+
+        client_state = ClientState()
+        while True:
+            message = await read_message(reader)
+            if message is None or message[:1] == b"X":
+                break
+
+            if client_state.server is None:
+                client_state.server = await self.idle_servers.get()
+                client_state.relay = asyncio.create_task(self.relay_server(client_state=client_state, writer=writer))
+
+            client_state.server.writer.write(message)
+
+        # The transaction of the disconnected client is left unfinished
+        if client_state.server is not None:
+            client_state.relay.cancel()
+            client_state.server.writer.close()
+            self.number_of_servers -= 1
+
+    async def relay_server(self, client_state: ClientState, writer: asyncio.StreamWriter) -> None:
+        """
+        Forward messages of the server to the client
+        and release the server connection when it is out of transaction.
+        """
+
+        server = client_state.server
+        while True:
+            message = await read_message(server.reader)
+            if message is None:
+                return
+
+            writer.write(message)
+
+            # ReadyForQuery with the idle status ends the transaction
+            if message[:1] == b"Z" and message[5:6] == b"I":
+                client_state.server = None
+                self.idle_servers.put_nowait(server)
+
+                return
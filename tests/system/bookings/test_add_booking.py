@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import Any
 
+import asyncio
+
 from fastapi import FastAPI
 from httpx import AsyncClient, ASGITransport
 from loguru import logger
@@ -496,3 +498,55 @@ class TestAddBooking:
 
             assert status_code_of_response == expected_status_code, "The returned status code is not as expected"
             assert dict_of_response == expected_result, "The data returned by the endpoint is not as expected"
+
+    @pytest.mark.asyncio
+    async def test_add_booking_concurrently(self):
+        logger.info(
+            "Endpoint test for adding several overlapping bookings of one room to the database at the same time",
+        )
+
+        body_of_request = {
+            "check_in_date": "2024-08-10",
+            "check_out_date": "2024-08-12",
+            "room_id": 1,
+            "number_of_persons": 1,
+        }
+
+        # Inserting test data into the database before each test
+        #   and deleting this data after each test
+        async with (
+            self.db_preparer.insert_test_data(orm_model=HotelsModel, data_for_insert=hotels_for_test),
+            self.db_preparer.insert_test_data(orm_model=RoomsModel, data_for_insert=rooms_for_test),
+            self.db_preparer.insert_test_data(orm_model=UsersModel, data_for_insert=users_for_test),
+        ):
+            # Client for test requests to API
+            async with self.client_maker(transport=self.transport_for_client) as client:
+                api_responses = await asyncio.gather(
+                    *(
+                        client.post(
+                            url=f"http://test{self.url}",
+                            json=body_of_request,
+                            cookies=cookies_of_first_user,
+                        )
+                        for _ in range(5)
+                    )
+                )
+
+                status_codes_of_responses = sorted(api_response.status_code for api_response in api_responses)
+                logger.debug(status_codes_of_responses)
+                dicts_of_responses = [api_response.json() for api_response in api_responses]
+                logger.debug(dicts_of_responses)
+
+            # Delete data added to the database by endpoint
+            await self.db_preparer.delete_test_data(
+                orm_model=BookingsModel,
+                data_for_delete=[
+                    dict_of_response
+                    for api_response, dict_of_response in zip(api_responses, dicts_of_responses)
+                    if api_response.status_code == status.HTTP_201_CREATED
+                ],
+            )
+
+            assert (
+                status_codes_of_responses == [status.HTTP_201_CREATED] + [status.HTTP_409_CONFLICT] * 4
+            ), "Exactly one of the overlapping bookings must be added"
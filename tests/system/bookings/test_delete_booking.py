@@ -87,8 +87,8 @@ bookings_for_test = [
         "user_id": 2,
         "room_id": 1,
         "number_of_persons": 1,
-        "check_in_dt": datetime(year=2024, month=7, day=2, hour=14, tzinfo=settings.DB_TIME_ZONE),
-        "check_out_dt": datetime(year=2024, month=7, day=3, hour=12, tzinfo=settings.DB_TIME_ZONE),
+        "check_in_dt": datetime(year=2024, month=7, day=3, hour=14, tzinfo=settings.DB_TIME_ZONE),
+        "check_out_dt": datetime(year=2024, month=7, day=4, hour=12, tzinfo=settings.DB_TIME_ZONE),
         "total_cost": 5_000,
     },
     {
@@ -0,0 +1,204 @@
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from loguru import logger
+from starlette import status
+
+import pytest
+
+from app.settings import settings
+
+from app.adapters.secondary.db.models.bookings_model import BookingsModel
+from app.adapters.secondary.db.models.hotels_model import HotelsModel
+from app.adapters.secondary.db.models.room_occupancy_model import RoomOccupancyModel
+from app.adapters.secondary.db.models.rooms_model import RoomsModel
+from app.adapters.secondary.db.models.users_model import UsersModel
+
+from app.core.services.authorization.helpers import get_password_hash
+
+from tests.db_preparer import DBPreparer
+
+hotels_for_test = [
+    {
+        "id": 1,
+        "name": "Test hotel #1",
+        "desc": "Colorful description for hotel #1.",
+        "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+        "stars": 3,
+    },
+]
+rooms_for_test = [
+    {
+        "id": 1,
+        "name": "Room #1 of hotel #1",
+        "desc": "Colorful description for room #1 of hotel #1.",
+        "hotel_id": 1,
+        "premium_level_id": None,
+        "ordinal_number": 1,
+        "maximum_persons": 2,
+        "price": 5_000,
+    },
+    {
+        "id": 2,
+        "name": "Room #2 of hotel #1",
+        "desc": "Colorful description for room #2 of hotel #1.",
+        "hotel_id": 1,
+        "premium_level_id": 2,
+        "ordinal_number": 2,
+        "maximum_persons": 3,
+        "price": 10_000,
+    },
+]
+users_for_test = [
+    {
+        "id": 1,
+        "email": "user1@example.com",
+        "phone": "+7-999-999-99-97",
+        "first_name": "Freddie",
+        "last_name": "Mercury",
+        "password": get_password_hash(password="Password1"),
+    },
+]
+bookings_for_test = [
+    {
+        "id": 1,
+        "user_id": 1,
+        "room_id": 1,
+        "number_of_persons": 1,
+        "check_in_dt": datetime(year=2024, month=7, day=2, hour=14, tzinfo=settings.DB_TIME_ZONE),
+        "check_out_dt": datetime(year=2024, month=7, day=3, hour=12, tzinfo=settings.DB_TIME_ZONE),
+        "total_cost": 5_000,
+    },
+    {
+        "id": 2,
+        "user_id": 1,
+        "room_id": 2,
+        "number_of_persons": 2,
+        "check_in_dt": datetime(year=2024, month=8, day=10, hour=14, tzinfo=settings.DB_TIME_ZONE),
+        "check_out_dt": datetime(year=2024, month=8, day=22, hour=12, tzinfo=settings.DB_TIME_ZONE),
+        "total_cost": 110_000,
+    },
+]
+# Nights of bookings within the rolling horizon
+#   from the current date of the test settings
+room_occupancy_for_test = [
+    {
+        "room_id": 2,
+        "night": date(year=2024, month=8, day=10) + timedelta(days=number_of_night),
+        "booking_id": 2,
+    }
+    for number_of_night in range(12)
+]
+stay_periods_for_test = [
+    {"check_in_date": "2024-07-01", "check_out_date": "2024-07-02"},
+    {"check_in_date": "2024-07-02", "check_out_date": "2024-07-03"},
+    {"check_in_date": "2024-07-03", "check_out_date": "2024-07-04"},
+    {"check_in_date": "2024-08-15", "check_out_date": "2024-08-16"},
+]
+
+
+@pytest.mark.asyncio
+class TestGetAvailability:
+    """
+    System tests for POST method of endpoint /bookings/availability.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(
+        self,
+        app: FastAPI,
+        transport_for_client: ASGITransport,
+        client_maker: AsyncClient = AsyncClient,
+        db_preparer: DBPreparer = DBPreparer,
+    ):
+        self.app = app
+        self.transport_for_client = transport_for_client
+        self.client_maker = client_maker
+        self.db_preparer = db_preparer()
+        self.url = app.url_path_for("get_availability_of_rooms")
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "body_of_request",
+            "expected_status_code",
+            "expected_result",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                {
+                    "room_ids": [2, 1],
+                    "stay_periods": stay_periods_for_test,
+                },
+                status.HTTP_200_OK,
+                [
+                    {"room_id": 2, "bitmap": "1110"},
+                    {"room_id": 1, "bitmap": "1011"},
+                ],
+                "Endpoint test for getting availability of rooms in stay periods",
+                id="-test-1",
+            ),
+            pytest.param(
+                {
+                    "room_ids": [1, 99, 1],
+                    "stay_periods": stay_periods_for_test[:2],
+                },
+                status.HTTP_200_OK,
+                [
+                    {"room_id": 1, "bitmap": "10"},
+                ],
+                "Endpoint test for getting availability of repeated and missing rooms",
+                id="-test-2",
+            ),
+            pytest.param(
+                {
+                    "room_ids": [1],
+                    "stay_periods": [{"check_in_date": "2024-08-11", "check_out_date": "2024-07-29"}],
+                },
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                {
+                    "detail": "Check-out date must be later than check-in date.",
+                    "extras": {
+                        "check_in_date": "2024-08-11",
+                        "check_out_date": "2024-07-29",
+                    },
+                },
+                "Endpoint test for getting availability of rooms with incorrect check-in and check-out dates",
+                id="-test-3",
+            ),
+        ],
+    )
+    async def test_get_availability(
+        self,
+        body_of_request: dict[str, Any],
+        expected_status_code: int,
+        expected_result: list[dict[str, Any]] | dict[str, Any],
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        # Inserting test data into the database before each test
+        #   and deleting this data after each test
+        async with (
+            self.db_preparer.insert_test_data(orm_model=HotelsModel, data_for_insert=hotels_for_test),
+            self.db_preparer.insert_test_data(orm_model=RoomsModel, data_for_insert=rooms_for_test),
+            self.db_preparer.insert_test_data(orm_model=UsersModel, data_for_insert=users_for_test),
+            self.db_preparer.insert_test_data(orm_model=BookingsModel, data_for_insert=bookings_for_test),
+            self.db_preparer.insert_test_data(orm_model=RoomOccupancyModel, data_for_insert=room_occupancy_for_test),
+        ):
+            # Client for test requests to API
+            async with self.client_maker(transport=self.transport_for_client) as client:
+                api_response = await client.post(
+                    url=f"http://test{self.url}",
+                    json=body_of_request,
+                )
+
+                status_code_of_response = api_response.status_code
+                logger.debug(status_code_of_response)
+                dict_of_response = api_response.json()
+                logger.debug(dict_of_response)
+
+            assert status_code_of_response == expected_status_code, "The returned status code is not as expected"
+            assert dict_of_response == expected_result, "The data returned by the endpoint is not as expected"
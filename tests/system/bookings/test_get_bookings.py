@@ -162,65 +162,68 @@ class TestGetBookings:
                 users_for_test,
                 bookings_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 1,
-                        "user_id": 1,
-                        "room_id": 1,
-                        "number_of_persons": 1,
-                        "check_in_dt": "2024-07-02T14:00:00Z",
-                        "check_out_dt": "2024-07-03T12:00:00Z",
-                        "total_cost": 5_000,
-                        "room": {
+                {
+                    "items": [
+                        {
                             "id": 1,
-                            "name": "Room #1 of hotel #1",
-                            "desc": "Colorful description for room #1 of hotel #1.",
-                            "hotel_id": 1,
-                            "premium_level_id": None,
-                            "ordinal_number": 1,
-                            "maximum_persons": 2,
-                            "price": 5_000,
+                            "user_id": 1,
+                            "room_id": 1,
+                            "number_of_persons": 1,
+                            "check_in_dt": "2024-07-02T14:00:00Z",
+                            "check_out_dt": "2024-07-03T12:00:00Z",
+                            "total_cost": 5_000,
+                            "room": {
+                                "id": 1,
+                                "name": "Room #1 of hotel #1",
+                                "desc": "Colorful description for room #1 of hotel #1.",
+                                "hotel_id": 1,
+                                "premium_level_id": None,
+                                "ordinal_number": 1,
+                                "maximum_persons": 2,
+                                "price": 5_000,
+                            },
                         },
-                    },
-                    {
-                        "id": 3,
-                        "user_id": 1,
-                        "room_id": 2,
-                        "number_of_persons": 2,
-                        "check_in_dt": "2024-08-10T14:00:00Z",
-                        "check_out_dt": "2024-08-22T12:00:00Z",
-                        "total_cost": 110_000,
-                        "room": {
-                            "id": 2,
-                            "name": "Room #2 of hotel #1",
-                            "desc": "Colorful description for room #2 of hotel #1.",
-                            "hotel_id": 1,
-                            "premium_level_id": 2,
-                            "ordinal_number": 2,
-                            "maximum_persons": 3,
-                            "price": 10_000,
+                        {
+                            "id": 3,
+                            "user_id": 1,
+                            "room_id": 2,
+                            "number_of_persons": 2,
+                            "check_in_dt": "2024-08-10T14:00:00Z",
+                            "check_out_dt": "2024-08-22T12:00:00Z",
+                            "total_cost": 110_000,
+                            "room": {
+                                "id": 2,
+                                "name": "Room #2 of hotel #1",
+                                "desc": "Colorful description for room #2 of hotel #1.",
+                                "hotel_id": 1,
+                                "premium_level_id": 2,
+                                "ordinal_number": 2,
+                                "maximum_persons": 3,
+                                "price": 10_000,
+                            },
                         },
-                    },
-                    {
-                        "id": 4,
-                        "user_id": 1,
-                        "room_id": 1,
-                        "number_of_persons": 2,
-                        "check_in_dt": "2025-09-10T14:00:00Z",
-                        "check_out_dt": "2025-09-22T12:00:00Z",
-                        "total_cost": 55_000,
-                        "room": {
-                            "id": 1,
-                            "name": "Room #1 of hotel #1",
-                            "desc": "Colorful description for room #1 of hotel #1.",
-                            "hotel_id": 1,
-                            "premium_level_id": None,
-                            "ordinal_number": 1,
-                            "maximum_persons": 2,
-                            "price": 5_000,
+                        {
+                            "id": 4,
+                            "user_id": 1,
+                            "room_id": 1,
+                            "number_of_persons": 2,
+                            "check_in_dt": "2025-09-10T14:00:00Z",
+                            "check_out_dt": "2025-09-22T12:00:00Z",
+                            "total_cost": 55_000,
+                            "room": {
+                                "id": 1,
+                                "name": "Room #1 of hotel #1",
+                                "desc": "Colorful description for room #1 of hotel #1.",
+                                "hotel_id": 1,
+                                "premium_level_id": None,
+                                "ordinal_number": 1,
+                                "maximum_persons": 2,
+                                "price": 5_000,
+                            },
                         },
-                    },
-                ],
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting user's bookings from the database without filters",
                 id="-test-1",
             ),
@@ -234,27 +237,30 @@ class TestGetBookings:
                 users_for_test,
                 bookings_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 4,
-                        "user_id": 1,
-                        "room_id": 1,
-                        "number_of_persons": 2,
-                        "check_in_dt": "2025-09-10T14:00:00Z",
-                        "check_out_dt": "2025-09-22T12:00:00Z",
-                        "total_cost": 55_000,
-                        "room": {
-                            "id": 1,
-                            "name": "Room #1 of hotel #1",
-                            "desc": "Colorful description for room #1 of hotel #1.",
-                            "hotel_id": 1,
-                            "premium_level_id": None,
-                            "ordinal_number": 1,
-                            "maximum_persons": 2,
-                            "price": 5_000,
+                {
+                    "items": [
+                        {
+                            "id": 4,
+                            "user_id": 1,
+                            "room_id": 1,
+                            "number_of_persons": 2,
+                            "check_in_dt": "2025-09-10T14:00:00Z",
+                            "check_out_dt": "2025-09-22T12:00:00Z",
+                            "total_cost": 55_000,
+                            "room": {
+                                "id": 1,
+                                "name": "Room #1 of hotel #1",
+                                "desc": "Colorful description for room #1 of hotel #1.",
+                                "hotel_id": 1,
+                                "premium_level_id": None,
+                                "ordinal_number": 1,
+                                "maximum_persons": 2,
+                                "price": 5_000,
+                            },
                         },
-                    },
-                ],
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting user's bookings from the database with filter by minimum check in date",
                 id="-test-2",
             ),
@@ -268,46 +274,49 @@ class TestGetBookings:
                 users_for_test,
                 bookings_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 1,
-                        "user_id": 1,
-                        "room_id": 1,
-                        "number_of_persons": 1,
-                        "check_in_dt": "2024-07-02T14:00:00Z",
-                        "check_out_dt": "2024-07-03T12:00:00Z",
-                        "total_cost": 5_000,
-                        "room": {
+                {
+                    "items": [
+                        {
                             "id": 1,
-                            "name": "Room #1 of hotel #1",
-                            "desc": "Colorful description for room #1 of hotel #1.",
-                            "hotel_id": 1,
-                            "premium_level_id": None,
-                            "ordinal_number": 1,
-                            "maximum_persons": 2,
-                            "price": 5_000,
+                            "user_id": 1,
+                            "room_id": 1,
+                            "number_of_persons": 1,
+                            "check_in_dt": "2024-07-02T14:00:00Z",
+                            "check_out_dt": "2024-07-03T12:00:00Z",
+                            "total_cost": 5_000,
+                            "room": {
+                                "id": 1,
+                                "name": "Room #1 of hotel #1",
+                                "desc": "Colorful description for room #1 of hotel #1.",
+                                "hotel_id": 1,
+                                "premium_level_id": None,
+                                "ordinal_number": 1,
+                                "maximum_persons": 2,
+                                "price": 5_000,
+                            },
                         },
-                    },
-                    {
-                        "id": 3,
-                        "user_id": 1,
-                        "room_id": 2,
-                        "number_of_persons": 2,
-                        "check_in_dt": "2024-08-10T14:00:00Z",
-                        "check_out_dt": "2024-08-22T12:00:00Z",
-                        "total_cost": 110_000,
-                        "room": {
-                            "id": 2,
-                            "name": "Room #2 of hotel #1",
-                            "desc": "Colorful description for room #2 of hotel #1.",
-                            "hotel_id": 1,
-                            "premium_level_id": 2,
-                            "ordinal_number": 2,
-                            "maximum_persons": 3,
-                            "price": 10_000,
+                        {
+                            "id": 3,
+                            "user_id": 1,
+                            "room_id": 2,
+                            "number_of_persons": 2,
+                            "check_in_dt": "2024-08-10T14:00:00Z",
+                            "check_out_dt": "2024-08-22T12:00:00Z",
+                            "total_cost": 110_000,
+                            "room": {
+                                "id": 2,
+                                "name": "Room #2 of hotel #1",
+                                "desc": "Colorful description for room #2 of hotel #1.",
+                                "hotel_id": 1,
+                                "premium_level_id": 2,
+                                "ordinal_number": 2,
+                                "maximum_persons": 3,
+                                "price": 10_000,
+                            },
                         },
-                    },
-                ],
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting user's bookings from the database with filter by maximum check in date",
                 id="-test-3",
             ),
@@ -322,27 +331,30 @@ class TestGetBookings:
                 users_for_test,
                 bookings_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 3,
-                        "user_id": 1,
-                        "room_id": 2,
-                        "number_of_persons": 2,
-                        "check_in_dt": "2024-08-10T14:00:00Z",
-                        "check_out_dt": "2024-08-22T12:00:00Z",
-                        "total_cost": 110_000,
-                        "room": {
-                            "id": 2,
-                            "name": "Room #2 of hotel #1",
-                            "desc": "Colorful description for room #2 of hotel #1.",
-                            "hotel_id": 1,
-                            "premium_level_id": 2,
-                            "ordinal_number": 2,
-                            "maximum_persons": 3,
-                            "price": 10_000,
+                {
+                    "items": [
+                        {
+                            "id": 3,
+                            "user_id": 1,
+                            "room_id": 2,
+                            "number_of_persons": 2,
+                            "check_in_dt": "2024-08-10T14:00:00Z",
+                            "check_out_dt": "2024-08-22T12:00:00Z",
+                            "total_cost": 110_000,
+                            "room": {
+                                "id": 2,
+                                "name": "Room #2 of hotel #1",
+                                "desc": "Colorful description for room #2 of hotel #1.",
+                                "hotel_id": 1,
+                                "premium_level_id": 2,
+                                "ordinal_number": 2,
+                                "maximum_persons": 3,
+                                "price": 10_000,
+                            },
                         },
-                    },
-                ],
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting user's bookings from the database "
                 "with filters by minimum check in date and maximum check in date",
                 id="-test-4",
@@ -7,6 +7,8 @@ from starlette import status
 
 import pytest
 
+from app.settings import settings
+
 from app.adapters.secondary.db.models.hotels_model import HotelsModel
 from app.adapters.secondary.db.models.hotels_services_model import HotelsServicesModel
 from app.adapters.secondary.db.models.images_model import ImagesModel
@@ -127,68 +129,71 @@ class TestGetHotels:
                 services_of_hotels_for_test,
                 rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 1,
-                        "name": "Test hotel #1",
-                        "desc": "Colorful description for hotel #1.",
-                        "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                        "stars": 5,
-                        "main_image_id": 1,
-                        "rooms_quantity": 1,
-                        "main_image": {
+                {
+                    "items": [
+                        {
                             "id": 1,
-                            "key": "hoter_1.jpg",
-                            "name": "Image of hoter #1",
-                            "desc": "Main image of hotel #1.",
-                            "room_id": None,
-                            "filepath": "media/images/bookings/hoter_1.jpg",
-                        },
-                        "services": [
-                            {
-                                "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
-                            },
-                            {
-                                "id": 3,
-                                "key": "spa",
-                                "name": "Availability of spa",
-                                "desc": None,
-                            },
-                        ],
-                    },
-                    {
-                        "id": 2,
-                        "name": "Test hotel #2",
-                        "desc": "Colorful description for hotel #2.",
-                        "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
-                        "stars": None,
-                        "main_image_id": None,
-                        "rooms_quantity": 1,
-                        "main_image": None,
-                        "services": [
-                            {
+                            "name": "Test hotel #1",
+                            "desc": "Colorful description for hotel #1.",
+                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                            "stars": 5,
+                            "main_image_id": 1,
+                            "rooms_quantity": 1,
+                            "main_image": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                                "key": "hoter_1.jpg",
+                                "name": "Image of hoter #1",
+                                "desc": "Main image of hotel #1.",
+                                "room_id": None,
+                                "filepath": "media/images/bookings/hoter_1.jpg",
                             },
-                        ],
-                    },
-                    {
-                        "id": 3,
-                        "name": "Test hotel #3",
-                        "desc": "Colorful description for hotel #3.",
-                        "location": "Komi Republic, Syktyvkar, Kommunisticheskaya street, 67",
-                        "stars": 4,
-                        "main_image_id": None,
-                        "rooms_quantity": 1,
-                        "main_image": None,
-                        "services": [],
-                    },
-                ],
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                                {
+                                    "id": 3,
+                                    "key": "spa",
+                                    "name": "Availability of spa",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                        {
+                            "id": 2,
+                            "name": "Test hotel #2",
+                            "desc": "Colorful description for hotel #2.",
+                            "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
+                            "stars": None,
+                            "main_image_id": None,
+                            "rooms_quantity": 1,
+                            "main_image": None,
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                        {
+                            "id": 3,
+                            "name": "Test hotel #3",
+                            "desc": "Colorful description for hotel #3.",
+                            "location": "Komi Republic, Syktyvkar, Kommunisticheskaya street, 67",
+                            "stars": 4,
+                            "main_image_id": None,
+                            "rooms_quantity": 1,
+                            "main_image": None,
+                            "services": [],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting hotels from the database without filters",
                 id="-test-1",
             ),
@@ -201,19 +206,22 @@ class TestGetHotels:
                 services_of_hotels_for_test,
                 rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 3,
-                        "name": "Test hotel #3",
-                        "desc": "Colorful description for hotel #3.",
-                        "location": "Komi Republic, Syktyvkar, Kommunisticheskaya street, 67",
-                        "stars": 4,
-                        "main_image_id": None,
-                        "rooms_quantity": 1,
-                        "main_image": None,
-                        "services": [],
-                    },
-                ],
+                {
+                    "items": [
+                        {
+                            "id": 3,
+                            "name": "Test hotel #3",
+                            "desc": "Colorful description for hotel #3.",
+                            "location": "Komi Republic, Syktyvkar, Kommunisticheskaya street, 67",
+                            "stars": 4,
+                            "main_image_id": None,
+                            "rooms_quantity": 1,
+                            "main_image": None,
+                            "services": [],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting hotels from the database with filter by location",
                 id="-test-2",
             ),
@@ -226,7 +234,7 @@ class TestGetHotels:
                 services_of_hotels_for_test,
                 rooms_for_test,
                 status.HTTP_200_OK,
-                [],
+                {"items": [], "next_cursor": None},
                 "Endpoint test for selecting hotels "
                 "with a filter by location for which there are no hotels in the database",
                 id="-test-3",
@@ -240,37 +248,40 @@ class TestGetHotels:
                 services_of_hotels_for_test,
                 rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 2,
-                        "name": "Test hotel #2",
-                        "desc": "Colorful description for hotel #2.",
-                        "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
-                        "stars": None,
-                        "main_image_id": None,
-                        "rooms_quantity": 1,
-                        "main_image": None,
-                        "services": [
-                            {
-                                "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
-                            },
-                        ],
-                    },
-                    {
-                        "id": 3,
-                        "name": "Test hotel #3",
-                        "desc": "Colorful description for hotel #3.",
-                        "location": "Komi Republic, Syktyvkar, Kommunisticheskaya street, 67",
-                        "stars": 4,
-                        "main_image_id": None,
-                        "rooms_quantity": 1,
-                        "main_image": None,
-                        "services": [],
-                    },
-                ],
+                {
+                    "items": [
+                        {
+                            "id": 2,
+                            "name": "Test hotel #2",
+                            "desc": "Colorful description for hotel #2.",
+                            "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
+                            "stars": None,
+                            "main_image_id": None,
+                            "rooms_quantity": 1,
+                            "main_image": None,
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                        {
+                            "id": 3,
+                            "name": "Test hotel #3",
+                            "desc": "Colorful description for hotel #3.",
+                            "location": "Komi Republic, Syktyvkar, Kommunisticheskaya street, 67",
+                            "stars": 4,
+                            "main_image_id": None,
+                            "rooms_quantity": 1,
+                            "main_image": None,
+                            "services": [],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting hotels from the database "
                 "with a filter based on the number of people wishing to stay in one hotel room",
                 id="-test-4",
@@ -284,7 +295,7 @@ class TestGetHotels:
                 services_of_hotels_for_test,
                 rooms_for_test,
                 status.HTTP_200_OK,
-                [],
+                {"items": [], "next_cursor": None},
                 "Endpoint test for selecting hotels "
                 "with a filter by the number of persons that exceeds all existing hotel rooms in the database",
                 id="-test-5",
@@ -298,39 +309,42 @@ class TestGetHotels:
                 services_of_hotels_for_test,
                 rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 1,
-                        "name": "Test hotel #1",
-                        "desc": "Colorful description for hotel #1.",
-                        "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                        "stars": 5,
-                        "main_image_id": 1,
-                        "rooms_quantity": 1,
-                        "main_image": {
+                {
+                    "items": [
+                        {
                             "id": 1,
-                            "key": "hoter_1.jpg",
-                            "name": "Image of hoter #1",
-                            "desc": "Main image of hotel #1.",
-                            "room_id": None,
-                            "filepath": "media/images/bookings/hoter_1.jpg",
-                        },
-                        "services": [
-                            {
+                            "name": "Test hotel #1",
+                            "desc": "Colorful description for hotel #1.",
+                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                            "stars": 5,
+                            "main_image_id": 1,
+                            "rooms_quantity": 1,
+                            "main_image": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
-                            },
-                            {
-                                "id": 3,
-                                "key": "spa",
-                                "name": "Availability of spa",
-                                "desc": None,
+                                "key": "hoter_1.jpg",
+                                "name": "Image of hoter #1",
+                                "desc": "Main image of hotel #1.",
+                                "room_id": None,
+                                "filepath": "media/images/bookings/hoter_1.jpg",
                             },
-                        ],
-                    },
-                ],
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                                {
+                                    "id": 3,
+                                    "key": "spa",
+                                    "name": "Availability of spa",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting hotels from the database "
                 "with a filter by the number of stars of the hotel",
                 id="-test-6",
@@ -344,7 +358,7 @@ class TestGetHotels:
                 services_of_hotels_for_test,
                 rooms_for_test,
                 status.HTTP_200_OK,
-                [],
+                {"items": [], "next_cursor": None},
                 "Endpoint test for selecting hotels "
                 "with a filter based on the number of stars for hotels, "
                 "which exceeds the number of stars for all hotels in the database",
@@ -359,39 +373,42 @@ class TestGetHotels:
                 services_of_hotels_for_test,
                 rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 1,
-                        "name": "Test hotel #1",
-                        "desc": "Colorful description for hotel #1.",
-                        "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                        "stars": 5,
-                        "main_image_id": 1,
-                        "rooms_quantity": 1,
-                        "main_image": {
+                {
+                    "items": [
+                        {
                             "id": 1,
-                            "key": "hoter_1.jpg",
-                            "name": "Image of hoter #1",
-                            "desc": "Main image of hotel #1.",
-                            "room_id": None,
-                            "filepath": "media/images/bookings/hoter_1.jpg",
-                        },
-                        "services": [
-                            {
+                            "name": "Test hotel #1",
+                            "desc": "Colorful description for hotel #1.",
+                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                            "stars": 5,
+                            "main_image_id": 1,
+                            "rooms_quantity": 1,
+                            "main_image": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                                "key": "hoter_1.jpg",
+                                "name": "Image of hoter #1",
+                                "desc": "Main image of hotel #1.",
+                                "room_id": None,
+                                "filepath": "media/images/bookings/hoter_1.jpg",
                             },
-                            {
-                                "id": 3,
-                                "key": "spa",
-                                "name": "Availability of spa",
-                                "desc": None,
-                            },
-                        ],
-                    },
-                ],
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                                {
+                                    "id": 3,
+                                    "key": "spa",
+                                    "name": "Availability of spa",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting hotels from the database with filter by hotel service",
                 id="-test-8",
             ),
@@ -404,7 +421,7 @@ class TestGetHotels:
                 services_of_hotels_for_test,
                 rooms_for_test,
                 status.HTTP_200_OK,
-                [],
+                {"items": [], "next_cursor": None},
                 "Endpoint test for selecting hotels from the database "
                 "with a filter by service that is not associated with any of the hotels",
                 id="-test-9",
@@ -421,39 +438,42 @@ class TestGetHotels:
                 services_of_hotels_for_test,
                 rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 1,
-                        "name": "Test hotel #1",
-                        "desc": "Colorful description for hotel #1.",
-                        "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                        "stars": 5,
-                        "main_image_id": 1,
-                        "rooms_quantity": 1,
-                        "main_image": {
+                {
+                    "items": [
+                        {
                             "id": 1,
-                            "key": "hoter_1.jpg",
-                            "name": "Image of hoter #1",
-                            "desc": "Main image of hotel #1.",
-                            "room_id": None,
-                            "filepath": "media/images/bookings/hoter_1.jpg",
-                        },
-                        "services": [
-                            {
+                            "name": "Test hotel #1",
+                            "desc": "Colorful description for hotel #1.",
+                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                            "stars": 5,
+                            "main_image_id": 1,
+                            "rooms_quantity": 1,
+                            "main_image": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
-                            },
-                            {
-                                "id": 3,
-                                "key": "spa",
-                                "name": "Availability of spa",
-                                "desc": None,
+                                "key": "hoter_1.jpg",
+                                "name": "Image of hoter #1",
+                                "desc": "Main image of hotel #1.",
+                                "room_id": None,
+                                "filepath": "media/images/bookings/hoter_1.jpg",
                             },
-                        ],
-                    },
-                ],
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                                {
+                                    "id": 3,
+                                    "key": "spa",
+                                    "name": "Availability of spa",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting hotels from the database with all filters",
                 id="-test-10",
             ),
@@ -487,6 +507,137 @@ class TestGetHotels:
                 "with a filter based on the number of stars exceeding the allowed number",
                 id="-test-11",
             ),
+            pytest.param(
+                {
+                    "limit": 1,
+                },
+                images_for_test,
+                hotels_for_test,
+                services_of_hotels_for_test,
+                rooms_for_test,
+                status.HTTP_200_OK,
+                {
+                    "items": [
+                        {
+                            "id": 1,
+                            "name": "Test hotel #1",
+                            "desc": "Colorful description for hotel #1.",
+                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                            "stars": 5,
+                            "main_image_id": 1,
+                            "rooms_quantity": 1,
+                            "main_image": {
+                                "id": 1,
+                                "key": "hoter_1.jpg",
+                                "name": "Image of hoter #1",
+                                "desc": "Main image of hotel #1.",
+                                "room_id": None,
+                                "filepath": "media/images/bookings/hoter_1.jpg",
+                            },
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                                {
+                                    "id": 3,
+                                    "key": "spa",
+                                    "name": "Availability of spa",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": "eyJpZCI6IDF9",
+                },
+                "Endpoint test for selecting the first page of hotels from the database",
+                id="-test-12",
+            ),
+            pytest.param(
+                {
+                    "limit": 2,
+                    "cursor": "eyJpZCI6IDF9",
+                },
+                images_for_test,
+                hotels_for_test,
+                services_of_hotels_for_test,
+                rooms_for_test,
+                status.HTTP_200_OK,
+                {
+                    "items": [
+                        {
+                            "id": 2,
+                            "name": "Test hotel #2",
+                            "desc": "Colorful description for hotel #2.",
+                            "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
+                            "stars": None,
+                            "main_image_id": None,
+                            "rooms_quantity": 1,
+                            "main_image": None,
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                        {
+                            "id": 3,
+                            "name": "Test hotel #3",
+                            "desc": "Colorful description for hotel #3.",
+                            "location": "Komi Republic, Syktyvkar, Kommunisticheskaya street, 67",
+                            "stars": 4,
+                            "main_image_id": None,
+                            "rooms_quantity": 1,
+                            "main_image": None,
+                            "services": [],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
+                "Endpoint test for selecting the last page of hotels from the database by cursor",
+                id="-test-13",
+            ),
+            pytest.param(
+                {
+                    "cursor": "not-a-cursor",
+                },
+                images_for_test,
+                hotels_for_test,
+                services_of_hotels_for_test,
+                rooms_for_test,
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                {
+                    "detail": "The pagination cursor is invalid.",
+                    "extras": {
+                        "cursor": "not-a-cursor",
+                    },
+                },
+                "Endpoint test for selecting hotels from the database with an invalid pagination cursor",
+                id="-test-14",
+            ),
+            pytest.param(
+                {
+                    "limit": 0,
+                },
+                images_for_test,
+                hotels_for_test,
+                services_of_hotels_for_test,
+                rooms_for_test,
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                {
+                    "detail": f"The page size must be between 1 and {settings.MAX_PAGE_SIZE}.",
+                    "extras": {
+                        "limit": 0,
+                    },
+                },
+                "Endpoint test for selecting hotels from the database with a page size out of bounds",
+                id="-test-15",
+            ),
         ],
     )
     @pytest.mark.asyncio
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Any
 
 from fastapi import FastAPI
@@ -5,11 +6,16 @@ from httpx import AsyncClient, ASGITransport
 from loguru import logger
 from starlette import status
 
+import json
 import pytest
 
+from app.settings import settings
+
+from app.adapters.secondary.db.models.bookings_model import BookingsModel
 from app.adapters.secondary.db.models.hotels_model import HotelsModel
 from app.adapters.secondary.db.models.rooms_model import RoomsModel
 from app.adapters.secondary.db.models.rooms_services_model import RoomsServicesModel
+from app.adapters.secondary.db.models.users_model import UsersModel
 
 from tests.db_preparer import DBPreparer
 
@@ -76,6 +82,37 @@ services_of_rooms_for_test = [
     },
 ]
 
+users_for_test = [
+    {
+        "id": 1,
+        "email": "user1@example.com",
+        "phone": "+7-999-999-99-97",
+        "first_name": "Freddie",
+        "last_name": "Mercury",
+        "password": "Password1",
+    },
+]
+bookings_for_test = [
+    {
+        "id": 1,
+        "user_id": 1,
+        "room_id": 2,
+        "number_of_persons": 2,
+        "check_in_dt": datetime(year=2024, month=8, day=10, hour=14, tzinfo=settings.DB_TIME_ZONE),
+        "check_out_dt": datetime(year=2024, month=8, day=22, hour=12, tzinfo=settings.DB_TIME_ZONE),
+        "total_cost": 110_000,
+    },
+    {
+        "id": 2,
+        "user_id": 1,
+        "room_id": 3,
+        "number_of_persons": 2,
+        "check_in_dt": datetime(year=2024, month=8, day=20, hour=14, tzinfo=settings.DB_TIME_ZONE),
+        "check_out_dt": datetime(year=2024, month=8, day=25, hour=12, tzinfo=settings.DB_TIME_ZONE),
+        "total_cost": 250_000,
+    },
+]
+
 
 @pytest.mark.asyncio
 class TestGetRooms:
@@ -114,98 +151,101 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 1,
-                        "name": "Room #1 of hotel #1",
-                        "desc": "Colorful description for room #1 of hotel #1.",
-                        "hotel_id": 1,
-                        "premium_level_id": None,
-                        "ordinal_number": 1,
-                        "maximum_persons": 2,
-                        "price": 5_000,
-                        "hotel": {
-                            "id": 1,
-                            "name": "Test hotel #1",
-                            "desc": "Colorful description for hotel #1.",
-                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                            "stars": 3,
-                            "main_image_id": None,
-                        },
-                        "premium_level": None,
-                        "services": [],
-                    },
-                    {
-                        "id": 2,
-                        "name": "Room #2 of hotel #1",
-                        "desc": "Colorful description for room #2 of hotel #1.",
-                        "hotel_id": 1,
-                        "premium_level_id": 2,
-                        "ordinal_number": 2,
-                        "maximum_persons": 3,
-                        "price": 10_000,
-                        "hotel": {
+                {
+                    "items": [
+                        {
                             "id": 1,
-                            "name": "Test hotel #1",
-                            "desc": "Colorful description for hotel #1.",
-                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                            "stars": 3,
-                            "main_image_id": None,
-                        },
-                        "premium_level": {
-                            "id": 2,
-                            "key": "comfort",
-                            "name": "Comfort service",
-                            "desc": "Average service for the level of the hotel to which the room belongs.",
-                        },
-                        "services": [
-                            {
+                            "name": "Room #1 of hotel #1",
+                            "desc": "Colorful description for room #1 of hotel #1.",
+                            "hotel_id": 1,
+                            "premium_level_id": None,
+                            "ordinal_number": 1,
+                            "maximum_persons": 2,
+                            "price": 5_000,
+                            "hotel": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                                "name": "Test hotel #1",
+                                "desc": "Colorful description for hotel #1.",
+                                "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                                "stars": 3,
+                                "main_image_id": None,
                             },
-                        ],
-                    },
-                    {
-                        "id": 3,
-                        "name": "Room #1 of hotel #2",
-                        "desc": "Colorful description for room #1 of hotel #2.",
-                        "hotel_id": 2,
-                        "premium_level_id": 4,
-                        "ordinal_number": 1,
-                        "maximum_persons": 3,
-                        "price": 50_000,
-                        "hotel": {
-                            "id": 2,
-                            "name": "Test hotel #2",
-                            "desc": "Colorful description for hotel #2.",
-                            "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
-                            "stars": 5,
-                            "main_image_id": None,
+                            "premium_level": None,
+                            "services": [],
                         },
-                        "premium_level": {
-                            "id": 4,
-                            "key": "presidential",
-                            "name": "Presidential service",
-                            "desc": "Presidential service.",
-                        },
-                        "services": [
-                            {
+                        {
+                            "id": 2,
+                            "name": "Room #2 of hotel #1",
+                            "desc": "Colorful description for room #2 of hotel #1.",
+                            "hotel_id": 1,
+                            "premium_level_id": 2,
+                            "ordinal_number": 2,
+                            "maximum_persons": 3,
+                            "price": 10_000,
+                            "hotel": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                                "name": "Test hotel #1",
+                                "desc": "Colorful description for hotel #1.",
+                                "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                                "stars": 3,
+                                "main_image_id": None,
                             },
-                            {
+                            "premium_level": {
                                 "id": 2,
-                                "key": "pool",
-                                "name": "Swimming pool",
-                                "desc": None,
+                                "key": "comfort",
+                                "name": "Comfort service",
+                                "desc": "Average service for the level of the hotel to which the room belongs.",
                             },
-                        ],
-                    },
-                ],
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                        {
+                            "id": 3,
+                            "name": "Room #1 of hotel #2",
+                            "desc": "Colorful description for room #1 of hotel #2.",
+                            "hotel_id": 2,
+                            "premium_level_id": 4,
+                            "ordinal_number": 1,
+                            "maximum_persons": 3,
+                            "price": 50_000,
+                            "hotel": {
+                                "id": 2,
+                                "name": "Test hotel #2",
+                                "desc": "Colorful description for hotel #2.",
+                                "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
+                                "stars": 5,
+                                "main_image_id": None,
+                            },
+                            "premium_level": {
+                                "id": 4,
+                                "key": "presidential",
+                                "name": "Presidential service",
+                                "desc": "Presidential service.",
+                            },
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                                {
+                                    "id": 2,
+                                    "key": "pool",
+                                    "name": "Swimming pool",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting rooms from the database without filters",
                 id="-test-1",
             ),
@@ -217,78 +257,81 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 2,
-                        "name": "Room #2 of hotel #1",
-                        "desc": "Colorful description for room #2 of hotel #1.",
-                        "hotel_id": 1,
-                        "premium_level_id": 2,
-                        "ordinal_number": 2,
-                        "maximum_persons": 3,
-                        "price": 10_000,
-                        "hotel": {
-                            "id": 1,
-                            "name": "Test hotel #1",
-                            "desc": "Colorful description for hotel #1.",
-                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                            "stars": 3,
-                            "main_image_id": None,
-                        },
-                        "premium_level": {
+                {
+                    "items": [
+                        {
                             "id": 2,
-                            "key": "comfort",
-                            "name": "Comfort service",
-                            "desc": "Average service for the level of the hotel to which the room belongs.",
-                        },
-                        "services": [
-                            {
+                            "name": "Room #2 of hotel #1",
+                            "desc": "Colorful description for room #2 of hotel #1.",
+                            "hotel_id": 1,
+                            "premium_level_id": 2,
+                            "ordinal_number": 2,
+                            "maximum_persons": 3,
+                            "price": 10_000,
+                            "hotel": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                                "name": "Test hotel #1",
+                                "desc": "Colorful description for hotel #1.",
+                                "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                                "stars": 3,
+                                "main_image_id": None,
                             },
-                        ],
-                    },
-                    {
-                        "id": 3,
-                        "name": "Room #1 of hotel #2",
-                        "desc": "Colorful description for room #1 of hotel #2.",
-                        "hotel_id": 2,
-                        "premium_level_id": 4,
-                        "ordinal_number": 1,
-                        "maximum_persons": 3,
-                        "price": 50_000,
-                        "hotel": {
-                            "id": 2,
-                            "name": "Test hotel #2",
-                            "desc": "Colorful description for hotel #2.",
-                            "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
-                            "stars": 5,
-                            "main_image_id": None,
-                        },
-                        "premium_level": {
-                            "id": 4,
-                            "key": "presidential",
-                            "name": "Presidential service",
-                            "desc": "Presidential service.",
-                        },
-                        "services": [
-                            {
-                                "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                            "premium_level": {
+                                "id": 2,
+                                "key": "comfort",
+                                "name": "Comfort service",
+                                "desc": "Average service for the level of the hotel to which the room belongs.",
                             },
-                            {
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                        {
+                            "id": 3,
+                            "name": "Room #1 of hotel #2",
+                            "desc": "Colorful description for room #1 of hotel #2.",
+                            "hotel_id": 2,
+                            "premium_level_id": 4,
+                            "ordinal_number": 1,
+                            "maximum_persons": 3,
+                            "price": 50_000,
+                            "hotel": {
                                 "id": 2,
-                                "key": "pool",
-                                "name": "Swimming pool",
-                                "desc": None,
+                                "name": "Test hotel #2",
+                                "desc": "Colorful description for hotel #2.",
+                                "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
+                                "stars": 5,
+                                "main_image_id": None,
                             },
-                        ],
-                    },
-                ],
+                            "premium_level": {
+                                "id": 4,
+                                "key": "presidential",
+                                "name": "Presidential service",
+                                "desc": "Presidential service.",
+                            },
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                                {
+                                    "id": 2,
+                                    "key": "pool",
+                                    "name": "Swimming pool",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting rooms from the database "
                 "with a filter based on the minimum room rental price",
                 id="-test-2",
@@ -301,7 +344,7 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [],
+                {"items": [], "next_cursor": None},
                 "Endpoint test for selecting rooms from the database "
                 "with a filter based on the minimum price for renting a room "
                 "that exceeds the cost of renting any of the rooms existing in the database",
@@ -315,60 +358,63 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 1,
-                        "name": "Room #1 of hotel #1",
-                        "desc": "Colorful description for room #1 of hotel #1.",
-                        "hotel_id": 1,
-                        "premium_level_id": None,
-                        "ordinal_number": 1,
-                        "maximum_persons": 2,
-                        "price": 5_000,
-                        "hotel": {
-                            "id": 1,
-                            "name": "Test hotel #1",
-                            "desc": "Colorful description for hotel #1.",
-                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                            "stars": 3,
-                            "main_image_id": None,
-                        },
-                        "premium_level": None,
-                        "services": [],
-                    },
-                    {
-                        "id": 2,
-                        "name": "Room #2 of hotel #1",
-                        "desc": "Colorful description for room #2 of hotel #1.",
-                        "hotel_id": 1,
-                        "premium_level_id": 2,
-                        "ordinal_number": 2,
-                        "maximum_persons": 3,
-                        "price": 10_000,
-                        "hotel": {
+                {
+                    "items": [
+                        {
                             "id": 1,
-                            "name": "Test hotel #1",
-                            "desc": "Colorful description for hotel #1.",
-                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                            "stars": 3,
-                            "main_image_id": None,
+                            "name": "Room #1 of hotel #1",
+                            "desc": "Colorful description for room #1 of hotel #1.",
+                            "hotel_id": 1,
+                            "premium_level_id": None,
+                            "ordinal_number": 1,
+                            "maximum_persons": 2,
+                            "price": 5_000,
+                            "hotel": {
+                                "id": 1,
+                                "name": "Test hotel #1",
+                                "desc": "Colorful description for hotel #1.",
+                                "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                                "stars": 3,
+                                "main_image_id": None,
+                            },
+                            "premium_level": None,
+                            "services": [],
                         },
-                        "premium_level": {
+                        {
                             "id": 2,
-                            "key": "comfort",
-                            "name": "Comfort service",
-                            "desc": "Average service for the level of the hotel to which the room belongs.",
-                        },
-                        "services": [
-                            {
+                            "name": "Room #2 of hotel #1",
+                            "desc": "Colorful description for room #2 of hotel #1.",
+                            "hotel_id": 1,
+                            "premium_level_id": 2,
+                            "ordinal_number": 2,
+                            "maximum_persons": 3,
+                            "price": 10_000,
+                            "hotel": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                                "name": "Test hotel #1",
+                                "desc": "Colorful description for hotel #1.",
+                                "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                                "stars": 3,
+                                "main_image_id": None,
                             },
-                        ],
-                    },
-                ],
+                            "premium_level": {
+                                "id": 2,
+                                "key": "comfort",
+                                "name": "Comfort service",
+                                "desc": "Average service for the level of the hotel to which the room belongs.",
+                            },
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting rooms from the database "
                 "with a filter based on the maximum room rental price",
                 id="-test-4",
@@ -381,7 +427,7 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [],
+                {"items": [], "next_cursor": None},
                 "Endpoint test for selecting rooms from the database "
                 "with a filter based on the maximum room rental price less than the rental cost of any existing room",
                 id="-test-5",
@@ -395,40 +441,43 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 2,
-                        "name": "Room #2 of hotel #1",
-                        "desc": "Colorful description for room #2 of hotel #1.",
-                        "hotel_id": 1,
-                        "premium_level_id": 2,
-                        "ordinal_number": 2,
-                        "maximum_persons": 3,
-                        "price": 10_000,
-                        "hotel": {
-                            "id": 1,
-                            "name": "Test hotel #1",
-                            "desc": "Colorful description for hotel #1.",
-                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                            "stars": 3,
-                            "main_image_id": None,
-                        },
-                        "premium_level": {
+                {
+                    "items": [
+                        {
                             "id": 2,
-                            "key": "comfort",
-                            "name": "Comfort service",
-                            "desc": "Average service for the level of the hotel to which the room belongs.",
-                        },
-                        "services": [
-                            {
+                            "name": "Room #2 of hotel #1",
+                            "desc": "Colorful description for room #2 of hotel #1.",
+                            "hotel_id": 1,
+                            "premium_level_id": 2,
+                            "ordinal_number": 2,
+                            "maximum_persons": 3,
+                            "price": 10_000,
+                            "hotel": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                                "name": "Test hotel #1",
+                                "desc": "Colorful description for hotel #1.",
+                                "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                                "stars": 3,
+                                "main_image_id": None,
                             },
-                        ],
-                    },
-                ],
+                            "premium_level": {
+                                "id": 2,
+                                "key": "comfort",
+                                "name": "Comfort service",
+                                "desc": "Average service for the level of the hotel to which the room belongs.",
+                            },
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting rooms from the database "
                 "With filters for the minimum and maximum room rental price",
                 id="-test-6",
@@ -441,60 +490,63 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 1,
-                        "name": "Room #1 of hotel #1",
-                        "desc": "Colorful description for room #1 of hotel #1.",
-                        "hotel_id": 1,
-                        "premium_level_id": None,
-                        "ordinal_number": 1,
-                        "maximum_persons": 2,
-                        "price": 5_000,
-                        "hotel": {
-                            "id": 1,
-                            "name": "Test hotel #1",
-                            "desc": "Colorful description for hotel #1.",
-                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                            "stars": 3,
-                            "main_image_id": None,
-                        },
-                        "premium_level": None,
-                        "services": [],
-                    },
-                    {
-                        "id": 2,
-                        "name": "Room #2 of hotel #1",
-                        "desc": "Colorful description for room #2 of hotel #1.",
-                        "hotel_id": 1,
-                        "premium_level_id": 2,
-                        "ordinal_number": 2,
-                        "maximum_persons": 3,
-                        "price": 10_000,
-                        "hotel": {
+                {
+                    "items": [
+                        {
                             "id": 1,
-                            "name": "Test hotel #1",
-                            "desc": "Colorful description for hotel #1.",
-                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                            "stars": 3,
-                            "main_image_id": None,
+                            "name": "Room #1 of hotel #1",
+                            "desc": "Colorful description for room #1 of hotel #1.",
+                            "hotel_id": 1,
+                            "premium_level_id": None,
+                            "ordinal_number": 1,
+                            "maximum_persons": 2,
+                            "price": 5_000,
+                            "hotel": {
+                                "id": 1,
+                                "name": "Test hotel #1",
+                                "desc": "Colorful description for hotel #1.",
+                                "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                                "stars": 3,
+                                "main_image_id": None,
+                            },
+                            "premium_level": None,
+                            "services": [],
                         },
-                        "premium_level": {
+                        {
                             "id": 2,
-                            "key": "comfort",
-                            "name": "Comfort service",
-                            "desc": "Average service for the level of the hotel to which the room belongs.",
-                        },
-                        "services": [
-                            {
+                            "name": "Room #2 of hotel #1",
+                            "desc": "Colorful description for room #2 of hotel #1.",
+                            "hotel_id": 1,
+                            "premium_level_id": 2,
+                            "ordinal_number": 2,
+                            "maximum_persons": 3,
+                            "price": 10_000,
+                            "hotel": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                                "name": "Test hotel #1",
+                                "desc": "Colorful description for hotel #1.",
+                                "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                                "stars": 3,
+                                "main_image_id": None,
                             },
-                        ],
-                    },
-                ],
+                            "premium_level": {
+                                "id": 2,
+                                "key": "comfort",
+                                "name": "Comfort service",
+                                "desc": "Average service for the level of the hotel to which the room belongs.",
+                            },
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting rooms from the database with a filter by hotel ID",
                 id="-test-7",
             ),
@@ -506,7 +558,7 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [],
+                {"items": [], "next_cursor": None},
                 "Endpoint test for selecting rooms from the database with filter by non-existent hotel ID",
                 id="-test-8",
             ),
@@ -518,78 +570,81 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 2,
-                        "name": "Room #2 of hotel #1",
-                        "desc": "Colorful description for room #2 of hotel #1.",
-                        "hotel_id": 1,
-                        "premium_level_id": 2,
-                        "ordinal_number": 2,
-                        "maximum_persons": 3,
-                        "price": 10_000,
-                        "hotel": {
-                            "id": 1,
-                            "name": "Test hotel #1",
-                            "desc": "Colorful description for hotel #1.",
-                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                            "stars": 3,
-                            "main_image_id": None,
-                        },
-                        "premium_level": {
+                {
+                    "items": [
+                        {
                             "id": 2,
-                            "key": "comfort",
-                            "name": "Comfort service",
-                            "desc": "Average service for the level of the hotel to which the room belongs.",
-                        },
-                        "services": [
-                            {
+                            "name": "Room #2 of hotel #1",
+                            "desc": "Colorful description for room #2 of hotel #1.",
+                            "hotel_id": 1,
+                            "premium_level_id": 2,
+                            "ordinal_number": 2,
+                            "maximum_persons": 3,
+                            "price": 10_000,
+                            "hotel": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                                "name": "Test hotel #1",
+                                "desc": "Colorful description for hotel #1.",
+                                "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                                "stars": 3,
+                                "main_image_id": None,
                             },
-                        ],
-                    },
-                    {
-                        "id": 3,
-                        "name": "Room #1 of hotel #2",
-                        "desc": "Colorful description for room #1 of hotel #2.",
-                        "hotel_id": 2,
-                        "premium_level_id": 4,
-                        "ordinal_number": 1,
-                        "maximum_persons": 3,
-                        "price": 50_000,
-                        "hotel": {
-                            "id": 2,
-                            "name": "Test hotel #2",
-                            "desc": "Colorful description for hotel #2.",
-                            "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
-                            "stars": 5,
-                            "main_image_id": None,
-                        },
-                        "premium_level": {
-                            "id": 4,
-                            "key": "presidential",
-                            "name": "Presidential service",
-                            "desc": "Presidential service.",
-                        },
-                        "services": [
-                            {
-                                "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                            "premium_level": {
+                                "id": 2,
+                                "key": "comfort",
+                                "name": "Comfort service",
+                                "desc": "Average service for the level of the hotel to which the room belongs.",
                             },
-                            {
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                        {
+                            "id": 3,
+                            "name": "Room #1 of hotel #2",
+                            "desc": "Colorful description for room #1 of hotel #2.",
+                            "hotel_id": 2,
+                            "premium_level_id": 4,
+                            "ordinal_number": 1,
+                            "maximum_persons": 3,
+                            "price": 50_000,
+                            "hotel": {
                                 "id": 2,
-                                "key": "pool",
-                                "name": "Swimming pool",
-                                "desc": None,
+                                "name": "Test hotel #2",
+                                "desc": "Colorful description for hotel #2.",
+                                "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
+                                "stars": 5,
+                                "main_image_id": None,
                             },
-                        ],
-                    },
-                ],
+                            "premium_level": {
+                                "id": 4,
+                                "key": "presidential",
+                                "name": "Presidential service",
+                                "desc": "Presidential service.",
+                            },
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                                {
+                                    "id": 2,
+                                    "key": "pool",
+                                    "name": "Swimming pool",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting rooms from the database with filter by number of guests",
                 id="-test-9",
             ),
@@ -601,7 +656,7 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [],
+                {"items": [], "next_cursor": None},
                 "Endpoint test for selecting rooms from the database "
                 "with a filter by the number of guests exceeding the capacity of any of the rooms in the database",
                 id="-test-10",
@@ -614,40 +669,43 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 2,
-                        "name": "Room #2 of hotel #1",
-                        "desc": "Colorful description for room #2 of hotel #1.",
-                        "hotel_id": 1,
-                        "premium_level_id": 2,
-                        "ordinal_number": 2,
-                        "maximum_persons": 3,
-                        "price": 10_000,
-                        "hotel": {
-                            "id": 1,
-                            "name": "Test hotel #1",
-                            "desc": "Colorful description for hotel #1.",
-                            "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
-                            "stars": 3,
-                            "main_image_id": None,
-                        },
-                        "premium_level": {
+                {
+                    "items": [
+                        {
                             "id": 2,
-                            "key": "comfort",
-                            "name": "Comfort service",
-                            "desc": "Average service for the level of the hotel to which the room belongs.",
-                        },
-                        "services": [
-                            {
+                            "name": "Room #2 of hotel #1",
+                            "desc": "Colorful description for room #2 of hotel #1.",
+                            "hotel_id": 1,
+                            "premium_level_id": 2,
+                            "ordinal_number": 2,
+                            "maximum_persons": 3,
+                            "price": 10_000,
+                            "hotel": {
                                 "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
+                                "name": "Test hotel #1",
+                                "desc": "Colorful description for hotel #1.",
+                                "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+                                "stars": 3,
+                                "main_image_id": None,
                             },
-                        ],
-                    },
-                ],
+                            "premium_level": {
+                                "id": 2,
+                                "key": "comfort",
+                                "name": "Comfort service",
+                                "desc": "Average service for the level of the hotel to which the room belongs.",
+                            },
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting rooms from the database with filtering by premium levels",
                 id="-test-11",
             ),
@@ -659,7 +717,7 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [],
+                {"items": [], "next_cursor": None},
                 "Endpoint test for selecting rooms from the database "
                 "with filtering by premium levels for which there are no rooms in the database",
                 id="-test-12",
@@ -672,46 +730,49 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 3,
-                        "name": "Room #1 of hotel #2",
-                        "desc": "Colorful description for room #1 of hotel #2.",
-                        "hotel_id": 2,
-                        "premium_level_id": 4,
-                        "ordinal_number": 1,
-                        "maximum_persons": 3,
-                        "price": 50_000,
-                        "hotel": {
-                            "id": 2,
-                            "name": "Test hotel #2",
-                            "desc": "Colorful description for hotel #2.",
-                            "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
-                            "stars": 5,
-                            "main_image_id": None,
-                        },
-                        "premium_level": {
-                            "id": 4,
-                            "key": "presidential",
-                            "name": "Presidential service",
-                            "desc": "Presidential service.",
-                        },
-                        "services": [
-                            {
-                                "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
-                            },
-                            {
+                {
+                    "items": [
+                        {
+                            "id": 3,
+                            "name": "Room #1 of hotel #2",
+                            "desc": "Colorful description for room #1 of hotel #2.",
+                            "hotel_id": 2,
+                            "premium_level_id": 4,
+                            "ordinal_number": 1,
+                            "maximum_persons": 3,
+                            "price": 50_000,
+                            "hotel": {
                                 "id": 2,
-                                "key": "pool",
-                                "name": "Swimming pool",
-                                "desc": None,
+                                "name": "Test hotel #2",
+                                "desc": "Colorful description for hotel #2.",
+                                "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
+                                "stars": 5,
+                                "main_image_id": None,
                             },
-                        ],
-                    },
-                ],
+                            "premium_level": {
+                                "id": 4,
+                                "key": "presidential",
+                                "name": "Presidential service",
+                                "desc": "Presidential service.",
+                            },
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                                {
+                                    "id": 2,
+                                    "key": "pool",
+                                    "name": "Swimming pool",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting rooms from the database with filtering by room service",
                 id="-test-13",
             ),
@@ -728,46 +789,49 @@ class TestGetRooms:
                 rooms_for_test,
                 services_of_rooms_for_test,
                 status.HTTP_200_OK,
-                [
-                    {
-                        "id": 3,
-                        "name": "Room #1 of hotel #2",
-                        "desc": "Colorful description for room #1 of hotel #2.",
-                        "hotel_id": 2,
-                        "premium_level_id": 4,
-                        "ordinal_number": 1,
-                        "maximum_persons": 3,
-                        "price": 50_000,
-                        "hotel": {
-                            "id": 2,
-                            "name": "Test hotel #2",
-                            "desc": "Colorful description for hotel #2.",
-                            "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
-                            "stars": 5,
-                            "main_image_id": None,
-                        },
-                        "premium_level": {
-                            "id": 4,
-                            "key": "presidential",
-                            "name": "Presidential service",
-                            "desc": "Presidential service.",
-                        },
-                        "services": [
-                            {
-                                "id": 1,
-                                "key": "wifi",
-                                "name": "Free Wi-Fi",
-                                "desc": None,
-                            },
-                            {
+                {
+                    "items": [
+                        {
+                            "id": 3,
+                            "name": "Room #1 of hotel #2",
+                            "desc": "Colorful description for room #1 of hotel #2.",
+                            "hotel_id": 2,
+                            "premium_level_id": 4,
+                            "ordinal_number": 1,
+                            "maximum_persons": 3,
+                            "price": 50_000,
+                            "hotel": {
                                 "id": 2,
-                                "key": "pool",
-                                "name": "Swimming pool",
-                                "desc": None,
+                                "name": "Test hotel #2",
+                                "desc": "Colorful description for hotel #2.",
+                                "location": "Altai Republic, Maiminsky district, Barangol village, Chuyskaya street 40a",
+                                "stars": 5,
+                                "main_image_id": None,
                             },
-                        ],
-                    },
-                ],
+                            "premium_level": {
+                                "id": 4,
+                                "key": "presidential",
+                                "name": "Presidential service",
+                                "desc": "Presidential service.",
+                            },
+                            "services": [
+                                {
+                                    "id": 1,
+                                    "key": "wifi",
+                                    "name": "Free Wi-Fi",
+                                    "desc": None,
+                                },
+                                {
+                                    "id": 2,
+                                    "key": "pool",
+                                    "name": "Swimming pool",
+                                    "desc": None,
+                                },
+                            ],
+                        },
+                    ],
+                    "next_cursor": None,
+                },
                 "Endpoint test for selecting rooms from the database all filters",
                 id="-test-14",
             ),
@@ -829,3 +893,193 @@ class TestGetRooms:
 
             assert status_code_of_response == expected_status_code, "The returned status code is not as expected"
             assert dict_of_response == expected_result, "The data returned by the endpoint is not as expected"
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "query_params",
+            "expected_status_code",
+            "expected_result",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                {
+                    "check_in_date": "2024-08-05",
+                    "check_out_date": "2024-08-10",
+                },
+                status.HTTP_200_OK,
+                [1, 2, 3],
+                "Endpoint test for selecting rooms with a stay period ending on the check-in date of a booking",
+                id="-test-1",
+            ),
+            pytest.param(
+                {
+                    "check_in_date": "2024-08-15",
+                    "check_out_date": "2024-08-18",
+                },
+                status.HTTP_200_OK,
+                [1, 3],
+                "Endpoint test for selecting rooms with a stay period inside an existing booking",
+                id="-test-2",
+            ),
+            pytest.param(
+                {
+                    "check_in_date": "2024-08-21",
+                    "check_out_date": "2024-08-23",
+                },
+                status.HTTP_200_OK,
+                [1],
+                "Endpoint test for selecting rooms with a stay period overlapping several bookings",
+                id="-test-3",
+            ),
+            pytest.param(
+                {
+                    "check_in_date": "2024-08-25",
+                    "check_out_date": "2024-08-28",
+                },
+                status.HTTP_200_OK,
+                [1, 2, 3],
+                "Endpoint test for selecting rooms with a stay period starting on the check-out date of a booking",
+                id="-test-4",
+            ),
+            pytest.param(
+                {
+                    "check_in_date": "2024-08-21",
+                    "check_out_date": "2024-08-23",
+                    "hotel_id": 2,
+                },
+                status.HTTP_200_OK,
+                [],
+                "Endpoint test for selecting rooms with a stay period and other filters",
+                id="-test-5",
+            ),
+            pytest.param(
+                {
+                    "check_in_date": "2024-08-21",
+                },
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                {
+                    "detail": "Check-in and check-out dates must be passed together.",
+                    "extras": {
+                        "check_in_date": "2024-08-21",
+                        "check_out_date": None,
+                    },
+                },
+                "Endpoint test for selecting rooms with a stay period without check-out date",
+                id="-test-6",
+            ),
+            pytest.param(
+                {
+                    "check_in_date": "2024-08-23",
+                    "check_out_date": "2024-08-21",
+                },
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                {
+                    "detail": "Check-out date must be later than check-in date.",
+                    "extras": {
+                        "check_in_date": "2024-08-23",
+                        "check_out_date": "2024-08-21",
+                    },
+                },
+                "Endpoint test for selecting rooms with an inconsistent stay period",
+                id="-test-7",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_get_rooms_by_stay_period(
+        self,
+        query_params: dict[str, Any],
+        expected_status_code: int,
+        expected_result: list[int] | dict[str, Any],
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        # Inserting test data into the database before each test
+        #   and deleting this data after each test
+        async with (
+            self.db_preparer.insert_test_data(orm_model=HotelsModel, data_for_insert=hotels_for_test),
+            self.db_preparer.insert_test_data(orm_model=RoomsModel, data_for_insert=rooms_for_test),
+            self.db_preparer.insert_test_data(orm_model=UsersModel, data_for_insert=users_for_test),
+            self.db_preparer.insert_test_data(orm_model=BookingsModel, data_for_insert=bookings_for_test),
+        ):
+            # Client for test requests to API
+            async with self.client_maker(transport=self.transport_for_client) as client:
+                api_response = await client.get(
+                    url=f"http://test{self.url}",
+                    params=query_params,
+                )
+
+                status_code_of_response = api_response.status_code
+                logger.debug(status_code_of_response)
+                dict_of_response = api_response.json()
+                logger.debug(dict_of_response)
+
+            if status_code_of_response == status.HTTP_200_OK:
+                dict_of_response = [room["id"] for room in dict_of_response["items"]]
+
+            assert status_code_of_response == expected_status_code, "The returned status code is not as expected"
+            assert dict_of_response == expected_result, "The data returned by the endpoint is not as expected"
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "query_params",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                None,
+                "Endpoint test for streaming all rooms",
+                id="-test-1",
+            ),
+            pytest.param(
+                {
+                    "check_in_date": "2024-08-15",
+                    "check_out_date": "2024-08-18",
+                    "services": [1],
+                },
+                "Endpoint test for streaming rooms with a stay period and services",
+                id="-test-2",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_stream_rooms(
+        self,
+        query_params: dict[str, Any] | None,
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        # Inserting test data into the database before each test
+        #   and deleting this data after each test
+        async with (
+            self.db_preparer.insert_test_data(orm_model=HotelsModel, data_for_insert=hotels_for_test),
+            self.db_preparer.insert_test_data(orm_model=RoomsModel, data_for_insert=rooms_for_test),
+            self.db_preparer.insert_test_data(
+                orm_model=RoomsServicesModel,
+                data_for_insert=services_of_rooms_for_test,
+            ),
+            self.db_preparer.insert_test_data(orm_model=UsersModel, data_for_insert=users_for_test),
+            self.db_preparer.insert_test_data(orm_model=BookingsModel, data_for_insert=bookings_for_test),
+        ):
+            # Client for test requests to API
+            async with self.client_maker(transport=self.transport_for_client) as client:
+                api_response = await client.get(
+                    url=f"http://test{self.app.url_path_for('stream_rooms')}",
+                    params=query_params,
+                )
+                expected_response = await client.get(
+                    url=f"http://test{self.url}",
+                    params=query_params,
+                )
+
+                status_code_of_response = api_response.status_code
+                logger.debug(status_code_of_response)
+                list_of_response = [json.loads(line) for line in api_response.text.splitlines()]
+                logger.debug(list_of_response)
+
+            assert status_code_of_response == status.HTTP_200_OK, "The returned status code is not as expected"
+            assert api_response.headers["content-type"] == "application/x-ndjson", "The content type is not NDJSON"
+            assert list_of_response == expected_response.json()["items"], "The streamed rooms differ from the page"
@@ -0,0 +1,84 @@
+from typing import Any
+
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from loguru import logger
+from starlette import status
+
+import pytest
+
+from app.adapters.primary.api.version_1.resource_manager.types import EntityNamePathParams
+
+
+@pytest.mark.asyncio
+class TestGetEntityVersion:
+    """
+    System tests for GET method
+    of endpoint /resource-manager/{entity_name}/version.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(
+        self,
+        app: FastAPI,
+        transport_for_client: ASGITransport,
+        client_maker: AsyncClient = AsyncClient,
+    ):
+        self.app = app
+        self.transport_for_client = transport_for_client
+        self.client_maker = client_maker
+        self.url = lambda path_params: app.url_path_for("get_entity_version", **path_params)
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "path_params",
+            "expected_status_code",
+            "expected_result",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                {
+                    "entity_name": EntityNamePathParams.Rooms.value,
+                },
+                status.HTTP_200_OK,
+                {
+                    "table_name": "rooms",
+                    "version": None,
+                },
+                "Endpoint test for getting the version of entity without the cache backend",
+                id="-test-1",
+            ),
+            pytest.param(
+                {
+                    "entity_name": "non_existent_entity",
+                },
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                None,
+                "Endpoint test for getting the version of entity with a non-existent entity name",
+                id="-test-2",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_get_entity_version(
+        self,
+        path_params: dict[str, Any],
+        expected_status_code: int,
+        expected_result: dict[str, Any] | None,
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        # Client for test requests to API
+        async with self.client_maker(transport=self.transport_for_client) as client:
+            api_response = await client.get(
+                url=f"http://test{self.url(path_params=path_params)}",
+            )
+
+            status_code_of_response = api_response.status_code
+            logger.debug(status_code_of_response)
+
+        assert status_code_of_response == expected_status_code, "The returned status code is not as expected"
+        if expected_result is not None:
+            assert api_response.json() == expected_result, "The data returned by the endpoint is not as expected"
@@ -0,0 +1,80 @@
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from loguru import logger
+
+import pytest
+
+from app.adapters.secondary.db.models.users_model import UsersModel
+
+from app.adapters.secondary.db.dao.authorization.dao import AuthorizationDAO
+from app.adapters.secondary.db.dao.transaction_context import RequestAsyncTransactionContextFactory
+
+from app.core.services.authorization.helpers import get_password_hash, verify_password_in_pool
+from app.core.services.authorization.service import AuthorizationService
+from app.core.services.check.schemas import UserAuthenticationValidator
+
+from tests.db_preparer import DBPreparer
+
+users_for_test = [
+    {
+        "id": 1,
+        "email": "user1@example.com",
+        "phone": "+7-999-999-99-97",
+        "first_name": "Freddie",
+        "last_name": "Mercury",
+        "password": get_password_hash(password="Password1"),
+    },
+]
+
+
+@pytest.mark.asyncio
+class TestAuthenticationService:
+    """
+    Unit tests for authentication of AuthorizationService class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(
+        self,
+        app: FastAPI,
+        db_preparer: DBPreparer = DBPreparer,
+    ):
+        self.app = app
+        self.db_preparer = db_preparer()
+        self.transaction_context_factory = RequestAsyncTransactionContextFactory(
+            session_maker=self.db_preparer.session_maker,
+        )
+        self.service = AuthorizationService(
+            transaction_context_factory=self.transaction_context_factory,
+            authorization_dao=AuthorizationDAO(),
+        )
+
+    async def test_connection_is_released_before_verification(self):
+        logger.info("Testing the connection of the request is not held while the password is verified")
+
+        checked_out_connections = []
+
+        async def verify_password(plain_password: str, hashed_password: str) -> bool:
+            checked_out_connections.append(self.db_preparer.engine.pool.checkedout())
+
+            return await verify_password_in_pool(plain_password=plain_password, hashed_password=hashed_password)
+
+        async with self.db_preparer.insert_test_data(orm_model=UsersModel, data_for_insert=users_for_test):
+            checked_out_connections_before = self.db_preparer.engine.pool.checkedout()
+            try:
+                with patch("app.core.services.authorization.service.verify_password_in_pool", new=verify_password):
+                    access_token = await self.service.authentication(
+                        authentication_data=UserAuthenticationValidator(
+                            email="user1@example.com",
+                            password="Password1",
+                        ),
+                    )
+
+            finally:
+                await self.transaction_context_factory.close()
+
+        assert access_token.token, "Access token is not issued"
+        assert checked_out_connections == [
+            checked_out_connections_before
+        ], "Connection of the request is held while the password is verified"
@@ -0,0 +1,74 @@
+from loguru import logger
+
+import asyncio
+import pytest
+import threading
+
+from app.settings import settings
+
+from app.core.services.authorization.helpers import (
+    get_password_hash_in_pool,
+    run_in_password_hashing_pool,
+    verify_password_in_pool,
+)
+from app.utils.prometheus.metrics import password_hashing_queued_tasks
+
+
+@pytest.mark.asyncio
+class TestPasswordHashingPool:
+    """
+    Unit tests for hashing and verification of passwords in the password hashing pool.
+    """
+
+    async def test_verification_of_hash(self):
+        logger.info("Testing verification of passwords hashed in the pool")
+
+        hashed_password = await get_password_hash_in_pool(password="Password1")
+        verification_statuses = await asyncio.gather(
+            verify_password_in_pool(plain_password="Password1", hashed_password=hashed_password),
+            verify_password_in_pool(plain_password="Password2", hashed_password=hashed_password),
+        )
+
+        assert verification_statuses == [True, False], "Passwords are verified incorrectly"
+        assert password_hashing_queued_tasks._value.get() == 0, "Queued tasks are not counted down"
+
+    async def test_event_loop_is_not_blocked(self):
+        logger.info("Testing the event loop during hashing of passwords")
+
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        await asyncio.gather(*(get_password_hash_in_pool(password="Password1") for _ in range(2)))
+        ticker.cancel()
+
+        assert ticks > 2, "Event loop is blocked by hashing of passwords"
+
+    async def test_cancelled_task_is_counted_down(self):
+        logger.info("Testing the queued task of the pool cancelled before it is started")
+
+        release_workers = threading.Event()
+        busy_workers = [
+            asyncio.create_task(run_in_password_hashing_pool(release_workers.wait, operation="test"))
+            for _ in range(settings.PASSWORD_HASHING_WORKERS)
+        ]
+        verification = asyncio.create_task(verify_password_in_pool(plain_password="Password1", hashed_password=""))
+        await asyncio.sleep(0.1)
+        queued_tasks_before_cancel = password_hashing_queued_tasks._value.get()
+
+        verification.cancel()
+        await asyncio.sleep(0)
+        release_workers.set()
+        await asyncio.gather(*busy_workers)
+
+        with pytest.raises(asyncio.CancelledError):
+            await verification
+
+        assert queued_tasks_before_cancel == 1, "Task waiting for a worker is not counted as queued"
+        assert password_hashing_queued_tasks._value.get() == 0, "Cancelled task is left counted as queued"
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from jose import jwt
+from loguru import logger
+
+import pytest
+
+from app.settings import settings
+
+from app.adapters.primary.api.version_1.authorization.exceptions import ExpiredTokenError, InvalidTokenError
+from app.dependencies.auth import check_is_user_admin, get_user_id, verified_token_cache
+
+
+def get_token(expires_delta: timedelta, is_admin: bool = False) -> str:
+    return jwt.encode(
+        claims={
+            "sub": "1",
+            "admin": str(int(is_admin)),
+            "exp": int((datetime.now() + expires_delta).timestamp()),
+        },
+        key=settings.SECRET_KEY.get_secret_value(),
+        algorithm=settings.ALGORITHM.get_secret_value(),
+    )
+
+
+class TestVerifiedTokenCache:
+    """
+    Unit tests for the cache of verified tokens of authorization dependencies.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(self):
+        verified_token_cache.clear()
+
+    def test_single_verification_of_token(self):
+        logger.info("Testing the single verification of the token shared by authorization dependencies")
+
+        access_token = get_token(expires_delta=timedelta(minutes=5), is_admin=True)
+        with patch("app.dependencies.auth.jwt.decode", wraps=jwt.decode) as decode:
+            user_ids = [get_user_id(access_token=access_token) for _ in range(3)]
+            is_admin = check_is_user_admin(access_token=access_token)
+
+        assert user_ids == [1, 1, 1], "User ID of the cached token is incorrect"
+        assert is_admin is True, "Admin status of the cached token is incorrect"
+        assert decode.call_count == 1, "Token is verified on each request"
+
+    def test_invalid_token_is_not_cached(self):
+        logger.info("Testing tokens with the invalid signature")
+
+        access_token = get_token(expires_delta=timedelta(minutes=5))
+        forged_access_token = access_token[:-2] + ("AA" if access_token[-2:] != "AA" else "BB")
+
+        for _ in range(2):
+            with pytest.raises(InvalidTokenError):
+                get_user_id(access_token=forged_access_token)
+
+        assert len(verified_token_cache) == 0, "Token with the invalid signature is cached"
+
+    def test_cached_token_expires(self):
+        logger.info("Testing tokens expired after verification")
+
+        access_token = get_token(expires_delta=timedelta(minutes=5))
+        get_user_id(access_token=access_token)
+
+        with patch("app.dependencies.auth.datetime") as datetime_:
+            datetime_.now.return_value = datetime.now() + timedelta(minutes=10)
+            datetime_.fromtimestamp = datetime.fromtimestamp
+
+            with pytest.raises(ExpiredTokenError):
+                get_user_id(access_token=access_token)
@@ -0,0 +1,149 @@
+from datetime import datetime
+from typing import Any, Iterator
+
+from fastapi import FastAPI
+from sqlalchemy import select, text
+from loguru import logger
+
+import pytest
+
+from app.settings import settings
+
+from app.adapters.secondary.db.models.bookings_model import BookingsModel
+from app.adapters.secondary.db.models.rooms_model import RoomsModel
+
+from app.adapters.secondary.db.dao.bookings.helpers import get_filters_for_booking_overlaps
+
+from app.core.services.check.schemas import MinAndMaxDtsValidator
+
+from tests.db_preparer import DBPreparer
+
+NUMBER_OF_ROOMS = 1_000
+NUMBER_OF_BOOKINGS_PER_ROOM = 1_000
+FIRST_TEST_ID = 1_000_000
+
+# Gist structures of stay ranges are built row by row an order of magnitude slower than at once,
+#   so they are dropped for the bulk insert of test bookings
+#   and are re-created by their definitions read from the database before the plan is taken,
+#   so that the plan is made for the schema as it is deployed,
+#   the transaction is rolled back after the test
+query_for_getting_definitions_of_stay_range_structures = """
+SELECT 'ALTER TABLE booking.bookings ADD CONSTRAINT ' || quote_ident(conname) || ' ' || pg_get_constraintdef(oid)
+FROM pg_constraint
+WHERE conname = 'excl_booking_bookings_room_id_stay_range'
+UNION ALL
+SELECT pg_get_indexdef(CAST('booking.ix_booking_bookings_stay_range' AS REGCLASS))
+"""
+queries_for_preparing_bookings = [
+    "ALTER TABLE booking.bookings DROP CONSTRAINT excl_booking_bookings_room_id_stay_range",
+    "DROP INDEX booking.ix_booking_bookings_stay_range",
+    f"""
+    INSERT INTO booking.hotels (id, name, location, stars)
+    VALUES ({FIRST_TEST_ID}, 'Test hotel', 'Test location', 3)
+    """,
+    f"""
+    INSERT INTO booking.rooms (id, name, hotel_id, ordinal_number, maximum_persons, price)
+    SELECT {FIRST_TEST_ID} + number, 'Test room', {FIRST_TEST_ID}, number, 2, 5000
+    FROM generate_series(1, {NUMBER_OF_ROOMS}) AS number
+    """,
+    f"""
+    INSERT INTO booking.bookings (room_id, number_of_persons, check_in_dt, check_out_dt, total_cost)
+    SELECT
+        {FIRST_TEST_ID} + room_number,
+        1,
+        TIMESTAMPTZ '2020-01-01 14:00:00+00' + booking_number * INTERVAL '2 days',
+        TIMESTAMPTZ '2020-01-02 12:00:00+00' + booking_number * INTERVAL '2 days',
+        5000
+    FROM generate_series(1, {NUMBER_OF_ROOMS}) AS room_number,
+        generate_series(0, {NUMBER_OF_BOOKINGS_PER_ROOM} - 1) AS booking_number
+    """,
+]
+
+
+def get_nodes_of_plan(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for subplan in plan.get("Plans", []):
+        yield from get_nodes_of_plan(subplan)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+class TestBookingOverlapsPlan:
+    """
+    Regression tests for the query plan of booking overlaps on a large table.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(
+        self,
+        app: FastAPI,
+        db_preparer: DBPreparer = DBPreparer,
+    ):
+        self.app = app
+        self.db_preparer = db_preparer()
+
+    async def test_booking_overlaps_use_index_scan(self):
+        logger.info(
+            f"Testing the plan of the booking overlap query with {NUMBER_OF_ROOMS * NUMBER_OF_BOOKINGS_PER_ROOM} bookings"
+        )
+
+        min_and_max_dts = MinAndMaxDtsValidator(
+            min_dt=datetime(year=2022, month=1, day=1, hour=14, tzinfo=settings.DB_TIME_ZONE),
+            max_dt=datetime(year=2022, month=1, day=10, hour=12, tzinfo=settings.DB_TIME_ZONE),
+        )
+        query = (
+            select(BookingsModel, RoomsModel)
+            .select_from(BookingsModel)
+            .join(RoomsModel, BookingsModel.room_id == RoomsModel.id)
+            .where(
+                *get_filters_for_booking_overlaps(
+                    min_and_max_dts=min_and_max_dts,
+                    room_id=FIRST_TEST_ID + NUMBER_OF_ROOMS // 2,
+                )
+            )
+            .order_by(BookingsModel.id)
+        )
+
+        async with self.db_preparer.engine.connect() as connection:
+            try:
+                # The bulk insert and the build of gist structures are longer than the statement timeout of the engine
+                await connection.execute(text("SET LOCAL statement_timeout = 0"))
+
+                query_result = await connection.execute(text(query_for_getting_definitions_of_stay_range_structures))
+                definitions_of_stay_range_structures = query_result.scalars().all()
+
+                for query_for_preparing_bookings in queries_for_preparing_bookings:
+                    await connection.execute(text(query_for_preparing_bookings))
+
+                for definition_of_stay_range_structure in definitions_of_stay_range_structures:
+                    await connection.execute(text(definition_of_stay_range_structure))
+
+                await connection.execute(text("ANALYZE booking.bookings"))
+
+                compiled_query = query.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+                query_result = await connection.execute(text(f"EXPLAIN (FORMAT JSON) {compiled_query}"))
+                plan = query_result.scalar_one()[0]["Plan"]
+                logger.debug(plan)
+
+            finally:
+                await connection.rollback()
+
+        # Bitmap index scans are nested in the heap scan of the table
+        #   and don't have the name of the relation
+        scans_of_bookings = [
+            node for node in get_nodes_of_plan(plan=plan) if node.get("Relation Name") == BookingsModel.__tablename__
+        ]
+        used_indexes = {node.get("Index Name") for node in get_nodes_of_plan(plan=plan)}
+        index_conditions = " ".join(node.get("Index Cond", "") for node in get_nodes_of_plan(plan=plan))
+
+        assert len(definitions_of_stay_range_structures) == 2, "Gist structures of stay ranges are not re-created"
+        assert scans_of_bookings, "Bookings are not scanned by the query"
+        assert all(
+            node["Node Type"] != "Seq Scan" for node in scans_of_bookings
+        ), "Bookings are scanned sequentially by the overlap query"
+        assert (
+            "ix_booking_bookings_room_id_check_in_dt_check_out_dt" in used_indexes
+        ), "Index on room, check-in and check-out dates is not used by the overlap query"
+        assert (
+            "check_in_dt" in index_conditions and "check_out_dt" in index_conditions
+        ), "Stay period of the overlap query is filtered after the index scan"
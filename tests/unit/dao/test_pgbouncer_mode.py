@@ -0,0 +1,100 @@
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import NullPool
+from asyncpg.exceptions import InvalidSQLStatementNameError
+from loguru import logger
+
+import pytest
+
+from app.settings import settings
+
+from app.adapters.secondary.db.session import create_async_engine_of_url
+
+from tests.pgbouncer_stand_in import TransactionPoolingProxy
+
+NUMBER_OF_CONNECTIONS = 3
+
+
+@pytest.mark.asyncio
+class TestPgBouncerMode:
+    """
+    Unit tests for the async engine behind PgBouncer in the transaction pooling mode.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(self):
+        self.proxy = TransactionPoolingProxy(
+            server_host=settings.TEST_DB_HOST,
+            server_port=settings.TEST_DB_PORT,
+            pool_size=2,
+        )
+
+    def get_proxy_url(self, proxy_port: int) -> str:
+        return settings.DB_SECRET_URL.replace(f":{settings.TEST_DB_PORT}/", f":{proxy_port}/")
+
+    async def run_queries(self, proxy_port: int, pgbouncer_mode: bool) -> list[int]:
+        """
+        Run queries with parameters in concurrent connections sharing server connections,
+        so that consecutive transactions of a connection are run on different server connections.
+
+        :return: results of queries.
+        """
+
+        engine = create_async_engine_of_url(
+            url=self.get_proxy_url(proxy_port=proxy_port), pgbouncer_mode=pgbouncer_mode
+        )
+        connections = []
+        try:
+            for _ in range(NUMBER_OF_CONNECTIONS):
+                connections.append(await engine.connect())
+
+            results = []
+            for _ in range(2):
+                for number, connection in enumerate(connections):
+                    result = await connection.execute(text("SELECT CAST(:number AS INTEGER)"), {"number": number})
+                    await connection.commit()
+
+                    results.append(result.scalar_one())
+
+            return results
+
+        finally:
+            for connection in connections:
+                await connection.close()
+
+            await engine.dispose()
+
+    async def test_queries_in_pgbouncer_mode(self):
+        logger.info("Testing queries of connections sharing server connections in the PgBouncer mode")
+
+        proxy_port = await self.proxy.start()
+        try:
+            results = await self.run_queries(proxy_port=proxy_port, pgbouncer_mode=True)
+
+        finally:
+            await self.proxy.stop()
+
+        assert results == list(range(NUMBER_OF_CONNECTIONS)) * 2, "Queries in the PgBouncer mode are failed"
+
+    async def test_prepared_statements_are_lost_without_pgbouncer_mode(self):
+        logger.info("Testing prepared statements of connections sharing server connections")
+
+        proxy_port = await self.proxy.start()
+        try:
+            with pytest.raises((DBAPIError, InvalidSQLStatementNameError)) as error:
+                await self.run_queries(proxy_port=proxy_port, pgbouncer_mode=False)
+
+        finally:
+            await self.proxy.stop()
+
+        assert "prepared statement" in str(
+            error.value
+        ), "Cached prepared statements are found on other server connections"
+
+    async def test_null_pool_in_pgbouncer_mode(self):
+        logger.info("Testing the pool of the async engine in the PgBouncer mode")
+
+        engine = create_async_engine_of_url(url=settings.DB_SECRET_URL, pgbouncer_mode=True)
+        await engine.dispose()
+
+        assert isinstance(engine.pool, NullPool), "Connections are kept by the engine in the PgBouncer mode"
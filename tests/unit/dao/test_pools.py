@@ -0,0 +1,170 @@
+import sqlite3
+import threading
+import time
+
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from loguru import logger
+
+import pytest
+
+from app.settings import settings
+
+from app.adapters.secondary.db.pools import InstrumentedQueuePool, registering_pool_metrics
+from app.adapters.secondary.db.session import create_async_engine_of_url, get_pool_params
+
+RELEASE_DELAY_SECONDS = 0.2
+CONNECT_DELAY_SECONDS = 0.2
+
+
+def get_sample_value(name: str, engine_name: str) -> float:
+    return REGISTRY.get_sample_value(name=name, labels={"engine": engine_name}) or 0
+
+
+class TestPools:
+    """
+    Unit tests for connection pools and their metrics.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(self):
+        self.connect_delay_seconds = 0
+
+    def creator(self) -> sqlite3.Connection:
+        time.sleep(self.connect_delay_seconds)
+
+        return sqlite3.connect(":memory:", check_same_thread=False)
+
+    def get_pool(self, engine_name: str, pool_size: int, max_overflow: int) -> InstrumentedQueuePool:
+        pool = InstrumentedQueuePool(creator=self.creator, pool_size=pool_size, max_overflow=max_overflow, timeout=5)
+        pool.engine_name = engine_name
+
+        return pool
+
+    def test_pool_params(self):
+        logger.info("Testing params of the connection pool from settings")
+
+        pool_params = get_pool_params(pool_class=InstrumentedQueuePool, pgbouncer_mode=False)
+
+        assert pool_params == {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        }, "Params of the connection pool are not taken from settings"
+
+    @pytest.mark.asyncio
+    async def test_connect_args_of_async_engine(self):
+        logger.info("Testing asyncpg settings of connections of the async engine")
+
+        engine = create_async_engine_of_url(url=settings.DB_SECRET_URL, pgbouncer_mode=False)
+        try:
+            async with engine.connect() as connection:
+                statement_timeout = (await connection.execute(text("SHOW statement_timeout"))).scalar_one()
+                application_name = (await connection.execute(text("SHOW application_name"))).scalar_one()
+                raw_connection = await connection.get_raw_connection()
+                statement_cache_size = raw_connection.driver_connection._stmt_cache.get_max_size()
+
+        finally:
+            await engine.dispose()
+
+        assert statement_timeout == f"{settings.DB_STATEMENT_TIMEOUT_MS // 1000}s", "Statement timeout is not set"
+        assert application_name == settings.DB_APPLICATION_NAME, "Application name is not set"
+        assert statement_cache_size == settings.DB_STATEMENT_CACHE_SIZE, "Statement cache size is not set"
+
+    @pytest.mark.parametrize(
+        "test_description, pool_size, max_overflow, connect_delay_seconds, expected_min_wait, expected_max_wait",
+        [
+            pytest.param(
+                "Testing the wait of the checkout for a connection returned to the exhausted pool",
+                1,
+                0,
+                0,
+                RELEASE_DELAY_SECONDS / 2,
+                None,
+                id="-test-1",
+            ),
+            pytest.param(
+                "Testing the latency of connecting isn't measured as the wait of the checkout",
+                1,
+                1,
+                CONNECT_DELAY_SECONDS,
+                0,
+                0,
+                id="-test-2",
+            ),
+        ],
+    )
+    def test_wait_of_checkout(
+        self,
+        test_description: str,
+        pool_size: int,
+        max_overflow: int,
+        connect_delay_seconds: float,
+        expected_min_wait: float,
+        expected_max_wait: float | None,
+    ):
+        logger.info(test_description)
+
+        engine_name = f"test_wait_{pool_size}_{max_overflow}"
+        pool = self.get_pool(engine_name=engine_name, pool_size=pool_size, max_overflow=max_overflow)
+        first_connection = pool.connect()
+        self.connect_delay_seconds = connect_delay_seconds
+
+        timer = threading.Timer(interval=RELEASE_DELAY_SECONDS, function=first_connection.close)
+        timer.start()
+        try:
+            sum_of_waits = get_sample_value(name="db_pool_wait_seconds_sum", engine_name=engine_name)
+            second_connection = pool.connect()
+            wait = get_sample_value(name="db_pool_wait_seconds_sum", engine_name=engine_name) - sum_of_waits
+            second_connection.close()
+
+        finally:
+            timer.join()
+            pool.dispose()
+
+        assert wait >= expected_min_wait, "Wait of the checkout is less than expected"
+        if expected_max_wait is not None:
+            assert wait <= expected_max_wait, "Wait of the checkout is more than expected"
+
+    def test_gauges_of_pool(self):
+        logger.info("Testing gauges of checked-out and overflow connections of the pool")
+
+        engine_name = "test_gauges"
+        pool = self.get_pool(engine_name=engine_name, pool_size=1, max_overflow=1)
+        registering_pool_metrics(engine_name=engine_name, pool=pool)
+
+        connections = [pool.connect(), pool.connect()]
+        checked_out_connections = get_sample_value(name="db_pool_checked_out_connections", engine_name=engine_name)
+        overflow_connections = get_sample_value(name="db_pool_overflow_connections", engine_name=engine_name)
+
+        for connection in connections:
+            connection.close()
+
+        pool.dispose()
+
+        assert checked_out_connections == 2, "Number of checked-out connections is not as expected"
+        assert overflow_connections == 1, "Number of overflow connections is not as expected"
+
+    def test_label_of_pool_wait(self):
+        logger.info("Testing the wait of checkouts is labelled with the name of the engine registered for the pool")
+
+        engine_name = "replica_test"
+        pool = InstrumentedQueuePool(creator=self.creator, pool_size=1, max_overflow=0)
+        registering_pool_metrics(engine_name=engine_name, pool=pool)
+        recreated_pool = pool.recreate()
+        pool.dispose()
+
+        number_of_waits = get_sample_value(name="db_pool_wait_seconds_count", engine_name=engine_name)
+        number_of_async_waits = get_sample_value(name="db_pool_wait_seconds_count", engine_name="async")
+        recreated_pool.connect().close()
+        recreated_pool.dispose()
+
+        assert (
+            get_sample_value(name="db_pool_wait_seconds_count", engine_name=engine_name) == number_of_waits + 1
+        ), "Wait of the checkout is not labelled with the name of the engine"
+        assert (
+            get_sample_value(name="db_pool_wait_seconds_count", engine_name="async") == number_of_async_waits
+        ), "Wait of the checkout is labelled with the name of another engine"
@@ -0,0 +1,117 @@
+from sqlalchemy import event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
+from loguru import logger
+
+import pytest
+
+from app.settings import settings
+
+from app.adapters.secondary.db.dao.transaction_context import (
+    RequestAsyncTransactionContext,
+    RequestAsyncTransactionContextFactory,
+)
+from app.adapters.secondary.db.session import create_async_engine_of_url
+
+
+@pytest.mark.asyncio
+class TestRequestAsyncTransactionContext:
+    """
+    Unit tests for transaction contexts sharing the connection of the request.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(self):
+        self.engine = create_async_engine_of_url(url=settings.DB_SECRET_URL)
+        self.checkouts = []
+        event.listen(self.engine.sync_engine, "checkout", lambda *args: self.checkouts.append(args))
+
+        self.transaction_context_factory = RequestAsyncTransactionContextFactory(
+            session_maker=sessionmaker(bind=self.engine, class_=AsyncSession, expire_on_commit=False),
+        )
+
+    async def test_connection_of_outermost_context(self):
+        logger.info("Testing the connection shared by nested transaction contexts and released by the outermost one")
+
+        backend_pids = []
+        checked_out_connections = []
+        try:
+            for _ in range(2):
+                transaction_context = self.transaction_context_factory.init_transaction_context()
+                async with transaction_context():
+                    backend_pid = (await transaction_context.execute(text("SELECT pg_backend_pid()"))).scalar()
+
+                    nested_transaction_context = self.transaction_context_factory.init_transaction_context(
+                        read_only=True,
+                    )
+                    async with nested_transaction_context():
+                        nested_backend_pid = (
+                            await nested_transaction_context.execute(text("SELECT pg_backend_pid()"))
+                        ).scalar()
+
+                    backend_pids.append((backend_pid, nested_backend_pid))
+
+                checked_out_connections.append(self.engine.pool.checkedout())
+
+        finally:
+            await self.transaction_context_factory.close()
+            await self.engine.dispose()
+
+        assert all(
+            backend_pid == nested_backend_pid for backend_pid, nested_backend_pid in backend_pids
+        ), "Nested transaction contexts of the request use different connections"
+        assert checked_out_connections == [0, 0], "Connection is held after the outermost transaction context is exited"
+        assert len(self.checkouts) == 2, "Connection is not checked out once by each outermost transaction context"
+
+    async def test_savepoints_of_nested_contexts(self):
+        logger.info("Testing savepoints and callbacks of nested transaction contexts")
+
+        called_callbacks = []
+        try:
+            transaction_context = self.transaction_context_factory.init_transaction_context()
+            async with transaction_context():
+                await transaction_context.execute(text("CREATE TEMPORARY TABLE numbers (number INTEGER)"))
+                await transaction_context.execute(text("INSERT INTO numbers VALUES (1)"))
+
+                for number, need_to_commit in ((2, False), (3, True)):
+                    nested_transaction_context = self.transaction_context_factory.init_transaction_context()
+                    async with nested_transaction_context():
+                        await nested_transaction_context.execute(
+                            text("INSERT INTO numbers VALUES (:number)"),
+                            {"number": number},
+                        )
+                        nested_transaction_context.add_after_commit_callback(
+                            lambda number=number: called_callbacks.append(number)
+                        )
+
+                        if need_to_commit:
+                            await nested_transaction_context.commit()
+
+                called_callbacks_before_commit = list(called_callbacks)
+                numbers = (await transaction_context.execute(text("SELECT number FROM numbers ORDER BY 1"))).scalars()
+                numbers = list(numbers)
+
+                await transaction_context.commit()
+
+        finally:
+            await self.transaction_context_factory.close()
+            await self.engine.dispose()
+
+        assert numbers == [1, 3], "Changes of nested transaction contexts without commit are not rolled back"
+        assert called_callbacks_before_commit == [], "Callbacks are called before the commit of the outer context"
+        assert called_callbacks == [3], "Callbacks of committed nested transaction contexts are not called"
+
+    async def test_contexts_after_factory_is_closed(self):
+        logger.info("Testing transaction contexts initialized after the request is handled")
+
+        await self.transaction_context_factory.close()
+        transaction_context = self.transaction_context_factory.init_transaction_context()
+        async with transaction_context():
+            result = (await transaction_context.execute(text("SELECT 1"))).scalar()
+
+        await self.engine.dispose()
+
+        assert not isinstance(
+            transaction_context, RequestAsyncTransactionContext
+        ), "Transaction context does not use its own session"
+        assert result == 1, "Query of the transaction context is failed"
@@ -0,0 +1,271 @@
+from datetime import date, datetime
+
+from fastapi import FastAPI
+from sqlalchemy import select, update
+from loguru import logger
+
+import pytest
+
+from app.settings import settings
+
+from app.adapters.secondary.db.models.bookings_model import BookingsModel
+from app.adapters.secondary.db.models.hotels_model import HotelsModel
+from app.adapters.secondary.db.models.room_occupancy_model import RoomOccupancyModel
+from app.adapters.secondary.db.models.rooms_model import RoomsModel
+from app.adapters.secondary.db.models.users_model import UsersModel
+
+from app.adapters.secondary.db.dao.bookings.dao import BookingDAO
+from app.adapters.secondary.db.dao.transaction_context import StaticAsyncTransactionContextFactory
+
+from app.core.services.bookings.schemas import BaseBookingSchema
+
+from app.utils.admin_panel.bookings.views import BookingsModelView
+
+from tests.db_preparer import DBPreparer
+
+hotels_for_test = [
+    {
+        "id": 1,
+        "name": "Test hotel #1",
+        "desc": "Colorful description for hotel #1.",
+        "location": "Altai Republic, Maiminsky district, Urlu-Aspak village, Leshoznaya street, 20",
+        "stars": 3,
+    },
+]
+rooms_for_test = [
+    {
+        "id": 1,
+        "name": "Room #1 of hotel #1",
+        "desc": "Colorful description for room #1 of hotel #1.",
+        "hotel_id": 1,
+        "premium_level_id": None,
+        "ordinal_number": 1,
+        "maximum_persons": 2,
+        "price": 5_000,
+    },
+]
+users_for_test = [
+    {
+        "id": 1,
+        "email": "user1@example.com",
+        "phone": "+7-999-999-99-97",
+        "first_name": "Freddie",
+        "last_name": "Mercury",
+        "password": "password",
+    },
+]
+# The rolling horizon of the test settings is from 2024-08-01 to 2026-01-27
+bookings_for_test = [
+    {
+        "id": 1,
+        "user_id": 1,
+        "room_id": 1,
+        "number_of_persons": 1,
+        "check_in_dt": datetime(year=2024, month=7, day=2, hour=14, tzinfo=settings.DB_TIME_ZONE),
+        "check_out_dt": datetime(year=2024, month=7, day=3, hour=12, tzinfo=settings.DB_TIME_ZONE),
+        "total_cost": 5_000,
+    },
+    {
+        "id": 2,
+        "user_id": 1,
+        "room_id": 1,
+        "number_of_persons": 1,
+        "check_in_dt": datetime(year=2024, month=8, day=10, hour=14, tzinfo=settings.DB_TIME_ZONE),
+        "check_out_dt": datetime(year=2024, month=8, day=12, hour=12, tzinfo=settings.DB_TIME_ZONE),
+        "total_cost": 10_000,
+    },
+    {
+        "id": 3,
+        "user_id": 1,
+        "room_id": 1,
+        "number_of_persons": 1,
+        "check_in_dt": datetime(year=2026, month=1, day=26, hour=14, tzinfo=settings.DB_TIME_ZONE),
+        "check_out_dt": datetime(year=2026, month=1, day=30, hour=12, tzinfo=settings.DB_TIME_ZONE),
+        "total_cost": 20_000,
+    },
+]
+stale_room_occupancy_for_test = [
+    {"room_id": 1, "night": date(year=2024, month=8, day=20), "booking_id": 2},
+]
+room_occupancy_of_booking_for_test = [
+    {"room_id": 1, "night": date(year=2024, month=8, day=10), "booking_id": 2},
+    {"room_id": 1, "night": date(year=2024, month=8, day=11), "booking_id": 2},
+]
+
+
+@pytest.mark.asyncio
+class TestRoomOccupancy:
+    """
+    Unit tests for the room occupancy maintained by BookingDAO class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(
+        self,
+        app: FastAPI,
+        db_preparer: DBPreparer = DBPreparer,
+    ):
+        self.app = app
+        self.db_preparer = db_preparer()
+        self.transaction_context_factory = StaticAsyncTransactionContextFactory(
+            session_maker=self.db_preparer.session_maker,
+        )
+        self.booking_dao = BookingDAO()
+
+    async def get_room_occupancy(self) -> list[tuple[int, date, int]]:
+        async with self.db_preparer.session_maker() as session:
+            query = select(
+                RoomOccupancyModel.room_id,
+                RoomOccupancyModel.night,
+                RoomOccupancyModel.booking_id,
+            ).order_by(RoomOccupancyModel.room_id, RoomOccupancyModel.night)
+            rows = (await session.execute(query)).fetchall()
+
+        return [tuple(row) for row in rows]
+
+    async def test_room_occupancy_of_added_and_deleted_booking(self):
+        logger.info("Testing nights of the booking added to and deleted from the room occupancy")
+
+        async with (
+            self.db_preparer.insert_test_data(orm_model=HotelsModel, data_for_insert=hotels_for_test),
+            self.db_preparer.insert_test_data(orm_model=RoomsModel, data_for_insert=rooms_for_test),
+            self.db_preparer.insert_test_data(orm_model=UsersModel, data_for_insert=users_for_test),
+        ):
+            transaction_context = self.transaction_context_factory.init_transaction_context()
+            async with transaction_context():
+                booking = await self.booking_dao.add_booking(
+                    transaction_context=transaction_context,
+                    booking=BaseBookingSchema(
+                        user_id=1,
+                        room_id=1,
+                        number_of_persons=1,
+                        check_in_dt=datetime(year=2024, month=7, day=30, hour=14, tzinfo=settings.DB_TIME_ZONE),
+                        check_out_dt=datetime(year=2024, month=8, day=3, hour=12, tzinfo=settings.DB_TIME_ZONE),
+                        total_cost=20_000,
+                    ),
+                )
+                await transaction_context.commit()
+
+            room_occupancy_after_adding = await self.get_room_occupancy()
+
+            transaction_context = self.transaction_context_factory.init_transaction_context()
+            async with transaction_context():
+                await self.booking_dao.delete_item_by_id(
+                    transaction_context=transaction_context,
+                    table_name=BookingsModel.__tablename__,
+                    item_id=booking.id,
+                )
+                await transaction_context.commit()
+
+            room_occupancy_after_deleting = await self.get_room_occupancy()
+
+        assert room_occupancy_after_adding == [
+            (1, date(year=2024, month=8, day=1), booking.id),
+            (1, date(year=2024, month=8, day=2), booking.id),
+        ], "Nights of the added booking within the horizon are not in the room occupancy"
+        assert room_occupancy_after_deleting == [], "Nights of the deleted booking are left in the room occupancy"
+
+    async def test_rebuild_room_occupancy(self):
+        logger.info("Testing the rebuild of the room occupancy from bookings")
+
+        async with (
+            self.db_preparer.insert_test_data(orm_model=HotelsModel, data_for_insert=hotels_for_test),
+            self.db_preparer.insert_test_data(orm_model=RoomsModel, data_for_insert=rooms_for_test),
+            self.db_preparer.insert_test_data(orm_model=UsersModel, data_for_insert=users_for_test),
+            self.db_preparer.insert_test_data(orm_model=BookingsModel, data_for_insert=bookings_for_test),
+            self.db_preparer.insert_test_data(
+                orm_model=RoomOccupancyModel,
+                data_for_insert=stale_room_occupancy_for_test,
+            ),
+        ):
+            transaction_context = self.transaction_context_factory.init_transaction_context()
+            async with transaction_context():
+                number_of_nights = await self.booking_dao.rebuild_room_occupancy(
+                    transaction_context=transaction_context,
+                )
+                await transaction_context.commit()
+
+            room_occupancy = await self.get_room_occupancy()
+
+        assert room_occupancy == [
+            (1, date(year=2024, month=8, day=10), 2),
+            (1, date(year=2024, month=8, day=11), 2),
+            (1, date(year=2026, month=1, day=26), 3),
+            (1, date(year=2026, month=1, day=27), 3),
+        ], "Room occupancy is not rebuilt from nights of bookings within the horizon"
+        assert number_of_nights == len(room_occupancy), "Number of rebuilt nights is not as expected"
+
+    async def test_added_booking_takes_over_stale_nights(self):
+        logger.info("Testing the booking added over nights left in the room occupancy by a changed booking")
+
+        async with (
+            self.db_preparer.insert_test_data(orm_model=HotelsModel, data_for_insert=hotels_for_test),
+            self.db_preparer.insert_test_data(orm_model=RoomsModel, data_for_insert=rooms_for_test),
+            self.db_preparer.insert_test_data(orm_model=UsersModel, data_for_insert=users_for_test),
+            self.db_preparer.insert_test_data(orm_model=BookingsModel, data_for_insert=bookings_for_test),
+            self.db_preparer.insert_test_data(
+                orm_model=RoomOccupancyModel,
+                data_for_insert=stale_room_occupancy_for_test,
+            ),
+        ):
+            transaction_context = self.transaction_context_factory.init_transaction_context()
+            async with transaction_context():
+                booking = await self.booking_dao.add_booking(
+                    transaction_context=transaction_context,
+                    booking=BaseBookingSchema(
+                        user_id=1,
+                        room_id=1,
+                        number_of_persons=1,
+                        check_in_dt=datetime(year=2024, month=8, day=19, hour=14, tzinfo=settings.DB_TIME_ZONE),
+                        check_out_dt=datetime(year=2024, month=8, day=21, hour=12, tzinfo=settings.DB_TIME_ZONE),
+                        total_cost=10_000,
+                    ),
+                )
+                await transaction_context.commit()
+
+            room_occupancy = await self.get_room_occupancy()
+
+            await self.db_preparer.delete_test_data(orm_model=BookingsModel, data_for_delete=[{"id": booking.id}])
+
+        assert room_occupancy == [
+            (1, date(year=2024, month=8, day=19), booking.id),
+            (1, date(year=2024, month=8, day=20), booking.id),
+        ], "Stale nights of the room occupancy are not taken over by the added booking"
+
+    async def test_room_occupancy_of_booking_changed_in_admin_panel(self):
+        logger.info("Testing nights of the booking moved in the admin panel are replaced in the room occupancy")
+
+        async with (
+            self.db_preparer.insert_test_data(orm_model=HotelsModel, data_for_insert=hotels_for_test),
+            self.db_preparer.insert_test_data(orm_model=RoomsModel, data_for_insert=rooms_for_test),
+            self.db_preparer.insert_test_data(orm_model=UsersModel, data_for_insert=users_for_test),
+            self.db_preparer.insert_test_data(orm_model=BookingsModel, data_for_insert=bookings_for_test),
+            self.db_preparer.insert_test_data(
+                orm_model=RoomOccupancyModel,
+                data_for_insert=room_occupancy_of_booking_for_test,
+            ),
+        ):
+            async with self.db_preparer.session_maker.begin() as session:
+                query = (
+                    update(BookingsModel)
+                    .where(BookingsModel.id == 2)
+                    .values(
+                        check_in_dt=datetime(year=2024, month=8, day=20, hour=14, tzinfo=settings.DB_TIME_ZONE),
+                        check_out_dt=datetime(year=2024, month=8, day=22, hour=12, tzinfo=settings.DB_TIME_ZONE),
+                    )
+                )
+                await session.execute(query)
+
+            await BookingsModelView().after_model_change(
+                data={},
+                model=BookingsModel(id=2),
+                is_created=False,
+                request=None,
+            )
+
+            room_occupancy = await self.get_room_occupancy()
+
+        assert room_occupancy == [
+            (1, date(year=2024, month=8, day=20), 2),
+            (1, date(year=2024, month=8, day=21), 2),
+        ], "Nights of the booking changed in the admin panel are not replaced in the room occupancy"
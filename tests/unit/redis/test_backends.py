@@ -0,0 +1,208 @@
+from collections.abc import Awaitable, Callable
+
+from loguru import logger
+
+import asyncio
+import pytest
+
+from app.utils.redis.backends import LocalAndRedisBackend
+from app.utils.redis.entry_context import CacheEntryContext, current_cache_entry
+from app.utils.redis.local_cache import LocalCache
+
+
+class FakeRedis:
+    """
+    Fake redis client keeping entries with their remaining retention time.
+    """
+
+    def __init__(self):
+        self.entries: dict[str, list] = {}
+
+    def pipeline(self, *args, **kwargs) -> "FakePipeline":
+        return FakePipeline(redis=self)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self.entries.get(key)
+
+        return entry[0] if entry else None
+
+    def get_ttl(self, key: str) -> int:
+        entry = self.entries.get(key)
+        if entry is None:
+            return -2
+
+        return -1 if entry[1] is None else entry[1]
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ex: int | None = None,
+        px: int | None = None,
+        nx: bool = False,
+    ) -> bool | None:
+        if nx and key in self.entries:
+            return None
+
+        self.entries[key] = [value, ex or (px and px // 1000)]
+
+        return True
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.entries)
+
+    async def eval(self, script: str, numkeys: int, *args) -> int:
+        lock_key, lock_token = args
+        if await self.get(lock_key) == lock_token:
+            del self.entries[lock_key]
+
+            return 1
+
+        return 0
+
+
+class FakePipeline:
+    """
+    Fake redis pipeline of the ttl and get commands.
+    """
+
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.keys: list[tuple[str, str]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args) -> None: ...
+
+    def ttl(self, key: str) -> "FakePipeline":
+        self.keys.append(("ttl", key))
+
+        return self
+
+    def get(self, key: str) -> "FakePipeline":
+        self.keys.append(("get", key))
+
+        return self
+
+    async def execute(self) -> list:
+        return [
+            self.redis.get_ttl(key) if command == "ttl" else await self.redis.get(key) for command, key in self.keys
+        ]
+
+
+class TestLocalAndRedisBackend:
+    """
+    Unit tests for single-flight computation and stale-while-revalidate of LocalAndRedisBackend class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(self):
+        self.redis = FakeRedis()
+        self.backend = LocalAndRedisBackend(
+            redis=self.redis,
+            local_cache=LocalCache(max_size=16, retention_time_seconds=60),
+            lock_timeout_seconds=1,
+            lock_polling_interval_seconds=0.01,
+        )
+        self.number_of_computations = 0
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[bytes]],
+        stale_while_revalidate_seconds: int = 0,
+    ) -> bytes:
+        """
+        Serve the entry the way the cache decorator does.
+
+        :return: value of entry.
+        """
+
+        entry_context = CacheEntryContext(stale_while_revalidate_seconds=stale_while_revalidate_seconds)
+        token = current_cache_entry.set(entry_context)
+        try:
+            _, value = await self.backend.get_with_ttl(key)
+            if value is None:
+                value = await compute()
+                await self.backend.set(key, value, expire=60)
+
+            return value
+
+        finally:
+            current_cache_entry.reset(token)
+            await self.backend.finish_computation(entry_context=entry_context)
+
+    async def compute(self) -> bytes:
+        self.number_of_computations += 1
+        await asyncio.sleep(0.05)
+
+        return b"fresh"
+
+    @pytest.mark.asyncio
+    async def test_single_flight_of_missing_entry(self):
+        logger.info("Testing computation of a missing entry by a single one of concurrent requests")
+
+        values = await asyncio.gather(*(self.get_or_compute(key="cache::key", compute=self.compute) for _ in range(5)))
+
+        assert self.number_of_computations == 1, "The entry is computed more than once"
+        assert values == [b"fresh"] * 5, "Waiting requests do not get the computed entry"
+        assert await self.redis.exists("cache:lock:cache::key") == 0, "The lock is not released"
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self):
+        logger.info("Testing serving a stale entry while a single request refreshes it")
+
+        await self.redis.set("cache::key", b"stale", ex=5)
+
+        values = await asyncio.gather(
+            *(
+                self.get_or_compute(key="cache::key", compute=self.compute, stale_while_revalidate_seconds=30)
+                for _ in range(3)
+            )
+        )
+
+        assert self.number_of_computations == 1, "The stale entry is refreshed more than once"
+        assert sorted(values) == [
+            b"fresh",
+            b"stale",
+            b"stale",
+        ], "Concurrent requests are not served with the stale entry"
+        assert self.redis.get_ttl("cache::key") == 90, "The entry is not kept for the stale-while-revalidate window"
+
+    @pytest.mark.asyncio
+    async def test_waiting_for_entry_of_another_worker(self):
+        logger.info("Testing waiting for an entry computed by another worker")
+
+        await self.redis.set("cache:lock:cache::key", "token of another worker", px=1000)
+
+        async def compute_in_another_worker() -> None:
+            await asyncio.sleep(0.05)
+            await self.redis.set("cache::key", b"computed by another worker", ex=60)
+
+        value, _ = await asyncio.gather(
+            self.get_or_compute(key="cache::key", compute=self.compute),
+            compute_in_another_worker(),
+        )
+
+        assert self.number_of_computations == 0, "The entry computed by another worker is computed again"
+        assert value == b"computed by another worker", "The entry of another worker is not returned"
+
+    @pytest.mark.asyncio
+    async def test_release_after_failed_computation(self):
+        logger.info("Testing releasing waiting requests and the lock after a failed computation")
+
+        async def fail() -> bytes:
+            await asyncio.sleep(0.05)
+            raise RuntimeError("Computation failed.")
+
+        results = await asyncio.gather(
+            self.get_or_compute(key="cache::key", compute=fail),
+            self.get_or_compute(key="cache::key", compute=self.compute),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], RuntimeError), "The error of computation is not raised"
+        assert results[1] == b"fresh", "The waiting request does not compute the entry itself"
+        assert self.backend._computations == {}, "Computations are not finished"
+        assert await self.redis.exists("cache:lock:cache::key") == 0, "The lock is not released"
@@ -0,0 +1,109 @@
+from datetime import date
+from typing import Any
+
+from fastapi_cache.coder import JsonCoder
+from loguru import logger
+
+import pytest
+
+from app.adapters.primary.api.base.responses import SerializedPageResponse
+from app.core.services.check.schemas import PaginationValidator
+from app.utils.redis.coders import CompressedORJsonCoder
+
+
+class TestCompressedORJsonCoder:
+    """
+    Unit tests for CompressedORJsonCoder class.
+    """
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "value",
+            "expected_header",
+            "expected_result",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                {"items": [1, 2], "next_cursor": None},
+                CompressedORJsonCoder.json_header,
+                {"items": [1, 2], "next_cursor": None},
+                "Testing encoding a small payload without compression",
+                id="-test-1",
+            ),
+            pytest.param(
+                {"items": [{"name": "room", "description": "x" * 100}] * 100, "next_cursor": None},
+                CompressedORJsonCoder.zlib_header,
+                {"items": [{"name": "room", "description": "x" * 100}] * 100, "next_cursor": None},
+                "Testing encoding a large payload with compression",
+                id="-test-2",
+            ),
+            pytest.param(
+                [PaginationValidator(limit=5)],
+                CompressedORJsonCoder.json_header,
+                [{"limit": 5, "cursor": None}],
+                "Testing encoding pydantic models",
+                id="-test-3",
+            ),
+            pytest.param(
+                SerializedPageResponse(content={"items": [], "next_cursor": None}),
+                CompressedORJsonCoder.json_header,
+                {"items": [], "next_cursor": None},
+                "Testing encoding a serialized response",
+                id="-test-4",
+            ),
+        ],
+    )
+    def test_encode_and_decode(
+        self,
+        value: Any,
+        expected_header: bytes,
+        expected_result: Any,
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        payload = CompressedORJsonCoder.encode(value)
+
+        assert payload.startswith(expected_header), "Format of payload is not as expected"
+        assert CompressedORJsonCoder.decode(payload) == expected_result, "Decoded payload is not as expected"
+
+    def test_decode_payload_of_json_coder(self):
+        logger.info("Testing decoding a payload stored by the previous json coder")
+
+        payload = JsonCoder.encode({"check_in_date": date(2024, 1, 1)})
+
+        assert CompressedORJsonCoder.decode(payload) == {"check_in_date": date(2024, 1, 1)}, "Payload is not decoded"
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "content",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                {"items": [1, 2], "next_cursor": None},
+                "Testing decoding a small cached page as the serialized response",
+                id="-test-1",
+            ),
+            pytest.param(
+                {"items": [{"name": "room", "description": "x" * 100}] * 100, "next_cursor": None},
+                "Testing decoding a large compressed cached page as the serialized response",
+                id="-test-2",
+            ),
+        ],
+    )
+    def test_decode_as_serialized_response(
+        self,
+        content: dict[str, Any],
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        response = SerializedPageResponse(content=content)
+        payload = CompressedORJsonCoder.encode(response)
+        decoded_response = CompressedORJsonCoder.decode_as_type(payload, type_=SerializedPageResponse)
+
+        assert isinstance(decoded_response, SerializedPageResponse), "Cached page is not decoded as the response"
+        assert decoded_response.body == response.body, "Body of the decoded response is not the cached one"
+        assert CompressedORJsonCoder.decode_as_type(payload, type_=dict) == content, "Cached page is not decoded"
@@ -0,0 +1,115 @@
+from fastapi import FastAPI
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
+from httpx import ASGITransport, AsyncClient
+from loguru import logger
+from starlette import status
+from starlette.requests import Request
+
+import pytest
+
+from app.utils.redis.deroctor_manager import RedisDeroctorManager
+from app.utils.redis.etags import get_etag, is_etag_matched
+
+
+class TestEtags:
+    """
+    Unit tests for conditional responses by entity tags.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(self):
+        FastAPICache.init(backend=InMemoryBackend(), prefix="test-cache")
+
+        self.versions = {"rooms": 1}
+        self.number_of_calls = 0
+
+        async def get_etag_of_request(request: Request, table_names: tuple[str, ...]) -> str:
+            return get_etag(request=request, versions=[self.versions[table_name] for table_name in table_names])
+
+        app = FastAPI()
+
+        @app.get("/rooms")
+        @RedisDeroctorManager.with_conditional_response(
+            table_names=("rooms",),
+            get_etag=get_etag_of_request,
+            cache_control="public, max-age=0, must-revalidate",
+            wrapper=cache(expire=60),
+        )
+        async def get_rooms(hotel_id: int = None) -> list[int]:
+            self.number_of_calls += 1
+
+            return [1, 2]
+
+        self.app = app
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "if_none_match",
+            "etag",
+            "expected_result",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                None,
+                'W/"a"',
+                False,
+                "Testing a request without If-None-Match",
+                id="-test-1",
+            ),
+            pytest.param(
+                '"b", W/"a"',
+                'W/"a"',
+                True,
+                "Testing weak comparison with one of entity tags",
+                id="-test-2",
+            ),
+            pytest.param(
+                "*",
+                'W/"a"',
+                True,
+                "Testing matching any entity tag",
+                id="-test-3",
+            ),
+            pytest.param(
+                'W/"b"',
+                'W/"a"',
+                False,
+                "Testing a stale entity tag",
+                id="-test-4",
+            ),
+        ],
+    )
+    def test_is_etag_matched(
+        self,
+        if_none_match: str | None,
+        etag: str,
+        expected_result: bool,
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        assert is_etag_matched(if_none_match=if_none_match, etag=etag) is expected_result, "Matching is not as expected"
+
+    @pytest.mark.asyncio
+    async def test_conditional_response(self):
+        logger.info("Testing answering requests with the current entity tag without calling the handler")
+
+        async with AsyncClient(transport=ASGITransport(app=self.app), base_url="http://test") as client:
+            first_response = await client.get("/rooms")
+            etag = first_response.headers["ETag"]
+
+            not_modified_response = await client.get("/rooms", headers={"If-None-Match": etag})
+
+            self.versions["rooms"] += 1
+            modified_response = await client.get("/rooms", headers={"If-None-Match": etag})
+
+        assert first_response.status_code == status.HTTP_200_OK, "The first response is not successful"
+        assert first_response.headers["Cache-Control"] == "public, max-age=0, must-revalidate", "Cache-Control is lost"
+        assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED, "The response is not conditional"
+        assert not_modified_response.content == b"", "The response to the conditional request has a body"
+        assert modified_response.status_code == status.HTTP_200_OK, "The response after changes is not sent"
+        assert modified_response.headers["ETag"] != etag, "The entity tag does not change with the table version"
+        assert self.number_of_calls == 1, "The handler is called for conditional requests"
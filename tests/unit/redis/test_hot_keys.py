@@ -0,0 +1,48 @@
+from loguru import logger
+
+import pytest
+
+from app.utils.redis.hot_keys import get_params_signature
+
+
+class TestHotKeys:
+    """
+    Unit tests for signatures of hot query parameters.
+    """
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "query_params",
+            "expected_result",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                [],
+                "{}",
+                "Testing getting the signature of a request without parameters",
+                id="-test-1",
+            ),
+            pytest.param(
+                [("stars", "5"), ("location", "Moscow")],
+                '{"location":"Moscow","stars":"5"}',
+                "Testing getting the signature independent of the order of parameters",
+                id="-test-2",
+            ),
+            pytest.param(
+                [("services", "2"), ("services", "1"), ("location", "")],
+                '{"services":["1","2"]}',
+                "Testing getting the signature with repeated and empty parameters",
+                id="-test-3",
+            ),
+        ],
+    )
+    def test_get_params_signature(
+        self,
+        query_params: list[tuple[str, str]],
+        expected_result: str,
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        assert get_params_signature(query_params=query_params) == expected_result, "Signature is not as expected"
@@ -0,0 +1,137 @@
+from typing import Any
+
+from fastapi import Depends, Request
+from loguru import logger
+
+import pytest
+
+from app.core.services.check.schemas import PaginationValidator
+from app.utils.redis.key_builder import normalized_key_builder
+
+
+class FakeService:
+    """
+    Fake service injected into the handler.
+    """
+
+
+async def get_hotels(
+    location: str = None,
+    services: list[int] = None,
+    connected_with_rooms: bool = False,
+    pagination: PaginationValidator = None,
+    service: FakeService = Depends(FakeService),
+) -> None: ...
+
+
+class TestKeyBuilder:
+    """
+    Unit tests for building normalized cache keys.
+    """
+
+    def build_key(self, **kwargs) -> str:
+        kwargs.setdefault("service", FakeService())
+
+        return normalized_key_builder(get_hotels, "cache:", args=(), kwargs=kwargs)
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "first_kwargs",
+            "second_kwargs",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                {"services": [1, 2]},
+                {"services": [2, 1, 2]},
+                "Testing the same key for reordered and repeated list values",
+                id="-test-1",
+            ),
+            pytest.param(
+                {"location": "Moscow"},
+                {"location": "moscow"},
+                "Testing the same key for case-insensitive values",
+                id="-test-2",
+            ),
+            pytest.param(
+                {"connected_with_rooms": False, "location": None},
+                {},
+                "Testing the same key for default and empty values",
+                id="-test-3",
+            ),
+            pytest.param(
+                {"pagination": PaginationValidator()},
+                {"pagination": PaginationValidator(limit=PaginationValidator().limit)},
+                "Testing the same key for models with default fields",
+                id="-test-4",
+            ),
+        ],
+    )
+    def test_equivalent_keys(
+        self,
+        first_kwargs: dict[str, Any],
+        second_kwargs: dict[str, Any],
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        assert self.build_key(**first_kwargs) == self.build_key(**second_kwargs), "Keys of equivalent requests differ"
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "first_kwargs",
+            "second_kwargs",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                {"services": [1, 2]},
+                {"services": [1, 3]},
+                "Testing different keys for different list values",
+                id="-test-1",
+            ),
+            pytest.param(
+                {"connected_with_rooms": True},
+                {},
+                "Testing different keys for a non-default value",
+                id="-test-2",
+            ),
+        ],
+    )
+    def test_different_keys(
+        self,
+        first_kwargs: dict[str, Any],
+        second_kwargs: dict[str, Any],
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        assert self.build_key(**first_kwargs) != self.build_key(**second_kwargs), "Keys of different requests match"
+
+    def test_key_format(self):
+        logger.info("Testing the compact format of keys")
+
+        cache_key = self.build_key(location="Moscow")
+        namespace, key_hash = cache_key.rsplit(":", 1)
+
+        assert namespace == "cache:", "Namespace of key is not as expected"
+        assert len(key_hash) == 32, "Hash of key is not compact"
+
+    def test_keys_of_handler_reading_request(self):
+        logger.info("Testing keys of a handler reading query parameters from the request")
+
+        async def get_entities(request: Request, entity_name: str) -> None: ...
+
+        def build_key(query_string: bytes) -> str:
+            request = Request(scope={"type": "http", "query_string": query_string, "headers": []})
+
+            return normalized_key_builder(
+                get_entities,
+                "cache:",
+                request=request,
+                args=(),
+                kwargs={"entity_name": "rooms"},
+            )
+
+        assert build_key(b"hotel_id=1&name=a") == build_key(b"name=a&hotel_id=1"), "Keys of equivalent requests differ"
+        assert build_key(b"hotel_id=1") != build_key(b"hotel_id=2"), "Keys of different filters match"
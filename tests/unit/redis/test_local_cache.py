@@ -0,0 +1,142 @@
+from loguru import logger
+
+import pytest
+
+from app.utils.redis.local_cache import LocalCache
+
+
+class FakeTimer:
+    """
+    Fake monotonic clock moved forward manually.
+    """
+
+    def __init__(self):
+        self.current_time = 0.0
+
+    def __call__(self) -> float:
+        return self.current_time
+
+
+class TestLocalCache:
+    """
+    Unit tests for LocalCache class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(self):
+        self.timer = FakeTimer()
+        self.local_cache = LocalCache(max_size=2, retention_time_seconds=10, timer=self.timer)
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "expire",
+            "elapsed_seconds",
+            "expected_result",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                5,
+                2,
+                (3, b"value"),
+                "Testing getting an entry before its retention time has passed",
+                id="-test-1",
+            ),
+            pytest.param(
+                5,
+                5,
+                (0, None),
+                "Testing getting an entry after its retention time has passed",
+                id="-test-2",
+            ),
+            pytest.param(
+                60,
+                9,
+                (1, b"value"),
+                "Testing getting an entry with retention time capped by the cache",
+                id="-test-3",
+            ),
+            pytest.param(
+                None,
+                10,
+                (0, None),
+                "Testing getting an entry without expiration after the retention time of the cache",
+                id="-test-4",
+            ),
+        ],
+    )
+    def test_get_with_ttl(
+        self,
+        expire: int | None,
+        elapsed_seconds: float,
+        expected_result: tuple[int, bytes | None],
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        self.local_cache.set("cache:local:key", b"value", expire=expire)
+        self.timer.current_time += elapsed_seconds
+
+        assert self.local_cache.get_with_ttl("cache:local:key") == expected_result, "The entry is not as expected"
+
+    def test_eviction_of_least_recently_used_entry(self):
+        logger.info("Testing eviction of the least recently used entry beyond the max size")
+
+        self.local_cache.set("cache:local:first", b"first")
+        self.local_cache.set("cache:local:second", b"second")
+        self.local_cache.get_with_ttl("cache:local:first")
+        self.local_cache.set("cache:local:third", b"third")
+
+        assert len(self.local_cache) == 2, "The size of the cache exceeds the max size"
+        assert self.local_cache.get_with_ttl("cache:local:second") == (0, None), "The evicted entry is still cached"
+        assert self.local_cache.get_with_ttl("cache:local:first")[1] == b"first", "The recently used entry is evicted"
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "namespace",
+            "key",
+            "expected_keys",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                "cache:local",
+                None,
+                ["cache::other"],
+                "Testing dropping entries of a namespace",
+                id="-test-1",
+            ),
+            pytest.param(
+                None,
+                "cache::other",
+                ["cache:local:key"],
+                "Testing dropping an entry by its key",
+                id="-test-2",
+            ),
+            pytest.param(
+                None,
+                None,
+                [],
+                "Testing dropping all entries",
+                id="-test-3",
+            ),
+        ],
+    )
+    def test_clear(
+        self,
+        namespace: str | None,
+        key: str | None,
+        expected_keys: list[str],
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        self.local_cache.set("cache:local:key", b"value")
+        self.local_cache.set("cache::other", b"value")
+        self.local_cache.clear(namespace=namespace, key=key)
+
+        remaining_keys = [
+            key for key in ("cache:local:key", "cache::other") if self.local_cache.get_with_ttl(key)[1] is not None
+        ]
+
+        assert remaining_keys == expected_keys, "The remaining entries are not as expected"
@@ -0,0 +1,134 @@
+from typing import Any
+
+from fastapi import FastAPI, Query
+from loguru import logger
+
+import asyncio
+import pytest
+
+from app.utils.redis.redis_controller import RedisController
+
+
+class FakeHotKeyRecorder:
+    """
+    Fake recorder of hot query parameters.
+    """
+
+    def __init__(self):
+        self.recorded_signatures: list[tuple[str, str]] = []
+
+    async def record(self, handler_name: str, signature: str) -> None:
+        self.recorded_signatures.append((handler_name, signature))
+
+
+class TestRedisController:
+    """
+    Unit tests for cache warm-up of RedisController class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def init(self):
+        self.requested_params: list[dict[str, Any]] = []
+        self.number_of_running_requests = 0
+        self.max_number_of_running_requests = 0
+
+        app = FastAPI()
+
+        @app.get("/hotels")
+        async def get_hotels(location: str = None, services: list[int] = Query(default=None)) -> None:
+            self.number_of_running_requests += 1
+            self.max_number_of_running_requests = max(
+                self.max_number_of_running_requests,
+                self.number_of_running_requests,
+            )
+            await asyncio.sleep(0.01)
+            self.number_of_running_requests -= 1
+
+            self.requested_params.append({"location": location, "services": services})
+
+        async def get_not_request_handler() -> None: ...
+
+        self.redis_controller = RedisController()
+        self.redis_controller.registering_app_to_controller(app=app)
+        self.redis_controller.warming_up_funcs.extend([get_hotels, get_not_request_handler])
+        self.redis_controller.hot_key_recorder = FakeHotKeyRecorder()
+        self.get_hotels = get_hotels
+
+    @pytest.mark.asyncio
+    async def test_warm_up_cache(self):
+        logger.info("Testing in-process warm-up of handlers with hot combinations of parameters")
+
+        hot_params = {
+            "get_hotels": [
+                {"location": "Moscow"},
+                {"location": "Kazan"},
+                {"services": [1, 2]},
+            ],
+        }
+        warm_up_status = await self.redis_controller.warm_up_cache(hot_params=hot_params, concurrency=2)
+
+        expected_params = [
+            {"location": None, "services": None},
+            {"location": "Moscow", "services": None},
+            {"location": "Kazan", "services": None},
+            {"location": None, "services": [1, 2]},
+        ]
+
+        assert warm_up_status is True, "Cache is not warmed up"
+        assert sorted(self.requested_params, key=str) == sorted(
+            expected_params, key=str
+        ), "Requests are not as expected"
+        assert self.max_number_of_running_requests == 2, "Concurrency of warm-up is not bounded"
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "is_warming_up_endpoint",
+            "sample_rate",
+            "expected_result",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                True,
+                1,
+                [("get_hotels", '{"location":"Moscow"}')],
+                "Testing recording parameters of a handler with warm-up",
+                id="-test-1",
+            ),
+            pytest.param(
+                False,
+                1,
+                [],
+                "Testing skipping parameters of a handler without warm-up",
+                id="-test-2",
+            ),
+            pytest.param(
+                True,
+                0.000001,
+                [],
+                "Testing skipping parameters of a request out of the sample",
+                id="-test-3",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_record_hot_params(
+        self,
+        is_warming_up_endpoint: bool,
+        sample_rate: float,
+        expected_result: list[tuple[str, str]],
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        async def get_rooms() -> None: ...
+
+        await self.redis_controller.record_hot_params(
+            endpoint=self.get_hotels if is_warming_up_endpoint else get_rooms,
+            query_params=[("location", "Moscow")],
+            sample_rate=sample_rate,
+        )
+
+        assert (
+            self.redis_controller.hot_key_recorder.recorded_signatures == expected_result
+        ), "Recorded signatures are not as expected"
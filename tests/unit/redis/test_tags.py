@@ -0,0 +1,146 @@
+from typing import Any, Callable, Iterable
+
+from loguru import logger
+
+import pytest
+
+from app.adapters.secondary.db.dao.base.dao import BaseDAO
+
+from app.core.interfaces.cache_invalidator import ICacheInvalidator
+
+from app.utils.redis.deroctor_manager import RedisDeroctorManager
+from app.utils.redis.entry_context import CacheEntryContext, current_cache_entry
+from app.utils.redis.tags import get_tags_of_item
+
+
+class TestTags:
+    """
+    Unit tests for tagging of cache entries.
+    """
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "table_name",
+            "item_id",
+            "expected_result",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                "rooms",
+                None,
+                ("rooms",),
+                "Testing getting tags of a table",
+                id="-test-1",
+            ),
+            pytest.param(
+                "rooms",
+                7,
+                ("rooms", "rooms:7"),
+                "Testing getting tags of a table item",
+                id="-test-2",
+            ),
+        ],
+    )
+    def test_get_tags_of_item(
+        self,
+        table_name: str,
+        item_id: Any,
+        expected_result: tuple[str, ...],
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        assert get_tags_of_item(table_name=table_name, item_id=item_id) == expected_result, "Tags are not as expected"
+
+    @pytest.mark.parametrize(
+        argnames=(
+            "tags",
+            "expected_result",
+            "test_description",
+        ),
+        argvalues=[
+            pytest.param(
+                ("hotels", "rooms"),
+                ("hotels", "rooms"),
+                "Testing tagging with static tags",
+                id="-test-1",
+            ),
+            pytest.param(
+                lambda entity_name, **kwargs: (f"{entity_name}:1",),
+                ("hotels:1",),
+                "Testing tagging with tags built from function arguments",
+                id="-test-2",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_with_entry_context(
+        self,
+        tags: Iterable[str] | Callable[..., Iterable[str]],
+        expected_result: tuple[str, ...],
+        test_description: str,
+    ):
+        logger.info(test_description)
+
+        finished_entry_contexts: list[CacheEntryContext] = []
+
+        async def finish_computation(entry_context: CacheEntryContext) -> None:
+            finished_entry_contexts.append(entry_context)
+
+        def cache(func: Callable):
+            async def inner(*args, **kwargs):
+                return current_cache_entry.get().tags
+
+            return inner
+
+        async def get_entity(entity_name: str) -> None: ...
+
+        tagged_get_entity = RedisDeroctorManager.with_entry_context(
+            tags=tags,
+            stale_while_revalidate_seconds=0,
+            finish_computation=finish_computation,
+            wrapper=cache,
+        )(get_entity)
+
+        assert await tagged_get_entity(entity_name="hotels") == expected_result, "Tags of entry are not as expected"
+        assert current_cache_entry.get() is None, "Context of entry is not reset after the call"
+        assert len(finished_entry_contexts) == 1, "Computation of entry is not finished after the call"
+
+    @pytest.mark.asyncio
+    async def test_invalidation_by_dao_after_commit(self):
+        logger.info("Testing invalidation of cached responses by the cache invalidator of DAO after commit")
+
+        invalidated_items: list[tuple[str, Any]] = []
+
+        class FakeCacheInvalidator(ICacheInvalidator):
+            async def invalidate_cache_of_item(self, table_name: str, item_id: Any = None) -> None:
+                invalidated_items.append((table_name, item_id))
+
+        class FakeTransactionContext:
+            def __init__(self):
+                self.after_commit_callbacks: list[Callable[[], Any]] = []
+
+            def add_after_commit_callback(self, callback: Callable[[], Any]) -> None:
+                self.after_commit_callbacks.append(callback)
+
+        transaction_context = FakeTransactionContext()
+        BaseDAO()._invalidate_cache_after_commit(
+            transaction_context=transaction_context,
+            table_name="rooms",
+            item={"id": 7},
+        )
+        callbacks_without_invalidator = list(transaction_context.after_commit_callbacks)
+
+        BaseDAO(cache_invalidator=FakeCacheInvalidator())._invalidate_cache_after_commit(
+            transaction_context=transaction_context,
+            table_name="rooms",
+            item={"id": 7},
+        )
+        invalidated_items_before_commit = list(invalidated_items)
+        for callback in transaction_context.after_commit_callbacks:
+            await callback()
+
+        assert callbacks_without_invalidator == [], "Cache is invalidated by DAO without cache invalidator"
+        assert invalidated_items_before_commit == [], "Cache is invalidated before the commit"
+        assert invalidated_items == [("rooms", 7)], "Invalidated item is not as expected"